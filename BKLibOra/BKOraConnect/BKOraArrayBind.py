@@ -0,0 +1,119 @@
+"""
+Módulo BKOraArrayBind
+---------------------
+
+Este módulo permite enlazar una lista de valores como un único bind de tipo colección de Oracle
+(``SYS.ODCINUMBERLIST``, ``SYS.ODCIVARCHAR2LIST``…), usado por `BKOraQueryBuilder` con
+``in_strategy="array"`` para escribir ``col IN (SELECT COLUMN_VALUE FROM TABLE(:bind))``.
+
+El builder no tiene conexión, así que deja en los parámetros un `BKOraArrayBind`; el listener
+``before_cursor_execute`` `bind_array_params`, registrado por `BKOraConnect` y `AsyncBKOraConnect`,
+lo convierte en el objeto colección del driver justo antes de ejecutar. Los tipos se resuelven
+una vez por conexión física.
+
+Clases:
+    BKOraArrayBind
+
+Funciones:
+    array_type_for(values)
+    bind_array_params(conn, cursor, statement, parameters, context, executemany)
+"""
+
+from BKLibOra.config import ARRAY_BIND_TYPES
+from datetime import date
+from decimal import Decimal
+
+
+def array_type_for(values, types=None) -> str:
+    """
+    Elige el tipo colección de Oracle adecuado para una lista de valores.
+
+    Args:
+        values (Iterable): Valores de la lista (los ``None`` se ignoran).
+        types (dict, optional): Tipos por categoría (``number``, ``string``, ``date``).
+            Por defecto ``ARRAY_BIND_TYPES``.
+
+    Returns:
+        str: Nombre del tipo colección.
+    """
+    types = types or ARRAY_BIND_TYPES
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float, Decimal, date)):
+            kinds.add("string")
+        elif isinstance(value, date):
+            kinds.add("date")
+        else:
+            kinds.add("number")
+    if len(kinds) == 1:
+        return types[kinds.pop()]
+    return types["string"]
+
+
+class BKOraArrayBind:
+    """
+    Valor de bind que representa una lista enlazada como colección de Oracle.
+
+    Args:
+        values (Iterable): Valores de la colección.
+        type_name (str, optional): Tipo colección (p. ej. ``"SYS.ODCINUMBERLIST"``). Si no se
+            indica se deduce de los valores con `array_type_for`.
+    """
+
+    __slots__ = ("values", "type_name")
+
+    def __init__(self, values, type_name=None):
+        self.values = list(values)
+        self.type_name = type_name or array_type_for(self.values)
+
+    def to_db_object(self, db_type):
+        """
+        Crea el objeto colección del driver.
+
+        Args:
+            db_type (DbObjectType): Tipo obtenido con ``connection.gettype(type_name)``.
+
+        Returns:
+            DbObject: Colección con los valores.
+        """
+        return db_type.newobject(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __eq__(self, other):
+        if not isinstance(other, BKOraArrayBind):
+            return NotImplemented
+        return self.values == other.values and self.type_name == other.type_name
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.type_name}, {len(self.values)} valores)"
+
+
+def _gettype(dbapi_connection, type_name):
+    """Obtiene el tipo colección, también a través del adaptador asyncio de SQLAlchemy."""
+    driver_connection = getattr(dbapi_connection, "_connection", None)
+    if driver_connection is not None and hasattr(dbapi_connection, "await_"):
+        return dbapi_connection.await_(driver_connection.gettype(type_name))
+    return dbapi_connection.gettype(type_name)
+
+
+def bind_array_params(conn, cursor, statement, parameters, context, executemany):
+    """
+    Listener ``before_cursor_execute`` que sustituye los `BKOraArrayBind` por colecciones del driver.
+
+    Los tipos (``connection.gettype``) se guardan en ``conn.info``, que vive con la conexión física,
+    de modo que cada tipo cuesta un único round-trip por conexión.
+    """
+    if executemany or not isinstance(parameters, dict):
+        return
+    for name, value in parameters.items():
+        if not isinstance(value, BKOraArrayBind):
+            continue
+        db_types = conn.info.setdefault("bk_array_types", {})
+        db_type = db_types.get(value.type_name)
+        if db_type is None:
+            db_type = db_types[value.type_name] = _gettype(conn.connection.dbapi_connection, value.type_name)
+        parameters[name] = value.to_db_object(db_type)
@@ -0,0 +1,162 @@
+"""
+Módulo BKOraAsyncConnect
+------------------------
+
+Este módulo proporciona la clase `AsyncBKOraConnect`, la variante asíncrona de `BKOraConnect` para servicios asyncio.
+
+Usa `sqlalchemy.ext.asyncio.create_async_engine` con el driver asíncrono de `oracledb` (modo thin), de modo que
+varias consultas pueden ejecutarse concurrentemente sobre un mismo event loop sin saltar a un pool de hilos.
+
+Clases:
+    AsyncBKOraConnect
+
+Dependencias:
+    - sqlalchemy[asyncio]
+    - oracledb (modo thin)
+"""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
+import time
+
+from BKLibOra.config import config_conn_lib as conn
+from BKLibOra.BKOraConnect.BKOraConnect import _apply_cursor_options, fetch_execution_options
+from BKLibOra.BKOraConnect.BKOraArrayBind import bind_array_params
+from BKLibOra.BKOraConnect.BKOraPool import BKOraPoolConfig, BKOraPoolStats
+
+
+class AsyncBKOraConnect:
+    """
+    Clase de conexión asíncrona para bases de datos Oracle utilizando SQLAlchemy asyncio.
+
+    Soporta conexión usando Service Name, SID o TNS Alias con el driver `oracledb` en modo thin
+    (el único que ofrece API asíncrona).
+
+    Args:
+        user (str): Usuario de la base de datos.
+        password (str): Contraseña del usuario.
+        host (str, optional): Dirección del host de la base de datos. Por defecto, `config_conn_lib["default_host"]`.
+        port (int, optional): Puerto del servicio Oracle. Por defecto, `config_conn_lib["default_port"]`.
+        service_name (str, optional): Nombre del servicio Oracle (SERVICE_NAME).
+        sid (str, optional): Identificador del sistema Oracle (SID).
+        tns_alias (str, optional): Alias TNS definido en `tnsnames.ora`.
+        pool_config (BKOraPoolConfig, optional): Configuración del pool. Si `native` es `True` se usa
+            `oracledb.create_pool_async` en lugar del pool de SQLAlchemy.
+        arraysize (int, optional): Filas por round-trip de todas las lecturas (ver `BKOraConnect`).
+        prefetchrows (int, optional): Filas que el driver recibe con el propio execute (ver `BKOraConnect`).
+
+    Raises:
+        ValueError: Si no se proporciona ninguno de los parámetros `service_name`, `sid` o `tns_alias`.
+
+    Atributos:
+        engine (sqlalchemy.ext.asyncio.AsyncEngine): Motor asíncrono de SQLAlchemy.
+        Session (sqlalchemy.ext.asyncio.async_sessionmaker): Fábrica de sesiones asíncronas.
+        pool_config (BKOraPoolConfig): Configuración del pool en uso.
+        pool_stats (BKOraPoolStats): Estadísticas acumuladas del pool.
+        native_pool (oracledb.AsyncConnectionPool | None): Pool nativo, si se usa.
+    """
+
+    def __init__(self, user, password, host=conn.get("default_host"), port=conn.get("default_port"),
+                 service_name=None, sid=None, tns_alias=None, pool_config=None, arraysize=None,
+                 prefetchrows=None):
+        import oracledb
+
+        self.pool_config = pool_config or BKOraPoolConfig()
+        self.pool_stats = BKOraPoolStats()
+        self.native_pool = None
+        dialect = conn.get("oracledb_async")
+
+        if tns_alias:
+            dsn = tns_alias
+        elif service_name:
+            dsn = oracledb.makedsn(host, port, service_name=service_name)
+        elif sid:
+            dsn = oracledb.makedsn(host, port, sid=sid)
+        else:
+            raise ValueError("Debes proporcionar al menos service_name, sid o tns_alias")
+
+        if self.pool_config.native:
+            cfg = self.pool_config
+            self.native_pool = oracledb.create_pool_async(user=user, password=password, dsn=dsn,
+                                                          min=cfg.native_min, max=cfg.native_max,
+                                                          increment=cfg.native_increment,
+                                                          getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                                                          wait_timeout=int(cfg.pool_timeout * 1000),
+                                                          ping_interval=cfg.native_ping_interval)
+            self.engine = create_async_engine(f"{dialect}://", async_creator=self._acquire_native, poolclass=NullPool)
+        else:
+            connection_url = f"{dialect}://{user}:{password}@{dsn}"
+            self.engine = create_async_engine(connection_url, **self.pool_config.engine_kwargs())
+
+        sync_engine = self.engine.sync_engine
+        event.listen(sync_engine, "checkout", self.pool_stats.on_checkout)
+        event.listen(sync_engine, "checkin", self.pool_stats.on_checkin)
+        event.listen(sync_engine, "connect", self.pool_stats.on_connect)
+        event.listen(sync_engine, "before_cursor_execute", _apply_cursor_options)
+        event.listen(sync_engine, "before_cursor_execute", bind_array_params)
+        sync_engine.update_execution_options(**fetch_execution_options(arraysize, prefetchrows))
+        self.Session = async_sessionmaker(bind=self.engine, expire_on_commit=False)
+
+    async def _acquire_native(self):
+        """Obtiene una conexión del pool nativo asíncrono registrando el tiempo de espera."""
+        time_wait_init = time.perf_counter()
+        try:
+            connection = await self.native_pool.acquire()
+        except Exception:
+            self.pool_stats.record_wait(time.perf_counter() - time_wait_init, timed_out=True)
+            raise
+        self.pool_stats.record_wait(time.perf_counter() - time_wait_init)
+        return connection
+
+    def get_session(self):
+        """
+        Crea una nueva sesión asíncrona enlazada al motor de conexión.
+
+        Returns:
+            sqlalchemy.ext.asyncio.AsyncSession: Sesión asíncrona.
+        """
+        return self.Session()
+
+    def get_pool_stats(self):
+        """
+        Devuelve las estadísticas del pool de conexiones (ver `BKOraConnect.get_pool_stats`).
+
+        Returns:
+            dict: Estadísticas del pool.
+        """
+        stats = self.pool_stats.snapshot()
+        if self.native_pool is not None:
+            stats.update({
+                "mode": "native",
+                "opened": self.native_pool.opened,
+                "busy": self.native_pool.busy,
+                "min": self.native_pool.min,
+                "max": self.native_pool.max,
+            })
+        else:
+            pool = self.engine.sync_engine.pool
+            stats.update({
+                "mode": "sqlalchemy",
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            })
+        return stats
+
+    async def dispose(self):
+        """
+        Libera los recursos del motor asíncrono cerrando el pool de conexiones.
+        """
+        await self.engine.dispose()
+        if self.native_pool is not None:
+            await self.native_pool.close()
+            self.native_pool = None
+
+
+# # Uso desde asyncio
+# conn = AsyncBKOraConnect(user="scott", password="tiger", host="localhost", service_name="orcl")
+# manager = AsyncBKOraManager(conn)
+# rows_a, rows_b = await asyncio.gather(manager.fetch_all(sql_a), manager.fetch_all(sql_b))
+# await conn.dispose()
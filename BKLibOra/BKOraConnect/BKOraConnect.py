@@ -16,11 +16,46 @@ Dependencias:
     - oracledb (opcional, si se usa el modo thick)
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 import cx_Oracle
+import time
 
 from BKLibOra.config import config_conn_lib as conn, roles_base as rol
+from BKLibOra.BKOraConnect.BKOraPool import BKOraPoolConfig, BKOraPoolStats, BKOraQueuePool
+from BKLibOra.BKOraConnect.BKOraArrayBind import bind_array_params
+
+
+def _apply_cursor_options(conn, cursor, statement, parameters, context, executemany):
+    """
+    Listener ``before_cursor_execute`` que traslada al cursor del driver las opciones
+    de ejecución propias de la librería.
+
+    Permite fijar ``arraysize`` y ``prefetchrows`` por consulta mediante
+    ``execution_options={"arraysize": n, "prefetchrows": m}`` sin tocar la configuración global
+    del motor. Las opciones del motor (``BKOraConnect(arraysize=..., prefetchrows=...)``) se
+    aplican a todas las consultas que no las sobrescriban.
+    """
+    if context is None:
+        return
+    options = context.execution_options
+    arraysize = options.get("arraysize")
+    if arraysize:
+        cursor.arraysize = arraysize
+    prefetchrows = options.get("prefetchrows")
+    if prefetchrows is not None and hasattr(cursor, "prefetchrows"):
+        cursor.prefetchrows = prefetchrows
+
+
+def fetch_execution_options(arraysize=None, prefetchrows=None) -> dict:
+    """Opciones de ejecución del motor con los valores de ``arraysize``/``prefetchrows`` indicados."""
+    options = {}
+    if arraysize is not None:
+        options["arraysize"] = arraysize
+    if prefetchrows is not None:
+        options["prefetchrows"] = prefetchrows
+    return options
 
 
 class BKOraConnect:
@@ -38,18 +73,32 @@ class BKOraConnect:
         sid (str, optional): Identificador del sistema Oracle (SID).
         tns_alias (str, optional): Alias TNS definido en `tnsnames.ora`.
         use_thick (bool, optional): Si es `True`, se inicializa el cliente Oracle en modo "thick" (requiere Oracle Instant Client).
+        pool_config (BKOraPoolConfig, optional): Configuración del pool de conexiones. Si `native` es `True`
+            se usa el pool nativo del driver en lugar del pool de SQLAlchemy.
+        arraysize (int, optional): Filas por round-trip de todas las lecturas (por defecto, la del driver).
+            Los managers pueden sobrescribirlo por manager o por llamada.
+        prefetchrows (int, optional): Filas que el driver recibe con el propio execute (por defecto,
+            las del driver).
 
     Raises:
-        ValueError: Si no se proporciona ninguno de los parámetros `service_name`, `sid` o `tns_alias`.
+        ValueError: Si no se proporciona ninguno de los parámetros `service_name`, `sid` o `tns_alias`,
+            o si se pide el pool nativo con un `role_mode` privilegiado.
 
     Atributos:
         engine (sqlalchemy.Engine): Motor de conexión SQLAlchemy.
         Session (sqlalchemy.orm.session.sessionmaker): Fábrica de sesiones SQLAlchemy.
+        pool_config (BKOraPoolConfig): Configuración del pool en uso.
+        pool_stats (BKOraPoolStats): Estadísticas acumuladas del pool.
+        native_pool (oracledb.ConnectionPool | cx_Oracle.SessionPool | None): Pool nativo, si se usa.
     """
 
     def __init__(self, user, password, host=conn.get("default_host"), port=conn.get("default_port"),
-                 service_name=None, sid=None, tns_alias=None, use_thick=False, role_mode="DEFAULT"):
+                 service_name=None, sid=None, tns_alias=None, use_thick=False, role_mode="DEFAULT",
+                 pool_config=None, arraysize=None, prefetchrows=None):
         connection_args = {}
+        self.pool_config = pool_config or BKOraPoolConfig()
+        self.pool_stats = BKOraPoolStats()
+        self.native_pool = None
         
         if use_thick:
             import oracledb
@@ -66,14 +115,62 @@ class BKOraConnect:
             dsn = cx_Oracle.makedsn(host, port, sid=sid)
         else:
             raise ValueError("Debes proporcionar al menos service_name, sid o tns_alias")
-        
-        if role_mode is not None:
-            connection_args["mode"] = rol.get(role_mode)
 
-        connection_url = f"{dialect}://{user}:{password}@{dsn}"
-        self.engine = create_engine(connection_url, connect_args=connection_args, pool_pre_ping=True)
+        if self.pool_config.native:
+            if role_mode not in (None, "DEFAULT"):
+                raise ValueError("El pool nativo del driver no admite role_mode distinto de DEFAULT")
+            self.native_pool = self._create_native_pool(dialect, user, password, dsn)
+            self.engine = create_engine(f"{dialect}://", creator=self._acquire_native, poolclass=NullPool)
+        else:
+            if role_mode is not None:
+                connection_args["mode"] = rol.get(role_mode)
+
+            connection_url = f"{dialect}://{user}:{password}@{dsn}"
+            self.engine = create_engine(connection_url, connect_args=connection_args,
+                                        poolclass=BKOraQueuePool, **self.pool_config.engine_kwargs())
+            self.engine.pool._bk_stats = self.pool_stats
+
+        event.listen(self.engine, "checkout", self.pool_stats.on_checkout)
+        event.listen(self.engine, "checkin", self.pool_stats.on_checkin)
+        event.listen(self.engine, "connect", self.pool_stats.on_connect)
+        event.listen(self.engine, "before_cursor_execute", _apply_cursor_options)
+        event.listen(self.engine, "before_cursor_execute", bind_array_params)
+        self.engine.update_execution_options(**fetch_execution_options(arraysize, prefetchrows))
         self.Session = sessionmaker(bind=self.engine)
 
+    def _create_native_pool(self, dialect, user, password, dsn):
+        """
+        Crea el pool nativo del driver (`oracledb.create_pool` o `cx_Oracle.SessionPool`).
+
+        Returns:
+            oracledb.ConnectionPool | cx_Oracle.SessionPool: Pool nativo creado.
+        """
+        cfg = self.pool_config
+        if dialect == conn.get("oracledb"):
+            import oracledb
+            return oracledb.create_pool(user=user, password=password, dsn=dsn,
+                                        min=cfg.native_min, max=cfg.native_max,
+                                        increment=cfg.native_increment,
+                                        getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+                                        wait_timeout=int(cfg.pool_timeout * 1000),
+                                        ping_interval=cfg.native_ping_interval)
+        return cx_Oracle.SessionPool(user=user, password=password, dsn=dsn,
+                                     min=cfg.native_min, max=cfg.native_max,
+                                     increment=cfg.native_increment, threaded=True,
+                                     getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,
+                                     wait_timeout=int(cfg.pool_timeout * 1000))
+
+    def _acquire_native(self):
+        """Obtiene una conexión del pool nativo registrando el tiempo de espera."""
+        time_wait_init = time.perf_counter()
+        try:
+            connection = self.native_pool.acquire()
+        except Exception:
+            self.pool_stats.record_wait(time.perf_counter() - time_wait_init, timed_out=True)
+            raise
+        self.pool_stats.record_wait(time.perf_counter() - time_wait_init)
+        return connection
+
     def get_session(self):
         """
         Crea una nueva sesión SQLAlchemy enlazada al motor de conexión.
@@ -83,11 +180,46 @@ class BKOraConnect:
         """
         return self.Session()
 
+    def get_pool_stats(self):
+        """
+        Devuelve las estadísticas del pool de conexiones.
+
+        Incluye los contadores acumulados por `BKOraPoolStats` (checkouts, timeouts,
+        tiempos de espera) y el estado instantáneo del pool: ``checked_out``, ``overflow``,
+        ``checked_in`` y ``size`` en modo SQLAlchemy, u ``opened``, ``busy``, ``min`` y ``max``
+        en modo nativo.
+
+        Returns:
+            dict: Estadísticas del pool.
+        """
+        stats = self.pool_stats.snapshot()
+        if self.native_pool is not None:
+            stats.update({
+                "mode": "native",
+                "opened": self.native_pool.opened,
+                "busy": self.native_pool.busy,
+                "min": self.native_pool.min,
+                "max": self.native_pool.max,
+            })
+        else:
+            pool = self.engine.pool
+            stats.update({
+                "mode": "sqlalchemy",
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+            })
+        return stats
+
     def dispose(self):
         """
         Libera los recursos del motor de SQLAlchemy cerrando el pool de conexiones.
         """
         self.engine.dispose()
+        if self.native_pool is not None:
+            self.native_pool.close()
+            self.native_pool = None
 
         
 # # Usando service_name
@@ -101,3 +233,15 @@ class BKOraConnect:
 # 
 # # Usando oracledb en modo thick
 # conn = BKOraConnect(user="scott", password="tiger", host="localhost", service_name="orcl", use_thick=True)
+#
+# # Pool de SQLAlchemy dimensionado y sin pre-ping
+# conn = BKOraConnect(user="scott", password="tiger", service_name="orcl",
+#                     pool_config=BKOraPoolConfig(pool_size=20, max_overflow=5, pool_pre_ping=False))
+#
+# # Lecturas de 500 filas por round-trip
+# conn = BKOraConnect(user="scott", password="tiger", service_name="orcl", arraysize=500)
+#
+# # Pool nativo del driver
+# conn = BKOraConnect(user="scott", password="tiger", service_name="orcl",
+#                     pool_config=BKOraPoolConfig(native=True, native_min=2, native_max=20))
+# print(conn.get_pool_stats())
@@ -0,0 +1,218 @@
+"""
+Módulo BKOraPool
+----------------
+
+Este módulo agrupa la configuración y la instrumentación del pool de conexiones usado por `BKOraConnect`.
+
+Permite ajustar el pool de SQLAlchemy (`pool_size`, `max_overflow`, `pool_timeout`, `pool_recycle`,
+`pool_pre_ping`) o delegar el pooling en el pool nativo del driver (`oracledb.create_pool` /
+`cx_Oracle.SessionPool`), y recoge estadísticas de uso (checkouts, overflow, tiempos de espera)
+para dimensionar los pools con datos reales.
+
+Clases:
+    BKOraPoolConfig
+    BKOraPoolStats
+    BKOraQueuePool
+
+Dependencias:
+    - sqlalchemy
+    - threading
+"""
+
+from BKLibOra.config import POOL_VALUES
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+import threading
+import time
+
+
+class BKOraPoolConfig:
+    """
+    Configuración del pool de conexiones de `BKOraConnect`.
+
+    Los valores por defecto se leen de `BKLibOra.config.POOL_VALUES`.
+
+    Args:
+        pool_size (int, optional): Conexiones persistentes del pool de SQLAlchemy.
+        max_overflow (int, optional): Conexiones adicionales permitidas sobre ``pool_size``.
+        pool_timeout (float, optional): Segundos de espera máxima por una conexión libre.
+        pool_recycle (int, optional): Segundos tras los que se recicla una conexión (-1 = nunca).
+        pool_pre_ping (bool, optional): Si es `True`, se valida la conexión en cada checkout.
+        native (bool, optional): Si es `True`, se usa el pool nativo del driver y SQLAlchemy
+            trabaja con `NullPool` sobre él.
+        native_min (int, optional): Conexiones mínimas del pool nativo.
+        native_max (int, optional): Conexiones máximas del pool nativo.
+        native_increment (int, optional): Conexiones que abre el pool nativo al crecer.
+        native_ping_interval (int, optional): Segundos entre pings internos del pool nativo
+            (solo `oracledb`); sustituye al ``pool_pre_ping`` de SQLAlchemy.
+    """
+
+    def __init__(self
+                 , pool_size: int = POOL_VALUES.get("pool_size")
+                 , max_overflow: int = POOL_VALUES.get("max_overflow")
+                 , pool_timeout: float = POOL_VALUES.get("pool_timeout")
+                 , pool_recycle: int = POOL_VALUES.get("pool_recycle")
+                 , pool_pre_ping: bool = POOL_VALUES.get("pool_pre_ping")
+                 , native: bool = False
+                 , native_min: int = POOL_VALUES.get("native_min")
+                 , native_max: int = POOL_VALUES.get("native_max")
+                 , native_increment: int = POOL_VALUES.get("native_increment")
+                 , native_ping_interval: int = POOL_VALUES.get("native_ping_interval")):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.native = native
+        self.native_min = native_min
+        self.native_max = native_max
+        self.native_increment = native_increment
+        self.native_ping_interval = native_ping_interval
+
+    def engine_kwargs(self) -> dict:
+        """
+        Devuelve los argumentos de pool para `sqlalchemy.create_engine` (modo no nativo).
+
+        Returns:
+            dict: Argumentos ``pool_size``, ``max_overflow``, ``pool_timeout``,
+            ``pool_recycle`` y ``pool_pre_ping``.
+        """
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
+
+class BKOraPoolStats:
+    """
+    Acumulador thread-safe de estadísticas del pool de conexiones.
+
+    Registra checkouts, checkins, conexiones físicas abiertas, timeouts y el tiempo
+    de espera para obtener una conexión (total, máximo y el último de cada hilo).
+
+    Métodos:
+        record_wait(seconds, timed_out=False): Registra una espera por conexión.
+        last_wait(): Devuelve la última espera registrada en el hilo actual.
+        pop_last_wait(): Devuelve y borra la última espera registrada en el hilo actual.
+        snapshot(): Devuelve las estadísticas acumuladas como diccionario.
+        reset(): Pone a cero los contadores.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """Pone a cero todos los contadores."""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.timeouts = 0
+            self.waits = 0
+            self.wait_time_total = 0.0
+            self.wait_time_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        """
+        Registra el tiempo empleado en obtener una conexión del pool.
+
+        Args:
+            seconds (float): Segundos de espera.
+            timed_out (bool, optional): Si la espera terminó por timeout.
+        """
+        self._local.last_wait = seconds
+        with self._lock:
+            self.waits += 1
+            self.wait_time_total += seconds
+            if seconds > self.wait_time_max:
+                self.wait_time_max = seconds
+            if timed_out:
+                self.timeouts += 1
+
+    def last_wait(self) -> float:
+        """
+        Devuelve la última espera por conexión registrada en el hilo actual.
+
+        Returns:
+            float: Segundos de espera (0.0 si no hay registro).
+        """
+        return getattr(self._local, "last_wait", 0.0)
+
+    def pop_last_wait(self) -> float:
+        """
+        Devuelve y borra la última espera registrada en el hilo actual.
+
+        Permite saber si una operación concreta ha esperado por una conexión: se llama
+        antes (para descartar esperas anteriores) y después de la operación.
+
+        Returns:
+            float: Segundos de espera (0.0 si no ha habido checkout desde la última llamada).
+        """
+        return self._local.__dict__.pop("last_wait", 0.0)
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        """Listener del evento ``checkout`` del pool."""
+        with self._lock:
+            self.checkouts += 1
+
+    def on_checkin(self, dbapi_connection, connection_record):
+        """Listener del evento ``checkin`` del pool."""
+        with self._lock:
+            self.checkins += 1
+
+    def on_connect(self, dbapi_connection, connection_record):
+        """Listener del evento ``connect`` del pool (nueva conexión física)."""
+        with self._lock:
+            self.connects += 1
+
+    def snapshot(self) -> dict:
+        """
+        Devuelve las estadísticas acumuladas.
+
+        Returns:
+            dict: Contadores y tiempos de espera (``wait_time_avg`` incluido).
+        """
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "waits": self.waits,
+                "wait_time_total": self.wait_time_total,
+                "wait_time_max": self.wait_time_max,
+                "wait_time_avg": self.wait_time_total / self.waits if self.waits else 0.0,
+            }
+
+
+class BKOraQueuePool(QueuePool):
+    """
+    `QueuePool` de SQLAlchemy que mide el tiempo de espera de cada checkout.
+
+    El acumulador se asigna tras crear el motor (``engine.pool._bk_stats``) y se
+    conserva cuando SQLAlchemy recrea el pool (por ejemplo, tras ``dispose()``).
+    """
+
+    _bk_stats = None
+
+    def _do_get(self):
+        time_wait_init = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            if self._bk_stats is not None:
+                self._bk_stats.record_wait(time.perf_counter() - time_wait_init, timed_out=True)
+            raise
+        if self._bk_stats is not None:
+            self._bk_stats.record_wait(time.perf_counter() - time_wait_init)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool._bk_stats = self._bk_stats
+        return pool
@@ -0,0 +1,383 @@
+"""
+Módulo BKOraCatalog
+-------------------
+
+Este módulo define `BKOraCatalog`, una caché en memoria del diccionario de datos de Oracle construida
+sobre los managers de `BKOraDatabaseInfo`.
+
+Los metadatos (columnas, claves primarias, claves ajenas y secuencias) se leen una sola vez y se indexan
+por propietario, tabla y columna, con listas de adyacencia de las claves ajenas en ambos sentidos, de modo
+que preguntas como «columnas de la PK de X» o «tablas que referencian a Y» se resuelven con una búsqueda
+en diccionario, sin volver a la base de datos.
+
+La actualización es incremental: `refresh()` compara ``ALL_OBJECTS.LAST_DDL_TIME`` con el de la última
+carga y solo vuelve a leer las tablas, vistas y secuencias creadas, modificadas o eliminadas desde entonces.
+
+Clases:
+    BKOraCatalog
+"""
+
+from BKLibOra.config import CATALOG_VALUES
+from BKLibOra.BKOraDatabaseInfo.MgrdbAllObjects.MgrdbAllObjects import MgrdbAllObjects
+from BKLibOra.BKOraDatabaseInfo.MgrdbAllPrimaryKey.MgrdbAllPrimaryKey import MgrdbAllPrimaryKey
+from BKLibOra.BKOraDatabaseInfo.MgrdbAllSequences.MgrdbAllSequences import MgrdbAllSequences
+from BKLibOra.BKOraDatabaseInfo.MgrdbAllTableDependencies.MgrdbAllTableDependencies import MgrdbAllTableDependencies
+from BKLibOra.BKOraDatabaseInfo.MgrdbTableStructure.MgrdbTableStructure import MgrdbTableStructure
+from collections import defaultdict
+import threading
+import time
+
+
+class BKOraCatalog:
+    """
+    Catálogo de metadatos de Oracle indexado en memoria.
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        owners (Iterable[str], optional): Esquemas a cargar. Por defecto, todos los visibles en ``ALL_*``.
+        max_age (float, optional): Segundos entre comprobaciones de `refresh_if_stale`.
+            Por defecto ``CATALOG_VALUES["max_age"]``.
+
+    Métodos:
+        load(): Carga completa del catálogo.
+        refresh(): Actualiza solo los objetos cuyo ``LAST_DDL_TIME`` ha cambiado.
+        refresh_if_stale(max_age): Llama a `refresh` si la última comprobación es más antigua que ``max_age``.
+        tables(owner) / table_columns(table) / column(table, column) / tables_with_column(column):
+            Tablas y columnas.
+        primary_key(table) / foreign_keys(table): Claves de una tabla.
+        referenced_tables(table) / referencing_tables(table): Tablas a las que apunta o que la referencian.
+        sequence(name): Definición de una secuencia.
+
+    Las consultas aceptan el nombre de la tabla con o sin ``owner``; sin él, el nombre debe existir en un
+    único esquema. Los diccionarios devueltos son los del índice y no deben modificarse.
+    """
+
+    def __init__(self, connector, owners=None, max_age=None):
+        self.connector = connector
+        self.owners = tuple(owner.upper() for owner in owners) if owners else None
+        self.max_age = CATALOG_VALUES.get("max_age") if max_age is None else max_age
+        self._lock = threading.RLock()
+        self.loaded_at = None
+        self.checked_at = None
+        self._reset()
+
+    def _reset(self):
+        self._ddl_times = {}
+        self._columns = {}
+        self._column_index = {}
+        self._tables_by_owner = defaultdict(set)
+        self._owners_by_table = defaultdict(set)
+        self._tables_by_column = defaultdict(set)
+        self._primary_keys = {}
+        self._foreign_keys = {}
+        self._references = defaultdict(set)
+        self._referenced_by = defaultdict(set)
+        self._sequences = {}
+        self._owners_by_sequence = defaultdict(set)
+
+    # ------------------------------------------------------------------ #
+    # Carga y actualización
+    # ------------------------------------------------------------------ #
+    def _fetch(self, manager_class, **scope) -> list:
+        """
+        Ejecuta el SELECT de un manager de `BKOraDatabaseInfo` acotado por ``scope``.
+
+        Args:
+            manager_class (type): Manager de `BKOraDatabaseInfo` (acepta ``owner`` y sus propios filtros).
+            scope (dict): Filtros del manager. Sin ``owner`` se usan los esquemas del catálogo.
+
+        Returns:
+            list[dict]: Filas con las claves en minúsculas.
+        """
+        scope.setdefault("owner", self.owners)
+        manager = manager_class(self.connector, **scope)
+        sql, params = manager.get_sql_select()
+        keys, rows = manager.fetch_rows(sql, params)
+        keys = [key.lower() for key in keys]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def load(self) -> dict:
+        """
+        Carga completa del catálogo (descarta lo cargado anteriormente).
+
+        Returns:
+            dict: ``tables``, ``sequences`` y ``seconds`` empleados.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            objects = self._fetch(MgrdbAllObjects)
+            self._reset()
+            self._ddl_times = self._object_times(objects)
+            self._index_columns(self._fetch(MgrdbTableStructure))
+            self._index_primary_keys(self._fetch(MgrdbAllPrimaryKey))
+            self._index_foreign_keys(self._fetch(MgrdbAllTableDependencies))
+            self._index_sequences(self._fetch(MgrdbAllSequences))
+            self.loaded_at = self.checked_at = time.monotonic()
+            return {
+                "tables": len(self._columns),
+                "sequences": len(self._sequences),
+                "seconds": time.perf_counter() - start,
+            }
+
+    def refresh(self) -> dict:
+        """
+        Actualiza el catálogo a partir de ``ALL_OBJECTS.LAST_DDL_TIME``.
+
+        Solo se vuelven a leer las tablas, vistas y secuencias nuevas o con un ``LAST_DDL_TIME``
+        distinto al de la última carga; las eliminadas se quitan de los índices. Si el catálogo
+        no se ha cargado todavía, equivale a `load`.
+
+        Returns:
+            dict: ``changed`` y ``dropped`` (listas de ``(owner, nombre, tipo)``) y ``seconds`` empleados.
+        """
+        with self._lock:
+            if self.loaded_at is None:
+                self.load()
+                return {"changed": [], "dropped": [], "seconds": 0.0}
+
+            start = time.perf_counter()
+            ddl_times = self._object_times(self._fetch(MgrdbAllObjects))
+            changed = [key for key, ddl_time in ddl_times.items() if self._ddl_times.get(key) != ddl_time]
+            dropped = [key for key in self._ddl_times if key not in ddl_times]
+
+            for owner, name, object_type in dropped:
+                if object_type == "SEQUENCE":
+                    self._drop_sequence((owner, name))
+                else:
+                    self._drop_table((owner, name))
+
+            tables = defaultdict(set)
+            sequences = defaultdict(set)
+            for owner, name, object_type in changed:
+                if object_type == "SEQUENCE":
+                    self._drop_sequence((owner, name))
+                    sequences[owner].add(name)
+                else:
+                    self._drop_table((owner, name))
+                    tables[owner].add(name)
+
+            for owner, names in tables.items():
+                names = sorted(names)
+                self._index_columns(self._fetch(MgrdbTableStructure, owner=owner, table_name=names))
+                self._index_primary_keys(self._fetch(MgrdbAllPrimaryKey, owner=owner, table_name=names))
+                self._index_foreign_keys(self._fetch(MgrdbAllTableDependencies, owner=owner, table_name=names))
+            for owner, names in sequences.items():
+                self._index_sequences(self._fetch(MgrdbAllSequences, owner=owner, sequence_name=sorted(names)))
+
+            self._ddl_times = ddl_times
+            self.checked_at = time.monotonic()
+            return {"changed": changed, "dropped": dropped, "seconds": time.perf_counter() - start}
+
+    def refresh_if_stale(self, max_age=None) -> bool:
+        """
+        Llama a `refresh` si han pasado más de ``max_age`` segundos desde la última comprobación.
+
+        Args:
+            max_age (float, optional): Antigüedad máxima. Por defecto ``self.max_age``.
+
+        Returns:
+            bool: ``True`` si se ha consultado la base de datos.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            if self.checked_at is not None and time.monotonic() - self.checked_at < max_age:
+                return False
+            self.refresh()
+            return True
+
+    # ------------------------------------------------------------------ #
+    # Índices
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _object_times(rows) -> dict:
+        return {(row["owner"], row["object_name"], row["object_type"]): row["last_ddl_time"] for row in rows}
+
+    def _index_columns(self, rows):
+        columns = defaultdict(list)
+        for row in rows:
+            columns[(row["owner"], row["table_name"])].append(row)
+        for key, table_columns in columns.items():
+            owner, table = key
+            self._columns[key] = tuple(table_columns)
+            self._tables_by_owner[owner].add(table)
+            self._owners_by_table[table].add(owner)
+            for row in table_columns:
+                self._column_index[(owner, table, row["column_name"])] = row
+                self._tables_by_column[row["column_name"]].add(key)
+
+    def _index_primary_keys(self, rows):
+        primary_keys = defaultdict(list)
+        for row in rows:
+            primary_keys[(row["owner"], row["table_name"])].append(row)
+        for key, pk_rows in primary_keys.items():
+            pk_rows.sort(key=lambda row: row["posicion"])
+            self._primary_keys[key] = tuple(row["column_name"] for row in pk_rows)
+
+    def _index_foreign_keys(self, rows):
+        foreign_keys = defaultdict(list)
+        for row in rows:
+            key = (row["owner"], row["table_name"])
+            referenced = (row["referenced_owner"], row["referenced_table"])
+            foreign_keys[key].append(row)
+            self._references[key].add(referenced)
+            self._referenced_by[referenced].add(key)
+        for key, fk_rows in foreign_keys.items():
+            self._foreign_keys[key] = tuple(fk_rows)
+
+    def _index_sequences(self, rows):
+        for row in rows:
+            owner, name = row["sequence_owner"], row["sequence_name"]
+            self._sequences[(owner, name)] = row
+            self._owners_by_sequence[name].add(owner)
+
+    def _drop_table(self, key):
+        owner, table = key
+        for row in self._columns.pop(key, ()):
+            self._column_index.pop((owner, table, row["column_name"]), None)
+            self._discard(self._tables_by_column, row["column_name"], key)
+        self._discard(self._tables_by_owner, owner, table)
+        self._discard(self._owners_by_table, table, owner)
+        self._primary_keys.pop(key, None)
+        self._foreign_keys.pop(key, None)
+        for referenced in self._references.pop(key, ()):
+            self._discard(self._referenced_by, referenced, key)
+
+    def _drop_sequence(self, key):
+        owner, name = key
+        self._sequences.pop(key, None)
+        self._discard(self._owners_by_sequence, name, owner)
+
+    @staticmethod
+    def _discard(index, key, value):
+        values = index.get(key)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del index[key]
+
+    # ------------------------------------------------------------------ #
+    # Consultas
+    # ------------------------------------------------------------------ #
+    def _resolve(self, name, owner, owners_index, kind="La tabla"):
+        """
+        Devuelve la clave ``(owner, nombre)``, probando el nombre tal cual y en mayúsculas.
+
+        Raises:
+            ValueError: Si el nombre no existe o, sin ``owner``, existe en varios esquemas.
+        """
+        for candidate in dict.fromkeys((name, name.upper())):
+            owners = owners_index.get(candidate)
+            if not owners:
+                continue
+            if owner is not None:
+                for candidate_owner in dict.fromkeys((owner, owner.upper())):
+                    if candidate_owner in owners:
+                        return candidate_owner, candidate
+                continue
+            if len(owners) > 1:
+                raise ValueError(f"{kind} '{name}' existe en varios esquemas ({', '.join(sorted(owners))}); indique owner.")
+            return next(iter(owners)), candidate
+        target = f"{owner}.{name}" if owner else name
+        raise ValueError(f"{kind} '{target}' no existe en el catálogo.")
+
+    def tables(self, owner=None) -> list:
+        """
+        Devuelve las tablas y vistas cargadas.
+
+        Args:
+            owner (str, optional): Esquema. Por defecto, todos.
+
+        Returns:
+            list[tuple[str, str]]: ``(owner, tabla)`` ordenadas.
+        """
+        with self._lock:
+            if owner is None:
+                return sorted(self._columns)
+            owner = owner if owner in self._tables_by_owner else owner.upper()
+            return sorted((owner, table) for table in self._tables_by_owner.get(owner, ()))
+
+    def table_columns(self, table, owner=None) -> tuple:
+        """
+        Devuelve las columnas de una tabla o vista en el orden de ``COLUMN_ID``.
+
+        Returns:
+            tuple[dict]: Filas de `MgrdbTableStructure` (``column_name``, ``data_type``, ``nullable``…).
+        """
+        with self._lock:
+            return self._columns[self._resolve(table, owner, self._owners_by_table)]
+
+    def column(self, table, column, owner=None) -> dict:
+        """
+        Devuelve la definición de una columna.
+
+        Raises:
+            ValueError: Si la tabla o la columna no existen en el catálogo.
+        """
+        with self._lock:
+            owner, table = self._resolve(table, owner, self._owners_by_table)
+            for candidate in dict.fromkeys((column, column.upper())):
+                row = self._column_index.get((owner, table, candidate))
+                if row is not None:
+                    return row
+            raise ValueError(f"La columna '{column}' no existe en {owner}.{table}.")
+
+    def tables_with_column(self, column) -> list:
+        """Devuelve las tablas ``(owner, tabla)`` que tienen una columna con ese nombre."""
+        with self._lock:
+            column = column if column in self._tables_by_column else column.upper()
+            return sorted(self._tables_by_column.get(column, ()))
+
+    def primary_key(self, table, owner=None) -> tuple:
+        """Devuelve las columnas de la clave primaria por posición (vacía si la tabla no tiene)."""
+        with self._lock:
+            return self._primary_keys.get(self._resolve(table, owner, self._owners_by_table), ())
+
+    def foreign_keys(self, table, owner=None) -> tuple:
+        """
+        Devuelve las claves ajenas salientes de una tabla.
+
+        Returns:
+            tuple[dict]: Filas de `MgrdbAllTableDependencies` (``constraint_name``, ``column_name``,
+            ``referenced_owner``, ``referenced_table``, ``referenced_column``).
+        """
+        with self._lock:
+            return self._foreign_keys.get(self._resolve(table, owner, self._owners_by_table), ())
+
+    def referenced_tables(self, table, owner=None) -> list:
+        """Devuelve las tablas ``(owner, tabla)`` a las que apuntan las claves ajenas de ``table``."""
+        with self._lock:
+            return sorted(self._references.get(self._resolve(table, owner, self._owners_by_table), ()))
+
+    def referencing_tables(self, table, owner=None) -> list:
+        """Devuelve las tablas ``(owner, tabla)`` con claves ajenas que apuntan a ``table``."""
+        with self._lock:
+            return sorted(self._referenced_by.get(self._resolve(table, owner, self._owners_by_table), ()))
+
+    def sequence(self, name, owner=None) -> dict:
+        """Devuelve la fila de `MgrdbAllSequences` de una secuencia."""
+        with self._lock:
+            return self._sequences[self._resolve(name, owner, self._owners_by_sequence, "La secuencia")]
+
+    def stats(self) -> dict:
+        """
+        Devuelve el tamaño del catálogo.
+
+        Returns:
+            dict: ``objects``, ``tables``, ``columns``, ``foreign_keys``, ``sequences`` y segundos
+            desde la carga (``age``) y desde la última comprobación (``checked_age``).
+        """
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "objects": len(self._ddl_times),
+                "tables": len(self._columns),
+                "columns": len(self._column_index),
+                "foreign_keys": sum(len(rows) for rows in self._foreign_keys.values()),
+                "sequences": len(self._sequences),
+                "age": now - self.loaded_at if self.loaded_at is not None else None,
+                "checked_age": now - self.checked_at if self.checked_at is not None else None,
+            }
+
+    def __repr__(self):
+        owners = ", ".join(self.owners) if self.owners else "todos"
+        return f"{self.__class__.__name__}({owners}): {len(self._columns)} tablas"
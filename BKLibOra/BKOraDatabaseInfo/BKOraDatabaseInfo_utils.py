@@ -0,0 +1,71 @@
+"""
+Módulo BKOraDatabaseInfo_utils
+------------------------------
+
+Funciones auxiliares de los managers de `BKOraDatabaseInfo`.
+
+Funciones:
+    scope_predicates(scope)
+"""
+
+from BKLibOra.config import IN_VALUES
+
+
+def _bucket_size(size: int, limit: int) -> int:
+    bucket = 1
+    while bucket < size:
+        bucket *= 2
+    return min(bucket, limit)
+
+
+def scope_predicates(scope: list) -> tuple:
+    """
+    Construye los predicados ``AND`` y los binds que acotan una consulta de las vistas del diccionario.
+
+    Cada filtro es ``(columna_sql, bind, valor)``:
+
+    - ``None``: el filtro no se aplica.
+    - Un valor escalar: ``AND columna = :bind``.
+    - Una lista (o cualquier iterable que no sea cadena): ``AND columna IN (:bind_0, :bind_1, ...)``.
+      Como en la estrategia ``bucket`` de `BKOraQueryBuilder`, la lista se rellena hasta la siguiente
+      potencia de dos repitiendo el último valor (listas de tamaño parecido comparten el SQL y el
+      cursor de Oracle) y se divide en listas unidas con ``OR`` por encima de ``IN_VALUES["in_chunk_size"]``.
+      Una lista vacía no devuelve ninguna fila.
+
+    Args:
+        scope (list[tuple[str, str, Any]]): Filtros ``(columna_sql, bind, valor)``.
+
+    Returns:
+        tuple[str, dict]: Predicados (cadena vacía si no hay filtros) y parámetros.
+
+    Examples:
+        >>> scope_predicates([("C.OWNER", "owner", "HR"), ("C.TABLE_NAME", "table_name", ["EMP", "DEPT"])])
+        ('AND C.OWNER = :owner AND C.TABLE_NAME IN (:table_name_0, :table_name_1)', {...})
+    """
+    chunk_size = IN_VALUES.get("in_chunk_size")
+    clauses = []
+    params = {}
+    for column, bind, value in scope:
+        if value is None:
+            continue
+        if isinstance(value, str) or not hasattr(value, "__iter__"):
+            clauses.append(f"AND {column} = :{bind}")
+            params[bind] = value
+            continue
+
+        values = list(dict.fromkeys(value))
+        if not values:
+            clauses.append("AND 1 = 0")
+            continue
+        lists = []
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size]
+            chunk += chunk[-1:] * (_bucket_size(len(chunk), chunk_size) - len(chunk))
+            names = []
+            for item in chunk:
+                name = f"{bind}_{start + len(names)}"
+                params[name] = item
+                names.append(f":{name}")
+            lists.append(f"{column} IN ({', '.join(names)})")
+        clauses.append(f"AND {lists[0]}" if len(lists) == 1 else f"AND ({' OR '.join(lists)})")
+    return " ".join(clauses), params
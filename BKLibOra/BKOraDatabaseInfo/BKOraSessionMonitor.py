@@ -0,0 +1,374 @@
+"""
+Módulo BKOraSessionMonitor
+--------------------------
+
+Este módulo define un monitor de sesiones y bloqueos que sondea ``V$SESSION`` (y, opcionalmente, ``V$LOCK``)
+de forma periódica y emite eventos con los cambios entre sondeos.
+
+Para que el coste en la base de datos sea mínimo:
+
+- Las sesiones se leen sin el texto SQL (`MgrdbAllSessionActive` con ``with_sql_text=False``).
+- El texto solo se pide a ``V$SQLAREA`` (`MgrdbSqlText`) para los ``SQL_ID`` que todavía no se han visto,
+  en una única consulta por sondeo, y se guarda en una caché LRU acotada.
+
+Eventos (``BKOraSessionEvent.kind``):
+    - ``session_new`` / ``session_gone``: sesión que aparece o desaparece.
+    - ``wait_started`` / ``wait_cleared``: sesión que entra en (o sale de) una espera no ``Idle``.
+    - ``blocker_new`` / ``blocker_cleared``: sesión que empieza (o deja) de bloquear a otras.
+    - ``long_running_sql``: llamada activa que supera ``long_running`` segundos (una vez por ejecución).
+    - ``poll_error``: error en un sondeo del hilo de fondo (el monitor sigue funcionando).
+
+Clases:
+    BKOraSessionEvent
+    BKOraSessionSnapshot
+    BKOraSessionMonitor
+"""
+
+from BKLibOra.config import SESSION_MONITOR_VALUES
+from BKLibOra.BKOraDatabaseInfo.MgrdbAllSessionActive.MgrdbAllSessionActive import MgrdbAllSessionActive
+from BKLibOra.BKOraDatabaseInfo.MgrdbSessionLock.MgrdbSessionLock import MgrdbSessionLock
+from BKLibOra.BKOraDatabaseInfo.MgrdbSqlText.MgrdbSqlText import MgrdbSqlText
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+import threading
+import time
+
+
+def _rows(manager) -> list:
+    """Ejecuta el SELECT del manager y devuelve las filas como diccionarios con claves en minúsculas."""
+    sql, params = manager.get_sql_select()
+    keys, rows = manager.fetch_rows(sql, params)
+    keys = [key.lower() for key in keys]
+    return [dict(zip(keys, row)) for row in rows]
+
+
+class BKOraSessionEvent:
+    """
+    Cambio detectado entre dos sondeos.
+
+    Args:
+        kind (str): Tipo de evento (ver la documentación del módulo).
+        sid (int | None): Sesión afectada.
+        serial (int | None): ``SERIAL#`` de la sesión.
+        data (dict, optional): Detalle del evento (espera, sesiones bloqueadas, SQL…).
+        timestamp (datetime, optional): Momento del sondeo.
+    """
+
+    __slots__ = ("kind", "sid", "serial", "data", "timestamp")
+
+    def __init__(self, kind, sid=None, serial=None, data=None, timestamp=None):
+        self.kind = kind
+        self.sid = sid
+        self.serial = serial
+        self.data = data or {}
+        self.timestamp = timestamp or datetime.now()
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "sid": self.sid,
+            "serial": self.serial,
+            "data": self.data,
+            "timestamp": self.timestamp,
+        }
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.kind}, sid={self.sid}, {self.data})"
+
+
+class BKOraSessionSnapshot:
+    """
+    Estado de las sesiones y bloqueos en un sondeo.
+
+    Args:
+        sessions (dict[tuple[int, int], dict]): Filas de `MgrdbAllSessionActive` por ``(sid, serial#)``.
+        locks (list[dict]): Filas de `MgrdbSessionLock`.
+        taken_at (datetime): Momento del sondeo.
+    """
+
+    def __init__(self, sessions, locks, taken_at):
+        self.sessions = sessions
+        self.locks = locks
+        self.taken_at = taken_at
+        self._graph = None
+
+    def blocking_graph(self) -> dict:
+        """
+        Devuelve el grafo de bloqueos: ``{sid bloqueante: {sids bloqueados}}``.
+
+        Combina ``V$SESSION.BLOCKING_SESSION`` con los pares de ``V$LOCK`` si se han consultado.
+        """
+        if self._graph is None:
+            graph = defaultdict(set)
+            for (sid, _), row in self.sessions.items():
+                if row.get("blocking_session") is not None:
+                    graph[row["blocking_session"]].add(sid)
+            for lock in self.locks:
+                graph[lock["holding_session"]].add(lock["waiting_session"])
+            self._graph = dict(graph)
+        return self._graph
+
+    def blockers(self) -> set:
+        """Devuelve las sesiones que bloquean al menos a otra."""
+        return set(self.blocking_graph())
+
+    def blocking_chains(self) -> list:
+        """
+        Devuelve las cadenas de bloqueo desde cada sesión raíz (que bloquea sin estar bloqueada)
+        hasta las sesiones finales: ``[[raíz, bloqueada, bloqueada por la anterior, ...], ...]``.
+
+        En un interbloqueo (ciclo sin raíz) la cadena empieza por la sesión de menor SID del ciclo
+        y termina al volver a una sesión ya recorrida.
+        """
+        graph = self.blocking_graph()
+        waiting = set().union(*graph.values()) if graph else set()
+        roots = sorted(set(graph) - waiting)
+        chains = []
+        visited = set()
+
+        def walk(path):
+            visited.add(path[-1])
+            children = sorted(sid for sid in graph.get(path[-1], ()) if sid not in path)
+            if not children:
+                chains.append(path)
+            for child in children:
+                walk(path + [child])
+
+        for root in roots:
+            walk([root])
+        for sid in sorted(graph):
+            if sid not in visited:
+                walk([sid])
+        return chains
+
+
+class BKOraSessionMonitor:
+    """
+    Monitor de sesiones y bloqueos por sondeo, con eventos por diferencias entre sondeos.
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        interval (float, optional): Segundos entre sondeos del hilo de fondo. Por defecto
+            ``SESSION_MONITOR_VALUES["interval"]``.
+        long_running (float, optional): Segundos de llamada activa para ``long_running_sql``.
+        sql_cache_size (int, optional): ``SQL_ID`` cuyo texto se conserva en la caché LRU.
+        with_locks (bool, optional): Consulta también ``V$LOCK`` en cada sondeo.
+        username (str | list[str], optional): Limita el sondeo a estos usuarios.
+        on_event (callable, optional): Función que recibe cada `BKOraSessionEvent` (ver `subscribe`).
+
+    Métodos:
+        poll(): Sondea una vez y devuelve los eventos.
+        start() / stop(): Sondeo periódico en un hilo de fondo.
+        subscribe(callback): Añade un receptor de eventos.
+        sql_text(sql_id): Texto de un SQL ya visto (desde la caché).
+        stats(): Sondeos, filas leídas y aciertos de la caché de textos.
+
+    Ejemplo:
+        monitor = BKOraSessionMonitor(connector, on_event=print)
+        monitor.start()
+        ...
+        monitor.snapshot.blocking_chains()
+        monitor.stop()
+    """
+
+    def __init__(self, connector, interval=None, long_running=None, sql_cache_size=None, with_locks=None
+                 , username=None, on_event=None):
+        self.connector = connector
+        self.interval = interval or SESSION_MONITOR_VALUES.get("interval")
+        self.long_running = long_running or SESSION_MONITOR_VALUES.get("long_running")
+        self.sql_cache_size = sql_cache_size or SESSION_MONITOR_VALUES.get("sql_cache_size")
+        self.with_locks = SESSION_MONITOR_VALUES.get("with_locks") if with_locks is None else with_locks
+        self.username = username
+        self.snapshot = None
+        self.last_error = None
+        self._listeners = [on_event] if on_event else []
+        self._sql_texts = OrderedDict()
+        self._reported = set()
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._stats = {
+            "polls": 0,
+            "errors": 0,
+            "session_rows": 0,
+            "lock_rows": 0,
+            "sql_queries": 0,
+            "sql_texts_fetched": 0,
+            "sql_cache_hits": 0,
+            "sql_cache_misses": 0,
+            "last_poll_seconds": None,
+        }
+
+    def subscribe(self, callback):
+        """Añade ``callback``, que recibirá cada `BKOraSessionEvent` emitido."""
+        self._listeners.append(callback)
+
+    # ------------------------------------------------------------------ #
+    # Sondeo
+    # ------------------------------------------------------------------ #
+    def poll(self) -> list:
+        """
+        Sondea una vez: lee sesiones y bloqueos, completa los textos SQL nuevos y compara con el sondeo anterior.
+
+        Returns:
+            list[BKOraSessionEvent]: Eventos detectados (también enviados a los receptores).
+        """
+        with self._lock:
+            start = time.perf_counter()
+            taken_at = datetime.now()
+            rows = _rows(MgrdbAllSessionActive(self.connector, username=self.username, with_sql_text=False))
+            sessions = {(row["sid"], row["serial#"]): row for row in rows}
+            locks = _rows(MgrdbSessionLock(self.connector)) if self.with_locks else []
+            self._load_sql_texts({row["sql_id"] for row in rows if row.get("sql_id")})
+
+            snapshot = BKOraSessionSnapshot(sessions, locks, taken_at)
+            events = self._diff(self.snapshot, snapshot)
+            self.snapshot = snapshot
+
+            self._stats["polls"] += 1
+            self._stats["session_rows"] += len(rows)
+            self._stats["lock_rows"] += len(locks)
+            self._stats["last_poll_seconds"] = time.perf_counter() - start
+        self._emit(events)
+        return events
+
+    def _load_sql_texts(self, sql_ids):
+        """Pide a ``V$SQLAREA``, en una sola consulta, el texto de los ``SQL_ID`` que no están en la caché."""
+        missing = []
+        for sql_id in sql_ids:
+            if sql_id in self._sql_texts:
+                self._sql_texts.move_to_end(sql_id)
+                self._stats["sql_cache_hits"] += 1
+            else:
+                missing.append(sql_id)
+                self._stats["sql_cache_misses"] += 1
+        if not missing:
+            return
+        texts = {row["sql_id"]: row["sql_text"] for row in _rows(MgrdbSqlText(self.connector, sql_id=sorted(missing)))}
+        self._stats["sql_queries"] += 1
+        self._stats["sql_texts_fetched"] += len(texts)
+        for sql_id in missing:
+            # Los SQL_ID que ya no están en la shared pool se guardan como None para no volver a pedirlos
+            self._sql_texts[sql_id] = texts.get(sql_id)
+        while len(self._sql_texts) > self.sql_cache_size:
+            self._sql_texts.popitem(last=False)
+
+    def sql_text(self, sql_id):
+        """Devuelve el texto de ``sql_id`` si ya se ha leído (``None`` si no está en la caché)."""
+        with self._lock:
+            return self._sql_texts.get(sql_id)
+
+    # ------------------------------------------------------------------ #
+    # Diferencias
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _waiting(row) -> bool:
+        return row.get("state") == "WAITING" and row.get("wait_class") not in (None, "Idle")
+
+    def _session_data(self, row) -> dict:
+        return {
+            "username": row.get("username"),
+            "status": row.get("status"),
+            "sql_id": row.get("sql_id"),
+            "sql_text": self._sql_texts.get(row.get("sql_id")),
+        }
+
+    def _diff(self, previous, current) -> list:
+        events = []
+        taken_at = current.taken_at
+        old_sessions = previous.sessions if previous else {}
+
+        def event(kind, key, **data):
+            row = current.sessions.get(key) or old_sessions.get(key) or {}
+            events.append(BKOraSessionEvent(kind, key[0], key[1], self._session_data(row) | data, taken_at))
+
+        if previous is not None:
+            for key in current.sessions.keys() - old_sessions.keys():
+                event("session_new", key)
+            for key in old_sessions.keys() - current.sessions.keys():
+                event("session_gone", key)
+
+        for key, row in current.sessions.items():
+            old = old_sessions.get(key)
+            was_waiting = old is not None and self._waiting(old)
+            if self._waiting(row) and (not was_waiting or old.get("event") != row.get("event")):
+                event("wait_started", key, event=row.get("event"), wait_class=row.get("wait_class")
+                      , blocking_session=row.get("blocking_session"))
+            elif was_waiting and not self._waiting(row):
+                event("wait_cleared", key, event=old.get("event"), seconds=old.get("seconds_in_wait"))
+
+        sessions_by_sid = {sid: (sid, serial) for sid, serial in current.sessions}
+        old_by_sid = {sid: (sid, serial) for sid, serial in old_sessions}
+        graph = current.blocking_graph()
+        old_graph = previous.blocking_graph() if previous else {}
+        chains = current.blocking_chains() if graph.keys() - old_graph.keys() else []
+        for sid in sorted(graph.keys() - old_graph.keys()):
+            event("blocker_new", sessions_by_sid.get(sid, (sid, None)), waiters=sorted(graph[sid])
+                  , chains=[chain for chain in chains if sid in chain])
+        for sid in sorted(old_graph.keys() - graph.keys()):
+            event("blocker_cleared", sessions_by_sid.get(sid) or old_by_sid.get(sid, (sid, None))
+                  , waiters=sorted(old_graph[sid]))
+
+        reported = set()
+        for key, row in current.sessions.items():
+            if row.get("status") != "ACTIVE" or not row.get("sql_id") or (row.get("last_call_et") or 0) < self.long_running:
+                continue
+            execution = (key, row["sql_id"], row.get("sql_exec_start"))
+            reported.add(execution)
+            if execution not in self._reported:
+                event("long_running_sql", key, seconds=row.get("last_call_et"), sql_exec_start=row.get("sql_exec_start"))
+        self._reported = reported
+        return events
+
+    def _emit(self, events):
+        for event in events:
+            for listener in self._listeners:
+                listener(event)
+
+    # ------------------------------------------------------------------ #
+    # Hilo de fondo
+    # ------------------------------------------------------------------ #
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Arranca el sondeo periódico en un hilo de fondo (no hace nada si ya está en marcha)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="BKOraSessionMonitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Detiene el hilo de fondo y espera a que termine el sondeo en curso."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                self.last_error = e
+                self._stats["errors"] += 1
+                self._emit([BKOraSessionEvent("poll_error", data={"error": repr(e)})])
+            self._stop.wait(self.interval)
+
+    def stats(self) -> dict:
+        """
+        Devuelve las métricas del monitor.
+
+        Returns:
+            dict: ``polls``, ``errors``, filas leídas (``session_rows``, ``lock_rows``), consultas y textos
+            de ``V$SQLAREA`` (``sql_queries``, ``sql_texts_fetched``), aciertos y fallos de la caché de
+            textos, ``sql_cache_size`` y ``last_poll_seconds``.
+        """
+        with self._lock:
+            return self._stats | {"sql_cache_size": len(self._sql_texts)}
+
+    def __repr__(self):
+        state = "en marcha" if self.running else "detenido"
+        return f"{self.__class__.__name__}({state}, cada {self.interval}s)"
@@ -0,0 +1,37 @@
+from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
+from BKLibOra.BKOraDatabaseInfo.MgrdbAllObjects.ModelAllObjects import ModelAllObjects
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
+
+class MgrdbAllObjects(BKOraManagerDB):
+    """
+    Tablas, vistas y secuencias (``ALL_OBJECTS``) con su ``LAST_DDL_TIME``.
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        owner (str | list[str], optional): Esquema o esquemas.
+        object_name (str | list[str], optional): Objeto u objetos.
+        object_type (str | list[str], optional): Tipo o tipos. Por defecto ``TABLE``, ``VIEW`` y ``SEQUENCE``.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, owner=None, object_name=None, object_type=("TABLE", "VIEW", "SEQUENCE"), **kwargs):
+        super().__init__(connector=connector, model=ModelAllObjects, **kwargs)
+        self.owner = owner
+        self.object_name = object_name
+        self.object_type = object_type
+
+    def get_sql_select(self):
+        scope, params = scope_predicates([
+            ("OWNER", "owner", self.owner),
+            ("OBJECT_NAME", "object_name", self.object_name),
+            ("OBJECT_TYPE", "object_type", self.object_type),
+        ])
+        sql = f"""
+            SELECT 
+                  OWNER
+                , OBJECT_NAME
+                , OBJECT_TYPE
+                , LAST_DDL_TIME
+            FROM ALL_OBJECTS
+            WHERE 1 = 1 {scope}
+        """
+        return sql, params
\ No newline at end of file
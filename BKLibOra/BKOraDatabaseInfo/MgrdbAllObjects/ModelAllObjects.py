@@ -0,0 +1,9 @@
+from BKLibOra.BKOraModel.BKOraModelDB import BKOraModelDB
+from BKLibOra.BKOraModel.BKOraColums import BKOraColumn
+from datetime import datetime
+
+class ModelAllObjects(BKOraModelDB):
+    owner = BKOraColumn(name="owner", type_=str, primary_key=True)
+    object_name = BKOraColumn(name="object_name", type_=str, primary_key=True)
+    object_type = BKOraColumn(name="object_type", type_=str, primary_key=True)
+    last_ddl_time = BKOraColumn(name="last_ddl_time", type_=datetime)
\ No newline at end of file
@@ -1,27 +1,38 @@
 from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
 from BKLibOra.BKOraDatabaseInfo.MgrdbAllPrimaryKey.ModelAllPrimaryKey import ModelAllPrimaryKey
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
 
-class MgrdbAllTableDependencies(BKOraManagerDB):
-    def __init__(self, connector):
-        super().__init__(connector=connector, model=ModelAllPrimaryKey)
+class MgrdbAllPrimaryKey(BKOraManagerDB):
+    """
+    Columnas de las claves primarias (``ALL_CONSTRAINTS`` de tipo ``P``).
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        owner (str | list[str], optional): Esquema o esquemas.
+        table_name (str | list[str], optional): Tabla o tablas.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, owner=None, table_name=None, **kwargs):
+        super().__init__(connector=connector, model=ModelAllPrimaryKey, **kwargs)
+        self.owner = owner
+        self.table_name = table_name
 
     def get_sql_select(self):
-        sql = """
+        scope, params = scope_predicates([("AC.OWNER", "owner", self.owner), ("AC.TABLE_NAME", "table_name", self.table_name)])
+        sql = f"""
             SELECT 
-                  A.TABLE_NAME
-                , A.COLUMN_NAME
-                , A.CONSTRAINT_NAME
-                , C_PK.TABLE_NAME AS REFERENCED_TABLE
-                , B.COLUMN_NAME AS REFERENCED_COLUMN
-            FROM ALL_CONS_COLUMNS A
-            JOIN ALL_CONSTRAINTS C 
-                ON A.CONSTRAINT_NAME = C.CONSTRAINT_NAME 
-               AND A.OWNER = C.OWNER
-            JOIN ALL_CONSTRAINTS C_PK 
-                ON C.R_CONSTRAINT_NAME = C_PK.CONSTRAINT_NAME 
-               AND C.R_OWNER = C_PK.OWNER
-            JOIN ALL_CONS_COLUMNS B 
-                ON C_PK.CONSTRAINT_NAME = B.CONSTRAINT_NAME 
-               AND B.POSITION = A.POSITION
+                  AC.OWNER
+                , ACC.TABLE_NAME
+                , ACC.COLUMN_NAME
+                , ACC.POSITION AS POSICION
+                , AC.CONSTRAINT_NAME
+            FROM ALL_CONSTRAINTS AC
+            JOIN ALL_CONS_COLUMNS ACC 
+                ON AC.CONSTRAINT_NAME = ACC.CONSTRAINT_NAME 
+               AND AC.OWNER = ACC.OWNER
+            WHERE AC.CONSTRAINT_TYPE = 'P' {scope}
         """
-        return sql, {}
\ No newline at end of file
+        return sql, params
+
+# Nombre anterior de la clase (copiado por error del manager de dependencias); se mantiene por compatibilidad
+MgrdbAllTableDependencies = MgrdbAllPrimaryKey
\ No newline at end of file
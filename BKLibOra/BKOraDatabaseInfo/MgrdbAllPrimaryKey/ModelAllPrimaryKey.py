@@ -2,7 +2,8 @@ from BKLibOra.BKOraModel.BKOraModelDB import BKOraModelDB
 from BKLibOra.BKOraModel.BKOraColums import BKOraColumn
 
 class ModelAllPrimaryKey(BKOraModelDB):
+    owner = BKOraColumn(name="owner", type_=str, primary_key=True)
     table_name = BKOraColumn(name="table_name", type_=str, primary_key=True)
     column_name = BKOraColumn(name="column_name", type_=str)
     posicion = BKOraColumn(name="posicion", type_=int)
-    constraint_name = BKOraColumn(name="constraint_name", type_=str, primary_key=True)
+    constraint_name = BKOraColumn(name="constraint_name", type_=str, primary_key=True)
\ No newline at end of file
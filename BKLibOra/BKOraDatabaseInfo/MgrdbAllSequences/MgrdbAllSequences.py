@@ -1,12 +1,26 @@
 from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
 from BKLibOra.BKOraDatabaseInfo.MgrdbAllSequences.ModelAllSequences import ModelAllSequences
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
 
 class MgrdbAllSequences(BKOraManagerDB):
-    def __init__(self, connector):
-        super().__init__(connector=connector, model=ModelAllSequences)
+    """
+    Secuencias (``ALL_SEQUENCES``).
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        owner (str | list[str], optional): Esquema o esquemas.
+        sequence_name (str | list[str], optional): Secuencia o secuencias.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, owner=None, sequence_name=None, **kwargs):
+        super().__init__(connector=connector, model=ModelAllSequences, **kwargs)
+        self.owner = owner
+        self.sequence_name = sequence_name
 
     def get_sql_select(self):
-        sql = """
+        scope, params = scope_predicates([("SEQUENCE_OWNER", "owner", self.owner)
+                                          , ("SEQUENCE_NAME", "sequence_name", self.sequence_name)])
+        sql = f"""
             SELECT 
                   SEQUENCE_OWNER
                 , SEQUENCE_NAME
@@ -18,5 +32,6 @@ class MgrdbAllSequences(BKOraManagerDB):
                 , CACHE_SIZE
                 , LAST_NUMBER
             FROM ALL_SEQUENCES
+            WHERE 1 = 1 {scope}
         """
-        return sql, {}
\ No newline at end of file
+        return sql, params
\ No newline at end of file
@@ -1,12 +1,35 @@
 from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
 from BKLibOra.BKOraDatabaseInfo.MgrdbAllSessionActive.ModelAllSessionActive import ModelAllSessionActive
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
 
 class MgrdbAllSessionActive(BKOraManagerDB):
-    def __init__(self, connector):
-        super().__init__(connector=connector, model=ModelAllSessionActive)
+    """
+    Sesiones de ``V$SESSION`` con su SQL actual y su espera.
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        username (str | list[str], optional): Usuario o usuarios.
+        status (str | list[str], optional): Estado o estados (``ACTIVE``, ``INACTIVE``…).
+        sid (int | list[int], optional): Sesión o sesiones.
+        with_sql_text (bool, optional): Incluye ``SQL_TEXT`` (de ``V$SQLAREA``). Con ``False`` la columna
+            se devuelve vacía y no se consulta ``V$SQLAREA`` (ver `BKOraSessionMonitor`).
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, username=None, status=None, sid=None, with_sql_text=True, **kwargs):
+        super().__init__(connector=connector, model=ModelAllSessionActive, **kwargs)
+        self.username = username
+        self.status = status
+        self.sid = sid
+        self.with_sql_text = with_sql_text
 
     def get_sql_select(self):
-        sql = """
+        scope, params = scope_predicates([
+            ("S.USERNAME", "username", self.username),
+            ("S.STATUS", "status", self.status),
+            ("S.SID", "sid", self.sid),
+        ])
+        sql_text, join = ("Q.SQL_TEXT", "LEFT JOIN V$SQLAREA Q ON S.SQL_ID = Q.SQL_ID") if self.with_sql_text else ("NULL AS SQL_TEXT", "")
+        sql = f"""
             SELECT
                 S.SID,
                 S.SERIAL#,
@@ -17,8 +40,16 @@ class MgrdbAllSessionActive(BKOraManagerDB):
                 S.MACHINE,
                 S.LOGON_TIME,
                 S.SQL_ID,
-                Q.SQL_TEXT
+                {sql_text},
+                S.SQL_EXEC_START,
+                S.LAST_CALL_ET,
+                S.STATE,
+                S.EVENT,
+                S.WAIT_CLASS,
+                S.SECONDS_IN_WAIT,
+                S.BLOCKING_SESSION
             FROM V$SESSION S
-            LEFT JOIN V$SQL Q ON S.SQL_ID = Q.SQL_ID
+            {join}
+            WHERE 1 = 1 {scope}
         """
-        return sql, {}
\ No newline at end of file
+        return sql, params
\ No newline at end of file
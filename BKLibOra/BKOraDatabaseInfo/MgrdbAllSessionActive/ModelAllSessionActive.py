@@ -1,5 +1,6 @@
 from BKLibOra.BKOraModel.BKOraModelDB import BKOraModelDB
 from BKLibOra.BKOraModel.BKOraColums import BKOraColumn
+from datetime import datetime
 
 class ModelAllSessionActive(BKOraModelDB):
     sid = BKOraColumn(name="sid", type_=int, primary_key=True)
@@ -12,3 +13,10 @@ class ModelAllSessionActive(BKOraModelDB):
     logon_time = BKOraColumn(name="logon_time", type_="datetime")
     sql_id = BKOraColumn(name="sql_id", type_=str)
     sql_text = BKOraColumn(name="sql_text", type_=str)
+    sql_exec_start = BKOraColumn(name="sql_exec_start", type_=datetime)
+    last_call_et = BKOraColumn(name="last_call_et", type_=int)
+    state = BKOraColumn(name="state", type_=str)
+    event = BKOraColumn(name="event", type_=str)
+    wait_class = BKOraColumn(name="wait_class", type_=str)
+    seconds_in_wait = BKOraColumn(name="seconds_in_wait", type_=int)
+    blocking_session = BKOraColumn(name="blocking_session", type_=int)
\ No newline at end of file
@@ -1,16 +1,41 @@
 from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
 from BKLibOra.BKOraDatabaseInfo.MgrdbAllTableDependencies.ModelAllTableDependencies import ModelAllTableDependencies
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
 
 class MgrdbAllTableDependencies(BKOraManagerDB):
-    def __init__(self, connector):
-        super().__init__(connector=connector, model=ModelAllTableDependencies)
+    """
+    Columnas de las claves ajenas con la tabla y columna a las que apuntan.
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        owner (str | list[str], optional): Esquema o esquemas de la tabla con la clave ajena.
+        table_name (str | list[str], optional): Tabla o tablas con la clave ajena.
+        referenced_owner (str | list[str], optional): Esquema o esquemas de la tabla referenciada.
+        referenced_table (str | list[str], optional): Tabla o tablas referenciadas.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, owner=None, table_name=None, referenced_owner=None, referenced_table=None
+                 , **kwargs):
+        super().__init__(connector=connector, model=ModelAllTableDependencies, **kwargs)
+        self.owner = owner
+        self.table_name = table_name
+        self.referenced_owner = referenced_owner
+        self.referenced_table = referenced_table
 
     def get_sql_select(self):
-        sql = """
+        scope, params = scope_predicates([
+            ("C.OWNER", "owner", self.owner),
+            ("C.TABLE_NAME", "table_name", self.table_name),
+            ("C_PK.OWNER", "referenced_owner", self.referenced_owner),
+            ("C_PK.TABLE_NAME", "referenced_table", self.referenced_table),
+        ])
+        sql = f"""
             SELECT 
-                  A.TABLE_NAME
+                  A.OWNER
+                , A.TABLE_NAME
                 , A.COLUMN_NAME
                 , A.CONSTRAINT_NAME
+                , C_PK.OWNER AS REFERENCED_OWNER
                 , C_PK.TABLE_NAME AS REFERENCED_TABLE
                 , B.COLUMN_NAME AS REFERENCED_COLUMN
             FROM ALL_CONS_COLUMNS A
@@ -22,6 +47,8 @@ class MgrdbAllTableDependencies(BKOraManagerDB):
                AND C.R_OWNER = C_PK.OWNER
             JOIN ALL_CONS_COLUMNS B 
                 ON C_PK.CONSTRAINT_NAME = B.CONSTRAINT_NAME 
+               AND C_PK.OWNER = B.OWNER
                AND B.POSITION = A.POSITION
+            WHERE C.CONSTRAINT_TYPE = 'R' {scope}
         """
-        return sql, {}
\ No newline at end of file
+        return sql, params
\ No newline at end of file
@@ -18,7 +18,7 @@ class MgrdbCurrentExecuteQuery(BKOraManagerDB):
                 S.SQL_ID,
                 Q.SQL_TEXT
             FROM V$SESSION S
-            JOIN V$SQL Q ON S.SQL_ID = Q.SQL_ID
+            JOIN V$SQLAREA Q ON S.SQL_ID = Q.SQL_ID
             WHERE S.STATUS = 'ACTIVE'
         """
         return sql, {}
\ No newline at end of file
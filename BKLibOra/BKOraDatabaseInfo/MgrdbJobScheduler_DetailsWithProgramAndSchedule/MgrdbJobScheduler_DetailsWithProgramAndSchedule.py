@@ -1,12 +1,26 @@
 from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
 from BKLibOra.BKOraDatabaseInfo.MgrdbJobScheduler_DetailsWithProgramAndSchedule.ModelJobScheduler_DetailsWithProgramAndSchedule import ModelJobScheduler_DetailsWithProgramAndSchedule
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
 
 class MgrdbJobScheduler_DetailsWithProgramAndSchedule(BKOraManagerDB):
-    def __init__(self, connector):
-        super().__init__(connector=connector, model=ModelJobScheduler_DetailsWithProgramAndSchedule)
+    """
+    Jobs del planificador con su programa, su planificación y la última ejecución.
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        owner (str | list[str], optional): Esquema o esquemas.
+        job_name (str | list[str], optional): Job o jobs.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, owner=None, job_name=None, **kwargs):
+        super().__init__(connector=connector, model=ModelJobScheduler_DetailsWithProgramAndSchedule, **kwargs)
+        self.owner = owner
+        self.job_name = job_name
 
     def get_sql_select(self):
-        sql = """
+        scope, params = scope_predicates([("J.OWNER", "owner", self.owner), ("J.JOB_NAME", "job_name", self.job_name)])
+        runs, _ = scope_predicates([("OWNER", "owner", self.owner), ("JOB_NAME", "job_name", self.job_name)])
+        sql = f"""
             SELECT 
                   J.JOB_NAME
                 , J.OWNER
@@ -33,9 +47,11 @@ class MgrdbJobScheduler_DetailsWithProgramAndSchedule(BKOraManagerDB):
                 SELECT JOB_NAME, OWNER, STATUS, ACTUAL_START_DATE, RUN_DURATION,
                        ROW_NUMBER() OVER (PARTITION BY JOB_NAME, OWNER ORDER BY ACTUAL_START_DATE DESC) AS RN
                 FROM DBA_SCHEDULER_JOB_RUN_DETAILS
+                WHERE 1 = 1 {runs}
             ) R ON J.JOB_NAME = R.JOB_NAME AND J.OWNER = R.OWNER AND R.RN = 1
             LEFT JOIN DBA_SCHEDULER_SCHEDULES S
                 ON J.SCHEDULE_NAME = S.SCHEDULE_NAME AND J.OWNER = S.OWNER
+            WHERE 1 = 1 {scope}
             ORDER BY J.NEXT_RUN_DATE
         """
-        return sql, {}
\ No newline at end of file
+        return sql, params
\ No newline at end of file
@@ -16,7 +16,7 @@ class MgrdbSessionLock(BKOraManagerDB):
                 , L1.LMODE
                 , L2.REQUEST
             FROM V$LOCK L1
-            JOIN V$LOCK L2 ON L1.ID1 = L2.ID1 AND L1.ID2 = L2.ID2
+            JOIN V$LOCK L2 ON L1.ID1 = L2.ID1 AND L1.ID2 = L2.ID2 AND L1.TYPE = L2.TYPE
             WHERE L1.BLOCK = 1 AND L2.REQUEST > 0
         """
         return sql, {}
\ No newline at end of file
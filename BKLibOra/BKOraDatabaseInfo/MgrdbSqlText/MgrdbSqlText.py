@@ -0,0 +1,27 @@
+from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
+from BKLibOra.BKOraDatabaseInfo.MgrdbSqlText.ModelSqlText import ModelSqlText
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
+
+class MgrdbSqlText(BKOraManagerDB):
+    """
+    Texto de las sentencias de la shared pool (``V$SQLAREA``, una fila por ``SQL_ID``).
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        sql_id (str | list[str], optional): Sentencia o sentencias.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, sql_id=None, **kwargs):
+        super().__init__(connector=connector, model=ModelSqlText, **kwargs)
+        self.sql_id = sql_id
+
+    def get_sql_select(self):
+        scope, params = scope_predicates([("SQL_ID", "sql_id", self.sql_id)])
+        sql = f"""
+            SELECT
+                  SQL_ID
+                , SQL_TEXT
+            FROM V$SQLAREA
+            WHERE 1 = 1 {scope}
+        """
+        return sql, params
\ No newline at end of file
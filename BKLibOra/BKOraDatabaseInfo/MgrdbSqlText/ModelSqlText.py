@@ -0,0 +1,6 @@
+from BKLibOra.BKOraModel.BKOraModelDB import BKOraModelDB
+from BKLibOra.BKOraModel.BKOraColums import BKOraColumn
+
+class ModelSqlText(BKOraModelDB):
+    sql_id = BKOraColumn(name="sql_id", type_=str, primary_key=True)
+    sql_text = BKOraColumn(name="sql_text", type_=str)
\ No newline at end of file
@@ -1,12 +1,26 @@
 from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
 from BKLibOra.BKOraDatabaseInfo.MgrdbTableStructure.ModelTableStructure import ModelTableStructure
+from BKLibOra.BKOraDatabaseInfo.BKOraDatabaseInfo_utils import scope_predicates
 
 class MgrdbTableStructure(BKOraManagerDB):
-    def __init__(self, connector):
-        super().__init__(connector=connector, model=ModelTableStructure)
+    """
+    Columnas de las tablas y vistas (``ALL_TAB_COLUMNS``) con su marca de clave primaria y comentario.
+
+    Args:
+        connector (BKOraConnect): Conector a la base de datos.
+        owner (str | list[str], optional): Esquema o esquemas.
+        table_name (str | list[str], optional): Tabla o tablas.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, owner=None, table_name=None, **kwargs):
+        super().__init__(connector=connector, model=ModelTableStructure, **kwargs)
+        self.owner = owner
+        self.table_name = table_name
 
     def get_sql_select(self):
-        sql = """
+        columns, params = scope_predicates([("C.OWNER", "owner", self.owner), ("C.TABLE_NAME", "table_name", self.table_name)])
+        keys, _ = scope_predicates([("AC.OWNER", "owner", self.owner), ("AC.TABLE_NAME", "table_name", self.table_name)])
+        sql = f"""
             SELECT 
                   C.OWNER
                 , C.TABLE_NAME
@@ -20,12 +34,13 @@ class MgrdbTableStructure(BKOraManagerDB):
                 , CC.COMMENTS
             FROM ALL_TAB_COLUMNS C
             LEFT JOIN (
-                SELECT ACC.COLUMN_NAME
+                SELECT ACC.OWNER, ACC.TABLE_NAME, ACC.COLUMN_NAME
                 FROM ALL_CONSTRAINTS AC
                 JOIN ALL_CONS_COLUMNS ACC ON AC.CONSTRAINT_NAME = ACC.CONSTRAINT_NAME AND AC.OWNER = ACC.OWNER
-                WHERE AC.CONSTRAINT_TYPE = 'P'
-            ) PK ON C.COLUMN_NAME = PK.COLUMN_NAME
+                WHERE AC.CONSTRAINT_TYPE = 'P' {keys}
+            ) PK ON C.OWNER = PK.OWNER AND C.TABLE_NAME = PK.TABLE_NAME AND C.COLUMN_NAME = PK.COLUMN_NAME
             LEFT JOIN ALL_COL_COMMENTS CC ON C.OWNER = CC.OWNER AND C.TABLE_NAME = CC.TABLE_NAME AND C.COLUMN_NAME = CC.COLUMN_NAME
+            WHERE 1 = 1 {columns}
             ORDER BY C.OWNER, C.TABLE_NAME, C.COLUMN_ID
         """
-        return sql, {}
\ No newline at end of file
+        return sql, params
\ No newline at end of file
@@ -0,0 +1,313 @@
+"""
+Módulo BKOraAsyncManager
+------------------------
+
+Este módulo define la clase `AsyncBKOraManager`, la variante asyncio de `BKOraManager`.
+
+Expone la misma interfaz (`fetch_all`, `fetch_one`, `fetch_iter`, `execute`, `execute_many`, `unit_of_work`)
+como corrutinas sobre un `AsyncBKOraConnect`. Cada llamada sin sesión explícita abre su propia `AsyncSession`,
+por lo que varias consultas lanzadas con `asyncio.gather` se ejecutan concurrentemente sobre el mismo event loop.
+
+Clases:
+    AsyncBKOraManager
+
+Dependencias:
+    - contextlib
+    - sqlalchemy[asyncio] (a través del conector proporcionado)
+"""
+
+from BKLibOra.config import FETCH_VALUES, BULK_VALUES
+from BKLibOra.BKOraManager.BKOraManager import _bound_sessions
+from BKLibOra.BKOraManager.BKOraManager_utils import row_mapper
+from BKLibOra.BKOraManager.BKOraStatementCache import default_statement_cache
+from BKLibOra.BKOraManager.BKOraFetchTuner import fetch_options
+from sqlalchemy.sql import text
+from contextlib import asynccontextmanager
+
+
+class AsyncBKOraManager:
+    """
+    Gestor asíncrono de operaciones SQL sobre una base de datos Oracle usando SQLAlchemy asyncio.
+
+    Args:
+        connector (AsyncBKOraConnect): Conector asíncrono que expone el método `get_session()`.
+
+    Métodos:
+        session_scope(): Context manager asíncrono que maneja apertura, commit, rollback y cierre de la sesión.
+        unit_of_work(): Context manager asíncrono que liga una única sesión a las llamadas de la tarea actual.
+        fetch_all(query, params=None): Devuelve todos los resultados como lista de diccionarios.
+        fetch_one(query, params=None): Devuelve un único resultado como diccionario.
+        fetch_models(query, model, params=None): Devuelve los resultados como instancias de ``model``.
+        fetch_iter(query, params=None): Generador asíncrono de filas en streaming.
+        execute(query, params=None): Ejecuta una instrucción SQL sin retornar resultados.
+        execute_many(query, params_list): Ejecuta una instrucción DML por lotes con ``executemany``.
+        build_query(builder): Construye ``(sql, params)`` de un `BKOraQueryBuilder` usando la caché de sentencias.
+
+    Atributos de clase:
+        statement_cache (BKOraStatementCache | None): Caché de sentencias y consultas generadas. Se
+            comparte entre managers; ``None`` desactiva la caché para la clase o la instancia.
+        fetch_tuner (BKOraFetchTuner | None): Ajuste adaptativo del ``arraysize`` de ``fetch_all`` y
+            ``fetch_models`` (ver `BKOraManager.fetch_tuner`).
+    """
+
+    statement_cache = default_statement_cache
+    fetch_tuner = None
+
+    def __init__(self, connector):
+        """
+        Inicializa una instancia de AsyncBKOraManager.
+
+        Args:
+            connector (AsyncBKOraConnect): Conector asíncrono a la base de datos.
+        """
+        self.connector = connector
+
+    @asynccontextmanager
+    async def session_scope(self):
+        """
+        Context manager asíncrono que proporciona un ámbito de sesión seguro.
+
+        Dentro de un `unit_of_work()` activo se reutiliza su sesión y el commit/cierre queda en manos de este.
+
+        Yields:
+            sqlalchemy.ext.asyncio.AsyncSession: Sesión activa.
+        """
+        bound = self.bound_session()
+        if bound is not None:
+            yield bound
+            return
+
+        session = self.connector.get_session()
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise e
+        finally:
+            await session.close()
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        """
+        Context manager asíncrono que liga una única sesión a todas las llamadas hechas en su interior.
+
+        Equivalente a `BKOraManager.unit_of_work`: la sesión vive en una ``ContextVar``, de modo que
+        cada tarea asyncio ve solo la suya.
+
+        Yields:
+            sqlalchemy.ext.asyncio.AsyncSession: Sesión ligada al contexto.
+        """
+        bound = self.bound_session()
+        if bound is not None:
+            yield bound
+            return
+
+        session = self.connector.get_session()
+        sessions = dict(_bound_sessions.get() or {})
+        sessions[id(self.connector)] = session
+        token = _bound_sessions.set(sessions)
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            raise e
+        finally:
+            _bound_sessions.reset(token)
+            await session.close()
+
+    def bound_session(self):
+        """
+        Devuelve la sesión ligada por un `unit_of_work()` activo para este conector.
+
+        Returns:
+            sqlalchemy.ext.asyncio.AsyncSession | None: Sesión ligada o ``None``.
+        """
+        sessions = _bound_sessions.get()
+        if not sessions:
+            return None
+        return sessions.get(id(self.connector))
+
+    def _statement(self, query):
+        """Devuelve el ``TextClause`` de ``query``, reutilizado desde `statement_cache` si está activa."""
+        if not isinstance(query, str):
+            return query
+        if self.statement_cache is None:
+            return text(query)
+        return self.statement_cache.statement(query)
+
+    def build_query(self, builder):
+        """
+        Construye la consulta de un `BKOraQueryBuilder`.
+
+        Con `statement_cache` activa, los builders con la misma forma (SQL base, columnas, operadores,
+        funciones y número de valores) reutilizan el SQL y la plantilla de binds de la primera llamada.
+
+        Args:
+            builder (BKOraQueryBuilder): Builder con el SQL base, los filtros y los valores.
+
+        Returns:
+            tuple[str, dict]: SQL final y parámetros.
+        """
+        if self.statement_cache is None:
+            return builder.build()
+        return self.statement_cache.build_query(builder)
+
+    async def _read(self, query, params, sess, arraysize, prefetchrows):
+        """Ejecuta una lectura completa con ``arraysize``/``prefetchrows`` resueltos (ver `fetch_options`)."""
+        options, tuner = fetch_options(self, query, arraysize, prefetchrows)
+        if sess:
+            result = await sess.execute(self._statement(query), params or {}, execution_options=options)
+        else:
+            async with self.session_scope() as session:
+                result = await session.execute(self._statement(query), params or {}, execution_options=options)
+        keys = result.keys()
+        rows = result.fetchall()
+        if tuner is not None:
+            tuner.record(query, len(rows))
+        return keys, rows
+
+    async def fetch_all(self, query, params=None, sess=None, arraysize=None, prefetchrows=None):
+        """
+        Ejecuta una consulta SQL y devuelve todos los resultados.
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            params (dict, optional): Parámetros para la consulta.
+            sess (AsyncSession, optional): Sesión a reutilizar.
+            arraysize, prefetchrows (int, optional): Filas por round-trip y filas con el execute
+                (ver `BKOraManager.fetch_all`).
+
+        Returns:
+            list[dict]: Lista de filas como diccionarios (clave=nombre de columna).
+        """
+        keys, rows = await self._read(query, params, sess, arraysize, prefetchrows)
+        return [dict(zip(keys, row)) for row in rows]
+
+    async def fetch_one(self, query, params=None, sess=None):
+        """
+        Ejecuta una consulta SQL y devuelve una única fila como diccionario.
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            params (dict, optional): Parámetros para la consulta.
+            sess (AsyncSession, optional): Sesión a reutilizar.
+
+        Returns:
+            dict | None: Fila como diccionario o None si no hay resultados.
+        """
+        if sess:
+            result = await sess.execute(self._statement(query), params or {})
+        else:
+            async with self.session_scope() as session:
+                result = await session.execute(self._statement(query), params or {})
+        row = result.fetchone()
+        if row:
+            return dict(zip(result.keys(), row))
+        return None
+
+    async def fetch_models(self, query, model, params=None, sess=None, trusted=False, arraysize=None,
+                           prefetchrows=None):
+        """
+        Ejecuta una consulta SQL y devuelve los resultados como instancias de ``model``
+        (ver `BKOraManager.fetch_models`).
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            model (object): Clase modelo con ``row_factory()`` o ``from_dict()``.
+            params (dict, optional): Parámetros para la consulta.
+            sess (AsyncSession, optional): Sesión a reutilizar.
+            trusted (bool, optional): Crea los objetos en modo ``trusted`` (sin validación de lectura).
+            arraysize, prefetchrows (int, optional): Ver `fetch_all`.
+
+        Returns:
+            list[object]: Lista de instancias del modelo.
+        """
+        keys, rows = await self._read(query, params, sess, arraysize, prefetchrows)
+        return list(map(row_mapper(model, keys, trusted), rows))
+
+    async def fetch_iter(self, query, params=None, sess=None, arraysize=None, model=None, trusted=False):
+        """
+        Generador asíncrono que devuelve las filas de la consulta en streaming.
+
+        Equivalente a `BKOraManager.fetch_iter` usando ``AsyncSession.stream``.
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            params (dict, optional): Parámetros para la consulta.
+            sess (AsyncSession, optional): Sesión a reutilizar. No se cierra al terminar.
+            arraysize (int, optional): Filas por round-trip. Por defecto ``FETCH_VALUES["arraysize"]``.
+            model (object, optional): Clase modelo con ``from_dict()``.
+            trusted (bool, optional): Crea los objetos en modo ``trusted`` (sin validación de lectura).
+
+        Yields:
+            dict | object: Cada fila como diccionario o como instancia de ``model``.
+        """
+        arraysize = arraysize or FETCH_VALUES.get("arraysize")
+        options = {"yield_per": arraysize, "arraysize": arraysize}
+
+        if sess:
+            async for item in self._iter_result(sess, query, params, options, model, trusted):
+                yield item
+        else:
+            async with self.session_scope() as session:
+                async for item in self._iter_result(session, query, params, options, model, trusted):
+                    yield item
+
+    async def _iter_result(self, session, query, params, options, model, trusted=False):
+        """Recorre un resultado en streaming garantizando el cierre del cursor."""
+        result = await session.stream(self._statement(query), params or {}, execution_options=options)
+        try:
+            keys = tuple(result.keys())
+            build = row_mapper(model, keys, trusted) if model else None
+            async for row in result:
+                yield build(row) if build else dict(zip(keys, row))
+        finally:
+            await result.close()
+
+    async def execute(self, query, params=None, sess=None):
+        """
+        Ejecuta una consulta SQL sin devolver resultados (ideal para INSERT, UPDATE, DELETE).
+
+        Args:
+            query (str): Consulta SQL.
+            params (dict, optional): Parámetros de la consulta.
+            sess (AsyncSession, optional): Sesión a reutilizar.
+        """
+        if sess:
+            await sess.execute(self._statement(query), params or {})
+        else:
+            async with self.session_scope() as session:
+                await session.execute(self._statement(query), params or {})
+
+    async def execute_many(self, query, params_list, sess=None, batch_size=None):
+        """
+        Ejecuta una instrucción DML para una colección de parámetros usando ``executemany``.
+
+        Args:
+            query (str): Consulta SQL DML con binds por nombre.
+            params_list (Iterable[dict]): Parámetros de cada fila.
+            sess (AsyncSession, optional): Sesión a reutilizar.
+            batch_size (int, optional): Filas por lote. Por defecto ``BULK_VALUES["batch_size"]``.
+
+        Returns:
+            dict: ``rowcount`` (int) con las filas afectadas y ``errors`` (list, siempre vacía:
+            la recogida de errores por lote solo está disponible en la API síncrona).
+        """
+        params_list = list(params_list)
+        batch_size = batch_size or BULK_VALUES.get("batch_size")
+
+        if sess:
+            return await self._execute_batches(sess, query, params_list, batch_size)
+        async with self.session_scope() as session:
+            return await self._execute_batches(session, query, params_list, batch_size)
+
+    async def _execute_batches(self, session, query, params_list, batch_size):
+        """Envía ``params_list`` en lotes de ``batch_size`` filas sobre la sesión dada."""
+        summary = {"rowcount": 0, "errors": []}
+        statement = self._statement(query)
+        for start in range(0, len(params_list), batch_size):
+            result = await session.execute(statement, params_list[start:start + batch_size])
+            summary["rowcount"] += max(result.rowcount, 0)
+        return summary
@@ -0,0 +1,504 @@
+"""
+Módulo BKOraAsyncManagerDB
+--------------------------
+
+Este módulo define la clase abstracta `AsyncBKOraManagerDB`, la variante asyncio de `BKOraManagerDB`.
+
+Mantiene el mismo contrato que la versión síncrona (métodos `get_sql_*`, modelo con `to_dict()` y `from_list()`,
+mismos diccionarios de resultado en la familia `getlist*`), pero todos los métodos que acceden a la base de datos
+y los hooks son corrutinas.
+
+Clases:
+    AsyncBKOraManagerDB
+
+Dependencias:
+    - AsyncBKOraManager (de BKLibOra)
+    - BKOraManager_utils (generación de SQL de conteo, paginación y keyset)
+"""
+
+from BKLibOra.config import PAGE_VALUES, FETCH_VALUES, BULK_VALUES
+from BKLibOra.BKOraManager.BKOraAsyncManager import AsyncBKOraManager
+from BKLibOra.BKOraManager.BKOraFetchTuner import page_fetch_options
+from BKLibOra.BKOraManager.BKOraManager_utils import (counter_row_query, range_row_query, counter_window_query,
+                                                      keyset_row_query, keyset_sort_columns, keyset_next_cursor,
+                                                      decode_keyset_cursor, models_from_list, validate_for_write,
+                                                      BKOraCounterExecutor)
+from sqlalchemy.ext.asyncio import AsyncSession
+from abc import abstractmethod
+import time
+import copy
+
+
+class AsyncBKOraManagerDB(AsyncBKOraManager):
+    """
+    Clase base abstracta asíncrona para manejar operaciones CRUD sobre una tabla Oracle usando un modelo.
+
+    Args:
+        connector (AsyncBKOraConnect): Conector asíncrono a la base de datos.
+        model (object): Clase modelo con métodos `to_dict()` y `from_list()`.
+        args (list)
+        kwargs (dict)
+
+    Métodos abstractos:
+        get_sql_select(), get_sql_insert(), get_sql_update(), get_sql_delete()
+
+    Métodos sobrescribibles (corrutinas):
+        before_insert / after_insert, before_update / after_update, before_delete / after_delete
+        y sus versiones por lotes before_<op>_many / after_<op>_many.
+    """
+    DEFAULT_KWARGS = copy.deepcopy(PAGE_VALUES | FETCH_VALUES | BULK_VALUES)
+
+    def __init__(self, connector, model, *args, **kwargs):
+        """
+        Inicializa una instancia de AsyncBKOraManagerDB.
+
+        Args:
+            connector (AsyncBKOraConnect): Conector con método `get_session()`.
+            model (object): Clase modelo con `to_dict()` y `from_list()`.
+        """
+        super().__init__(connector=connector)
+        self.model = model
+        self.args = args
+        self.kwargs = self.DEFAULT_KWARGS | kwargs
+
+    @abstractmethod
+    def get_sql_select(self):
+        """
+        Devuelve la sentencia SELECT y los parámetros asociados.
+
+        Returns:
+            tuple[str, dict]: Consulta SQL y parámetros.
+        """
+        pass
+
+    @abstractmethod
+    def get_sql_insert(self):
+        """
+        Devuelve la sentencia INSERT y los parámetros asociados.
+
+        Returns:
+            tuple[str, dict]: Consulta SQL y parámetros.
+        """
+        pass
+
+    @abstractmethod
+    def get_sql_update(self):
+        """
+        Devuelve la sentencia UPDATE y los parámetros asociados.
+
+        Returns:
+            tuple[str, dict]: Consulta SQL y parámetros.
+        """
+        pass
+
+    @abstractmethod
+    def get_sql_delete(self):
+        """
+        Devuelve la sentencia DELETE y los parámetros asociados.
+
+        Returns:
+            tuple[str, dict]: Consulta SQL y parámetros.
+        """
+        pass
+
+    # ------------------------------------------------------------------ #
+    # Lectura
+    # ------------------------------------------------------------------ #
+    async def getlist(self, session: AsyncSession|None=None) -> list:
+        """
+        Ejecuta la consulta SELECT definida por `get_sql_select()` y convierte los resultados a modelos.
+
+        Returns:
+            list[object]: Lista de instancias del modelo definido.
+        """
+        sql, params = self.get_sql_select()
+        return await self.fetch_models(sql, self.model, params, sess=session
+                                       , trusted=self.kwargs.get("trusted_read"))
+
+    def getlist_iter(self, session: AsyncSession|None=None, arraysize: int|None=None):
+        """
+        Generador asíncrono de instancias del modelo leídas en streaming (ver `BKOraManagerDB.getlist_iter`).
+        """
+        sql, params = self.get_sql_select()
+        arraysize = arraysize or self.kwargs.get("arraysize")
+        return self.fetch_iter(sql, params, sess=session, arraysize=arraysize, model=self.model
+                               , trusted=self.kwargs.get("trusted_read"))
+
+    async def getlist_numerated(self, session: AsyncSession|None=None, count_over: bool|None=None) -> dict:
+        """
+        Devuelve todos los registros, el total de filas y métricas de tiempo
+        (ver `BKOraManagerDB.getlist_numerated`).
+        """
+        time_exec_init = time.perf_counter()
+
+        sql, params = self.get_sql_select()
+
+        time_result_init = time.perf_counter()
+        result_set, count, time_count = await self.fetch_counted(sql, params, session=session, count_over=count_over)
+        result_models = models_from_list(self.model, result_set, self.kwargs.get("trusted_read"))
+        time_result = time.perf_counter() - time_result_init - time_count
+
+        time_exec = time.perf_counter() - time_exec_init
+
+        return {
+            "result": result_models,
+            "result_set": result_set,
+            "count": count,
+            "time": {
+                "time_result": time_result,
+                "time_count": time_count,
+                "time_exec": time_exec,
+            }
+        }
+
+    async def getlist_paginated(self, session: AsyncSession|None=None, count_over: bool|None=None) -> dict:
+        """
+        Obtiene todos los registros divididos en páginas de ``self.kwargs["rows_page"]`` filas
+        (ver `BKOraManagerDB.getlist_paginated`).
+        """
+        time_exec_init = time.perf_counter()
+
+        sql, params = self.get_sql_select()
+
+        time_result_init = time.perf_counter()
+        result_set, count, time_count = await self.fetch_counted(sql, params, session=session, count_over=count_over)
+        result_models = models_from_list(self.model, result_set, self.kwargs.get("trusted_read"))
+        time_result = time.perf_counter() - time_result_init - time_count
+
+        time_page_init = time.perf_counter()
+        chunks = [result_models[i:i + self.kwargs.get("rows_page")]
+                  for i in range(0, len(result_models), self.kwargs.get("rows_page"))]
+        time_page = time.perf_counter() - time_page_init
+
+        time_exec = time.perf_counter() - time_exec_init
+
+        return {
+            "result": chunks,
+            "result_set": result_set,
+            "count": count,
+            "time": {
+                "time_page": time_page,
+                "time_result": time_result,
+                "time_count": time_count,
+                "time_exec": time_exec,
+            }
+        }
+
+    async def getlist_page(self, page_range: dict|None=None, session: AsyncSession|None=None
+                           , count_over: bool|None=None) -> dict:
+        """
+        Devuelve solo la página solicitada mediante ``OFFSET``/``FETCH``
+        (ver `BKOraManagerDB.getlist_page`).
+        """
+        if not page_range:
+            page_range = {
+                "page_init": 0,
+                "page_fin": self.kwargs.get("rows_page"),
+            }
+        return await self._getlist_offset(page_range.get("page_init"), page_range.get("page_fin")
+                                          , session, count_over)
+
+    async def getlist_range(self, _range: tuple|None=None, session: AsyncSession|None=None
+                            , count_over: bool|None=None) -> dict:
+        """
+        Recupera los registros del rango ``(offset, limit)`` (ver `BKOraManagerDB.getlist_range`).
+        """
+        start, fin = _range
+        return await self._getlist_offset(start, fin, session, count_over)
+
+    async def _getlist_offset(self, offset, limit, session, count_over) -> dict:
+        """Implementación común de `getlist_page` y `getlist_range`."""
+        time_exec_init = time.perf_counter()
+
+        sql, params = self.get_sql_select()
+
+        time_result_init = time.perf_counter()
+        result_set, count, time_count = await self.fetch_counted(sql, params, session=session
+                                                                 , offset=offset, limit=limit
+                                                                 , count_over=count_over)
+        result_models = models_from_list(self.model, result_set, self.kwargs.get("trusted_read"))
+        time_result = time.perf_counter() - time_result_init - time_count
+
+        time_exec = time.perf_counter() - time_exec_init
+
+        return {
+            "result": result_models,
+            "result_set": result_set,
+            "count": count,
+            "time": {
+                "time_result": time_result,
+                "time_count": time_count,
+                "time_exec": time_exec,
+            }
+        }
+
+    async def getlist_keyset(self, cursor: str|None=None, sort_key: str|list|None=None
+                             , rows: int|None=None, descending: bool=False
+                             , session: AsyncSession|None=None) -> dict:
+        """
+        Devuelve una página paginando por keyset y el cursor de la siguiente
+        (ver `BKOraManagerDB.getlist_keyset`).
+        """
+        time_exec_init = time.perf_counter()
+
+        sql, params = self.get_sql_select()
+
+        time_result_init = time.perf_counter()
+        result_set, next_cursor = await self.fetch_keyset(sql, params, cursor=cursor, sort_key=sort_key
+                                                          , rows=rows, descending=descending, session=session)
+        result_models = models_from_list(self.model, result_set, self.kwargs.get("trusted_read"))
+        time_result = time.perf_counter() - time_result_init
+
+        time_exec = time.perf_counter() - time_exec_init
+
+        return {
+            "result": result_models,
+            "result_set": result_set,
+            "cursor": next_cursor,
+            "time": {
+                "time_result": time_result,
+                "time_exec": time_exec,
+            }
+        }
+
+    async def fetch_counted(self, sql: str, params: dict|None=None, session: AsyncSession|None=None
+                            , offset: int|None=None, limit: int|None=None, count_over: bool|None=None):
+        """
+        Obtiene las filas (opcionalmente paginadas) y el total de filas
+        (ver `BKOraCounterExecutor.fetch_counted`).
+
+        Returns:
+            tuple[list[dict], int, float]: Filas, total y segundos empleados en el recuento.
+        """
+        if count_over is None:
+            count_over = self.kwargs.get("count_over", False)
+
+        if count_over and offset is None:
+            result_set = await self.fetch_all(sql, params, sess=session)
+            return result_set, len(result_set), 0.0
+
+        if count_over:
+            window_sql = counter_window_query(sql, offset=offset, limit=limit)
+            result_set = await self.fetch_all(window_sql, params, sess=session, **page_fetch_options(limit))
+            if result_set:
+                key = BKOraCounterExecutor.COUNTER_WINDOW_KEY
+                total = result_set[0].get(key)
+                for row in result_set:
+                    row.pop(key, None)
+                return result_set, total, 0.0
+        else:
+            page_sql = sql if offset is None else range_row_query(sql, offset=offset, limit=limit)
+            result_set = None
+
+        time_count_init = time.perf_counter()
+        count = await self.fetch_one(counter_row_query(sql), params, sess=session)
+        time_count = time.perf_counter() - time_count_init
+
+        if result_set is None:
+            page_options = {} if offset is None else page_fetch_options(limit)
+            result_set = await self.fetch_all(page_sql, params, sess=session, **page_options)
+        return result_set, count.get("counter"), time_count
+
+    async def fetch_keyset(self, sql: str, params: dict|None=None, cursor: str|None=None
+                           , sort_key: str|list|None=None, rows: int|None=None
+                           , descending: bool=False, session: AsyncSession|None=None):
+        """
+        Lee una página por keyset y calcula el cursor de la siguiente
+        (ver `BKOraKeysetExecutor.fetch_keyset`).
+
+        Returns:
+            tuple[list[dict], str | None]: Filas de la página y cursor de la siguiente.
+        """
+        rows = rows or self.kwargs.get("rows_page")
+        columns = keyset_sort_columns(self.model, sort_key)
+        params = dict(params or {})
+
+        if cursor:
+            values = decode_keyset_cursor(cursor, columns, descending)
+            params.update({f"keyset_{i}": value for i, value in enumerate(values)})
+
+        sql = keyset_row_query(sql, columns, limit=rows + 1, descending=descending, seek=bool(cursor))
+        result_set = await self.fetch_all(sql, params, sess=session, **page_fetch_options(rows + 1))
+        return keyset_next_cursor(result_set, columns, rows, descending)
+
+    # ------------------------------------------------------------------ #
+    # Escritura
+    # ------------------------------------------------------------------ #
+    async def insert_model(self, objmodel: object|None=None, session: AsyncSession|None=None, only: bool=False):
+        """
+        Inserta una instancia del modelo en la base de datos.
+
+        Args:
+            objmodel (object): Instancia del modelo a insertar.
+        """
+        sql, _ = self.get_sql_insert()
+        objmodel = await self.before_insert(objmodel, session=session)
+        await self.execute(sql, validate_for_write(objmodel).to_dict(), sess=session)
+        objmodel = await self.after_insert(objmodel, session=session)
+
+        if only:
+            return objmodel
+
+    async def update_model(self, objmodel: object|None=None, session: AsyncSession|None=None, only: bool=False):
+        """
+        Actualiza una instancia del modelo en la base de datos.
+
+        Args:
+            objmodel (object): Instancia del modelo a actualizar.
+        """
+        sql, _ = self.get_sql_update()
+        objmodel = await self.before_update(objmodel, session=session)
+        await self.execute(sql, validate_for_write(objmodel).to_dict(), sess=session)
+        objmodel = await self.after_update(objmodel, session=session)
+
+        if only:
+            return objmodel
+
+    async def delete_model(self, objmodel: object|None=None, session: AsyncSession|None=None, only: bool=False):
+        """
+        Elimina una instancia del modelo en la base de datos.
+
+        Args:
+            objmodel (object): Instancia del modelo a eliminar.
+        """
+        sql, _ = self.get_sql_delete()
+        objmodel = await self.before_delete(objmodel, session=session)
+        await self.execute(sql, objmodel.to_dict(), sess=session)
+        objmodel = await self.after_delete(objmodel, session=session)
+
+        if only:
+            return objmodel
+
+    async def insert_many(self, objmodels, session: AsyncSession|None=None
+                          , batch_size: int|None=None, only: bool=False) -> dict:
+        """
+        Inserta una colección de instancias del modelo mediante ``executemany``
+        (ver `BKOraManagerDB.insert_many`).
+        """
+        sql, _ = self.get_sql_insert()
+        return await self._execute_model_batch(sql, objmodels, self.before_insert_many, self.after_insert_many
+                                               , session, batch_size, only, validate=True)
+
+    async def update_many(self, objmodels, session: AsyncSession|None=None
+                          , batch_size: int|None=None, only: bool=False) -> dict:
+        """
+        Actualiza una colección de instancias del modelo mediante ``executemany``.
+        """
+        sql, _ = self.get_sql_update()
+        return await self._execute_model_batch(sql, objmodels, self.before_update_many, self.after_update_many
+                                               , session, batch_size, only, validate=True)
+
+    async def delete_many(self, objmodels, session: AsyncSession|None=None
+                          , batch_size: int|None=None, only: bool=False) -> dict:
+        """
+        Elimina una colección de instancias del modelo mediante ``executemany``.
+        """
+        sql, _ = self.get_sql_delete()
+        return await self._execute_model_batch(sql, objmodels, self.before_delete_many, self.after_delete_many
+                                               , session, batch_size, only)
+
+    async def _execute_model_batch(self, sql, objmodels, before, after, session, batch_size, only, validate=False):
+        """Ejecuta ``sql`` por lotes para una colección de modelos aplicando los hooks de lote."""
+        time_exec_init = time.perf_counter()
+
+        time_hooks_init = time.perf_counter()
+        objmodels = await before(list(objmodels), session=session)
+        if validate:
+            objmodels = [validate_for_write(objmodel) for objmodel in objmodels]
+        params_list = [objmodel.to_dict() for objmodel in objmodels]
+        time_hooks = time.perf_counter() - time_hooks_init
+
+        time_exec_many_init = time.perf_counter()
+        summary = await self.execute_many(sql, params_list, sess=session
+                                          , batch_size=batch_size or self.kwargs.get("batch_size"))
+        time_exec_many = time.perf_counter() - time_exec_many_init
+
+        time_hooks_init = time.perf_counter()
+        objmodels = await after(objmodels, session=session)
+        time_hooks += time.perf_counter() - time_hooks_init
+
+        summary["time"] = {
+            "time_hooks": time_hooks,
+            "time_exec_many": time_exec_many,
+            "time_exec": time.perf_counter() - time_exec_init,
+        }
+        if only:
+            summary["result"] = objmodels
+        return summary
+
+    # ------------------------------------------------------------------ #
+    # Rutinas almacenadas
+    # ------------------------------------------------------------------ #
+    async def call_procedure(self, proc_name: str, params: dict|None=None, session: AsyncSession|None=None):
+        """
+        Ejecuta un procedimiento almacenado en Oracle (ver `BKOraRoutineExecutor.call_procedure`).
+        """
+        params = params or {}
+        if not isinstance(params, dict):
+            raise ValueError("Los parámetros deben ser un diccionario")
+
+        placeholders = ', '.join(f':{k}' for k in params)
+        await self.execute(f"BEGIN {proc_name}({placeholders}); END;", params, sess=session)
+
+    async def call_function(self, func_name: str, params: dict|None=None, session: AsyncSession|None=None):
+        """
+        Ejecuta una función almacenada que retorna un escalar (ver `BKOraRoutineExecutor.call_function`).
+        """
+        params = params or {}
+        if not isinstance(params, dict):
+            raise ValueError("Los parámetros deben ser un diccionario")
+
+        placeholders = ', '.join(f':{k}' for k in params)
+        result = await self.fetch_one(f"SELECT {func_name}({placeholders}) AS result FROM DUAL", params, sess=session)
+        return result.get('result') if result else None
+
+    # ------------------------------------------------------------------ #
+    # Hooks
+    # ------------------------------------------------------------------ #
+    async def before_insert(self, objmodel: object|None=None, session: AsyncSession|None=None):
+        """Hook opcional: lógica previa a un INSERT."""
+        return objmodel
+
+    async def after_insert(self, objmodel: object|None=None, session: AsyncSession|None=None):
+        """Hook opcional: lógica posterior a un INSERT."""
+        return objmodel
+
+    async def before_update(self, objmodel: object|None=None, session: AsyncSession|None=None):
+        """Hook opcional: lógica previa a un UPDATE."""
+        return objmodel
+
+    async def after_update(self, objmodel: object|None=None, session: AsyncSession|None=None):
+        """Hook opcional: lógica posterior a un UPDATE."""
+        return objmodel
+
+    async def before_delete(self, objmodel: object|None=None, session: AsyncSession|None=None):
+        """Hook opcional: lógica previa a un DELETE."""
+        return objmodel
+
+    async def after_delete(self, objmodel: object|None=None, session: AsyncSession|None=None):
+        """Hook opcional: lógica posterior a un DELETE."""
+        return objmodel
+
+    async def before_insert_many(self, objmodels: list, session: AsyncSession|None=None):
+        """Hook opcional: lógica previa a un INSERT por lotes. Por defecto aplica ``before_insert`` a cada objeto."""
+        return [await self.before_insert(objmodel, session=session) for objmodel in objmodels]
+
+    async def after_insert_many(self, objmodels: list, session: AsyncSession|None=None):
+        """Hook opcional: lógica posterior a un INSERT por lotes. Por defecto aplica ``after_insert`` a cada objeto."""
+        return [await self.after_insert(objmodel, session=session) for objmodel in objmodels]
+
+    async def before_update_many(self, objmodels: list, session: AsyncSession|None=None):
+        """Hook opcional: lógica previa a un UPDATE por lotes. Por defecto aplica ``before_update`` a cada objeto."""
+        return [await self.before_update(objmodel, session=session) for objmodel in objmodels]
+
+    async def after_update_many(self, objmodels: list, session: AsyncSession|None=None):
+        """Hook opcional: lógica posterior a un UPDATE por lotes. Por defecto aplica ``after_update`` a cada objeto."""
+        return [await self.after_update(objmodel, session=session) for objmodel in objmodels]
+
+    async def before_delete_many(self, objmodels: list, session: AsyncSession|None=None):
+        """Hook opcional: lógica previa a un DELETE por lotes. Por defecto aplica ``before_delete`` a cada objeto."""
+        return [await self.before_delete(objmodel, session=session) for objmodel in objmodels]
+
+    async def after_delete_many(self, objmodels: list, session: AsyncSession|None=None):
+        """Hook opcional: lógica posterior a un DELETE por lotes. Por defecto aplica ``after_delete`` a cada objeto."""
+        return [await self.after_delete(objmodel, session=session) for objmodel in objmodels]
@@ -0,0 +1,231 @@
+"""
+Módulo BKOraColumnar
+--------------------
+
+Este módulo construye resultados en formato columnar (un array tipado por columna) a partir de un cursor,
+pensados para procesos analíticos en los que no interesa materializar un objeto Python por fila.
+
+Las columnas numéricas, booleanas y de fecha se convierten a arrays de NumPy con una máscara de nulos;
+el resto se guarda como arrays ``object``. La conversión se hace por lotes, de modo que en memoria solo
+conviven los arrays ya construidos y las filas del lote en curso.
+
+NumPy es una dependencia opcional (``pip install BKLibOra[columnar]``) y solo se importa al usarse.
+
+Clases:
+    BKOraColumnarResult
+    BKOraColumnarBuilder
+
+Funciones:
+    columnar_dtypes(model)
+"""
+
+from BKLibOra.utils import require_numpy
+from datetime import date, datetime
+from decimal import Decimal
+
+# Correspondencia entre el tipo Python declarado en la columna y el dtype de NumPy
+PY_DTYPES = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    Decimal: "float64",
+    datetime: "datetime64[us]",
+    date: "datetime64[D]",
+}
+
+# Correspondencia entre los tipos ricos de BKOraModelComplex y el dtype de NumPy
+BK_DTYPES = {
+    "BKNumber": "int64",
+    "BKFloat": "float64",
+    "BKDate": "datetime64[D]",
+    "BKDatetime": "datetime64[us]",
+}
+
+
+def columnar_dtypes(model) -> dict:
+    """
+    Deduce el dtype de NumPy de cada columna a partir de las columnas declaradas en el modelo.
+
+    Usa ``BKOraColumn.type`` en `BKOraModelDB` y el tipo de campo (`BKNumber`, `BKFloat`, `BKDate`…)
+    en `BKOraModelComplex`. Las columnas de texto u otros tipos se devuelven como ``object``.
+
+    Args:
+        model (type): Clase modelo declarada.
+
+    Returns:
+        dict[str, str]: ``{columna: dtype}``.
+    """
+    dtypes = {}
+    source = getattr(model, "_bk_source", None) or model
+    for attr_name, field in vars(source).items():
+        if not hasattr(field, "name") or not hasattr(field, "primary_key"):
+            continue
+        column = field.name or attr_name
+        if hasattr(field, "type"):
+            dtypes[column] = PY_DTYPES.get(field.type, "object")
+        else:
+            dtypes[column] = BK_DTYPES.get(type(field).__name__, "object")
+    return dtypes
+
+
+class BKOraColumnarResult:
+    """
+    Resultado de una consulta en formato columnar.
+
+    Atributos:
+        columns (list[str]): Nombres de columna en el orden del cursor.
+        arrays (dict[str, numpy.ndarray]): Valores de cada columna. En las columnas tipadas los
+            nulos se rellenan con el valor neutro del dtype (0, ``False`` o ``NaT``).
+        masks (dict[str, numpy.ndarray]): Máscara booleana de nulos de cada columna.
+
+    Métodos:
+        column(name, masked=False): Devuelve el array de una columna (opcionalmente como ``MaskedArray``).
+        to_list(): Devuelve las filas como lista de diccionarios.
+    """
+
+    def __init__(self, columns, arrays, masks):
+        self.columns = list(columns)
+        self.arrays = arrays
+        self.masks = masks
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(self.arrays[self.columns[0]])
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def __contains__(self, name):
+        return name in self.arrays
+
+    def column(self, name, masked=False):
+        """
+        Devuelve los valores de una columna.
+
+        Args:
+            name (str): Nombre de la columna.
+            masked (bool, optional): Si es `True` se devuelve un ``numpy.ma.MaskedArray`` con los nulos enmascarados.
+
+        Returns:
+            numpy.ndarray: Valores de la columna.
+        """
+        if masked:
+            np = require_numpy("Los resultados columnares")
+            return np.ma.MaskedArray(self.arrays[name], mask=self.masks[name])
+        return self.arrays[name]
+
+    def to_list(self) -> list:
+        """
+        Convierte el resultado en filas ``list[dict]`` (con ``None`` en los nulos).
+
+        Returns:
+            list[dict]: Filas del resultado.
+        """
+        values = []
+        for name in self.columns:
+            column = self.arrays[name].tolist()
+            for index in self.masks[name].nonzero()[0]:
+                column[index] = None
+            values.append(column)
+        return [dict(zip(self.columns, row)) for row in zip(*values)]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}: {len(self)} filas x {len(self.columns)} columnas"
+
+
+class BKOraColumnarBuilder:
+    """
+    Acumula lotes de filas y los convierte en arrays columnares.
+
+    Args:
+        columns (Iterable[str]): Nombres de columna del resultado.
+        dtypes (dict[str, str], optional): dtype de NumPy por columna. Las columnas sin dtype
+            se infieren de los valores no nulos del primer lote.
+    """
+
+    def __init__(self, columns, dtypes=None):
+        self.np = require_numpy("Los resultados columnares")
+        self.columns = list(columns)
+        self.dtypes = dict(dtypes or {})
+        self.chunks = {name: [] for name in self.columns}
+        self.mask_chunks = {name: [] for name in self.columns}
+
+    def _infer_dtype(self, values):
+        types = {type(value) for value in values if value is not None}
+        if not types:
+            return "object"
+        if len(types) == 1:
+            return PY_DTYPES.get(types.pop(), "object")
+        if types <= {int, float, Decimal}:
+            return "float64"
+        return "object"
+
+    def _fill_value(self, dtype):
+        kind = self.np.dtype(dtype).kind
+        if kind == "b":
+            return False
+        if kind == "M":
+            return None
+        return 0
+
+    def _convert(self, values, dtype):
+        np = self.np
+        mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+        if dtype == "object":
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            return array, mask
+        if mask.any():
+            fill = self._fill_value(dtype)
+            values = [fill if value is None else value for value in values]
+        if np.dtype(dtype).kind == "i" and any(type(value) is not int for value in values):
+            # NumPy trunca en silencio los decimales al convertir a entero: el lote pasa a float64
+            dtype = "float64"
+        try:
+            return np.array(values, dtype=dtype), mask
+        except (TypeError, ValueError, OverflowError):
+            # Valor incompatible con el dtype declarado (p. ej. texto en una columna numérica):
+            # el lote se guarda como object y la concatenación final promociona la columna entera
+            array = np.empty(len(values), dtype=object)
+            array[:] = [None if null else value for value, null in zip(values, mask)]
+            return array, mask
+
+    def add_batch(self, rows):
+        """
+        Convierte un lote de filas (tuplas) y lo añade al resultado.
+
+        Args:
+            rows (Sequence[tuple]): Filas del lote, en el orden de ``columns``.
+        """
+        if not rows:
+            return
+        for index, values in enumerate(zip(*rows)):
+            name = self.columns[index]
+            if name not in self.dtypes:
+                self.dtypes[name] = self._infer_dtype(values)
+            array, mask = self._convert(list(values), self.dtypes[name])
+            self.chunks[name].append(array)
+            self.mask_chunks[name].append(mask)
+
+    def build(self) -> BKOraColumnarResult:
+        """
+        Concatena los lotes y devuelve el resultado columnar.
+
+        Returns:
+            BKOraColumnarResult: Resultado construido.
+        """
+        np = self.np
+        arrays, masks = {}, {}
+        for name in self.columns:
+            chunks = self.chunks[name]
+            if not chunks:
+                arrays[name] = np.empty(0, dtype=self.dtypes.get(name, "object"))
+                masks[name] = np.empty(0, dtype=bool)
+            elif len(chunks) == 1:
+                arrays[name], masks[name] = chunks[0], self.mask_chunks[name][0]
+            else:
+                arrays[name] = np.concatenate(chunks)
+                masks[name] = np.concatenate(self.mask_chunks[name])
+            self.chunks[name] = self.mask_chunks[name] = None
+        return BKOraColumnarResult(self.columns, arrays, masks)
@@ -94,13 +94,14 @@ class BKOraDynamicManager(BKOraManager):
     ) -> Tuple[str, Dict[str, Any]]:
         """Construye el SQL final y el diccionario de parámetros.
 
-        1. Si se aportan *filters* y *values*, se usa ``BKOraQueryBuilder``.
+        1. Si se aportan *filters* y *values*, se usa ``BKOraQueryBuilder`` (a través
+           de la caché de sentencias, ver :meth:`BKOraManager.build_query`).
         2. Combina los parámetros generados con *extra_params* (si existen,
            estas últimas prevalecen en caso de duplicidad).
         """
         if filters and values:
             qb = BKOraQueryBuilder(base_sql, filters=filters, values=values)
-            sql, qb_params = qb.build()
+            sql, qb_params = self.build_query(qb)
         else:
             sql, qb_params = base_sql, {}
 
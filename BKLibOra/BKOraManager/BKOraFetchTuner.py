@@ -0,0 +1,187 @@
+"""
+Módulo BKOraFetchTuner
+----------------------
+
+Este módulo resuelve el ``arraysize`` y el ``prefetchrows`` de cada lectura y define el ajuste adaptativo.
+
+El tamaño de lote de una lectura se decide por niveles, de más a menos específico:
+
+1. El argumento de la llamada (``fetch_all(..., arraysize=n, prefetchrows=m)``), incluido el que fijan
+   automáticamente las lecturas paginadas (``getlist_page``, ``getlist_range``, ``getlist_keyset``).
+2. Las opciones del manager (``fetch_arraysize`` / ``prefetchrows`` en ``kwargs``).
+3. `BKOraFetchTuner`, si el manager tiene uno (``manager.fetch_tuner``), a partir de lo observado
+   en las ejecuciones anteriores de la misma consulta.
+4. Los valores del conector (``BKOraConnect(arraysize=..., prefetchrows=...)``, opciones de
+   ejecución del motor) o, en su defecto, los del driver (100 y 2 filas en ``oracledb``).
+
+Clases:
+    BKOraFetchTuner
+
+Funciones:
+    fetch_options(manager, query, arraysize, prefetchrows)
+    page_fetch_options(rows)
+"""
+
+from BKLibOra.config import FETCH_TUNER_VALUES
+from collections import OrderedDict
+import threading
+
+
+def page_fetch_options(rows: int | None) -> dict:
+    """
+    Opciones para leer un resultado de tamaño conocido en un único round-trip.
+
+    Con ``prefetchrows`` y ``arraysize`` una fila por encima del tamaño, el driver recibe todas
+    las filas con el propio execute y detecta el final del cursor sin otra ida y vuelta.
+
+    Args:
+        rows (int | None): Filas máximas del resultado (tamaño de la página).
+
+    Returns:
+        dict: ``{"arraysize": rows + 1, "prefetchrows": rows + 1}``, o vacío si ``rows`` es ``None``.
+    """
+    if not rows:
+        return {}
+    return {"arraysize": rows + 1, "prefetchrows": rows + 1}
+
+
+def fetch_options(manager, query, arraysize=None, prefetchrows=None) -> tuple:
+    """
+    Resuelve las opciones de ejecución de una lectura de ``manager`` (ver los niveles del módulo).
+
+    Args:
+        manager (BKOraManager | BKOraAsyncManager): Manager que ejecuta la lectura.
+        query (str | TextClause): Consulta; clave del ajuste adaptativo.
+        arraysize (int, optional): Filas por round-trip indicadas en la llamada.
+        prefetchrows (int, optional): Filas con el execute indicadas en la llamada.
+
+    Returns:
+        tuple[dict, BKOraFetchTuner | None]: Opciones de ejecución (``arraysize`` / ``prefetchrows``)
+        y el ajustador al que hay que comunicar las filas leídas (``None`` si el tamaño no es adaptativo).
+    """
+    kwargs = getattr(manager, "kwargs", None)
+    if kwargs:
+        if arraysize is None:
+            arraysize = kwargs.get("fetch_arraysize")
+        if prefetchrows is None:
+            prefetchrows = kwargs.get("prefetchrows")
+
+    tuner = manager.fetch_tuner if arraysize is None else None
+    if tuner is not None:
+        arraysize, suggested = tuner.suggest(query)
+        if prefetchrows is None:
+            prefetchrows = suggested
+
+    options = {}
+    if arraysize is not None:
+        options["arraysize"] = arraysize
+    if prefetchrows is not None:
+        options["prefetchrows"] = prefetchrows
+    return options, tuner
+
+
+class BKOraFetchTuner:
+    """
+    Ajuste adaptativo del tamaño de lote por consulta.
+
+    Recuerda, por texto SQL, el ``arraysize`` con el que conviene leer cada consulta:
+
+    - Si una ejecución devuelve al menos un lote completo (necesitó más de un round-trip), el
+      ``arraysize`` de la siguiente se multiplica por ``growth`` hasta ``max_arraysize``; una
+      consulta que sigue llenando lotes sigue creciendo.
+    - Si el resultado cabe en un lote y no pasa de ``max_prefetchrows`` filas, la siguiente
+      ejecución pide esas filas (más una) con el propio execute (``prefetchrows``).
+
+    Las consultas nuevas se leen con los valores del conector o del driver y se supone que su
+    ``arraysize`` es ``initial_arraysize``. Se comparte entre managers asignándolo como atributo
+    de clase o de instancia (``BKOraManager.fetch_tuner = BKOraFetchTuner()``).
+
+    Args:
+        initial_arraysize (int, optional): Por defecto ``FETCH_TUNER_VALUES["initial_arraysize"]``.
+        max_arraysize (int, optional): Por defecto ``FETCH_TUNER_VALUES["max_arraysize"]``.
+        growth (int, optional): Por defecto ``FETCH_TUNER_VALUES["growth"]``.
+        max_prefetchrows (int, optional): Por defecto ``FETCH_TUNER_VALUES["max_prefetchrows"]``.
+        maxsize (int, optional): Consultas recordadas. Por defecto ``FETCH_TUNER_VALUES["maxsize"]``.
+
+    Raises:
+        ValueError: Si ``growth`` es menor que 2 o ``max_arraysize`` menor que ``initial_arraysize``.
+    """
+
+    def __init__(self, initial_arraysize=None, max_arraysize=None, growth=None, max_prefetchrows=None
+                 , maxsize=None):
+        self.initial_arraysize = initial_arraysize or FETCH_TUNER_VALUES.get("initial_arraysize")
+        self.max_arraysize = max_arraysize or FETCH_TUNER_VALUES.get("max_arraysize")
+        self.growth = growth or FETCH_TUNER_VALUES.get("growth")
+        self.max_prefetchrows = (FETCH_TUNER_VALUES.get("max_prefetchrows")
+                                 if max_prefetchrows is None else max_prefetchrows)
+        self.maxsize = maxsize or FETCH_TUNER_VALUES.get("maxsize")
+        if self.growth < 2:
+            raise ValueError("growth debe ser al menos 2")
+        if self.max_arraysize < self.initial_arraysize:
+            raise ValueError("max_arraysize no puede ser menor que initial_arraysize")
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.grown = 0
+
+    def suggest(self, query) -> tuple:
+        """
+        Devuelve el tamaño de lote recomendado para ``query``.
+
+        Returns:
+            tuple[int | None, int | None]: ``(arraysize, prefetchrows)``; ``None`` deja el valor
+            del conector o del driver.
+        """
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is None:
+                return None, None
+            self._entries.move_to_end(query)
+            return entry
+
+    def record(self, query, rows: int):
+        """
+        Registra que una ejecución de ``query`` leyó ``rows`` filas y ajusta la siguiente.
+
+        Args:
+            query (str | TextClause): Consulta ejecutada.
+            rows (int): Filas leídas.
+        """
+        with self._lock:
+            arraysize, _ = self._entries.get(query) or (None, None)
+            current = arraysize or self.initial_arraysize
+            if rows >= current:
+                arraysize = min(current * self.growth, self.max_arraysize)
+                prefetchrows = None
+                if arraysize != current:
+                    self.grown += 1
+            else:
+                prefetchrows = rows + 1 if rows < self.max_prefetchrows else None
+            self._entries[query] = (arraysize, prefetchrows)
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """
+        Devuelve el estado del ajustador.
+
+        Returns:
+            dict: ``size`` (consultas recordadas), ``maxsize``, ``grown`` (veces que se amplió un
+            ``arraysize``) y ``max_arraysize_reached`` (consultas en el límite).
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "grown": self.grown,
+                "max_arraysize_reached": sum(1 for arraysize, _ in self._entries.values()
+                                             if arraysize == self.max_arraysize),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.grown = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={len(self._entries)}, max_arraysize={self.max_arraysize})"
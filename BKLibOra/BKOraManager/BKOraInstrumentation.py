@@ -0,0 +1,390 @@
+"""
+Módulo BKOraInstrumentation
+---------------------------
+
+Este módulo define la instrumentación opcional de las consultas de `BKOraManager`: hooks antes y después
+de cada llamada y un agregador en memoria con histogramas de latencia por sentencia.
+
+Las sentencias se agrupan por su «huella» (`sql_fingerprint`): el SQL normalizado sin literales, con los
+binds y las listas ``IN`` colapsados, de modo que todas las variantes de una misma consulta suman en
+el mismo histograma.
+
+Por cada huella se acumulan llamadas, errores, latencia (histograma por buckets, mínimo, máximo, media y
+percentiles aproximados), filas, bytes leídos (estimados a partir de una muestra de filas) y el tiempo de
+espera por una conexión del pool (``BKOraPoolStats``).
+
+Se activa asignando una instancia al manager, a su clase o a `BKOraManager` para todos:
+
+    BKOraManager.instrumentation = BKOraInstrumentation()
+    ...
+    BKOraManager.instrumentation.top(10)
+
+Con ``instrumentation = None`` (por defecto) las consultas no pasan por este módulo.
+
+Clases:
+    BKOraLatencyHistogram
+    BKOraQueryContext
+    BKOraStatementStats
+    BKOraInstrumentation
+
+Funciones:
+    sql_fingerprint(sql)
+    operation_label(name)
+"""
+
+from BKLibOra.config import INSTRUMENTATION_VALUES
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from bisect import bisect_left
+import threading
+import time
+import re
+
+# Nombre de operación impuesto por `operation_label` (p. ej. ``call_procedure`` sobre ``execute``)
+_operation_label: ContextVar = ContextVar("bk_operation_label", default=None)
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"(?<![\w:$#])\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b")
+_BINDS = re.compile(r":\w+")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=INSTRUMENTATION_VALUES.get("fingerprint_cache"))
+def sql_fingerprint(sql: str) -> str:
+    """
+    Normaliza un SQL para agrupar sus ejecuciones.
+
+    Quita comentarios, sustituye literales y binds por ``?``, colapsa las listas ``(?, ?, ...)`` en
+    ``(?...)``, compacta los espacios y pasa a mayúsculas.
+
+    Args:
+        sql (str): Texto SQL.
+
+    Returns:
+        str: Huella de la sentencia.
+
+    Examples:
+        >>> sql_fingerprint("select * from t where id in (:id, :id_copy1) and name = 'x'")
+        'SELECT * FROM T WHERE ID IN (?...) AND NAME = ?'
+    """
+    sql = _COMMENTS.sub(" ", sql)
+    sql = _STRINGS.sub("?", sql)
+    sql = _BINDS.sub("?", sql)
+    sql = _NUMBERS.sub("?", sql)
+    sql = _LISTS.sub("(?...)", sql)
+    return _SPACES.sub(" ", sql).strip().upper()
+
+
+@contextmanager
+def operation_label(name: str):
+    """
+    Context manager que etiqueta con ``name`` las operaciones instrumentadas de su interior.
+
+    Lo usan, por ejemplo, ``call_procedure`` y ``call_function`` para que sus llamadas a
+    ``execute`` / ``fetch_one`` se registren con el nombre de la rutina.
+    """
+    token = _operation_label.set(name)
+    try:
+        yield
+    finally:
+        _operation_label.reset(token)
+
+
+def _row_bytes(row) -> int:
+    """Tamaño aproximado en bytes de los valores de una fila (tupla, ``Row`` o diccionario)."""
+    values = row.values() if isinstance(row, dict) else row
+    size = 0
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (str, bytes, bytearray)):
+            size += len(value)
+        else:
+            size += 8
+    return size
+
+
+class BKOraLatencyHistogram:
+    """
+    Histograma de latencias con buckets fijos (en milisegundos).
+
+    Args:
+        buckets_ms (Sequence[float], optional): Límites superiores de los buckets, crecientes.
+            Por defecto ``INSTRUMENTATION_VALUES["buckets_ms"]``. Se añade un bucket final sin límite.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total", "min", "max")
+
+    def __init__(self, buckets_ms=None):
+        self.bounds = tuple(buckets_ms or INSTRUMENTATION_VALUES.get("buckets_ms"))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, seconds: float):
+        """Añade una latencia en segundos."""
+        ms = seconds * 1000.0
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p: float) -> float | None:
+        """
+        Percentil aproximado en segundos (límite superior del bucket que lo contiene, acotado por el máximo).
+
+        Args:
+            p (float): Percentil entre 0 y 100.
+        """
+        if not self.count:
+            return None
+        target = self.count * p / 100.0
+        accumulated = 0
+        for index, count in enumerate(self.counts):
+            accumulated += count
+            if accumulated >= target and count:
+                if index == len(self.bounds):
+                    return self.max
+                return min(self.bounds[index] / 1000.0, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        labels = [f"<={bound:g}ms" for bound in self.bounds] + [f">{self.bounds[-1]:g}ms"]
+        return {
+            "count": self.count,
+            "total": self.total,
+            "avg": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": {label: count for label, count in zip(labels, self.counts) if count},
+        }
+
+
+class BKOraQueryContext:
+    """
+    Datos de una llamada instrumentada, recibidos por los hooks.
+
+    Los hooks ``before`` lo reciben con ``operation``, ``sql``, ``fingerprint``, ``params`` y ``manager``;
+    los ``after`` además con ``elapsed``, ``rows``, ``bytes``, ``pool_wait`` y ``error`` (o ``None``).
+    """
+
+    __slots__ = ("operation", "sql", "fingerprint", "params", "manager", "started", "elapsed",
+                 "rows", "bytes", "pool_wait", "error")
+
+    def __init__(self, operation, sql, params, manager):
+        self.operation = operation
+        self.sql = sql
+        self.fingerprint = sql_fingerprint(sql) if isinstance(sql, str) else str(sql)
+        self.params = params
+        self.manager = manager
+        self.started = None
+        self.elapsed = None
+        self.rows = 0
+        self.bytes = 0
+        self.pool_wait = 0.0
+        self.error = None
+
+    def set_rows(self, rows, sample_size=None):
+        """
+        Registra el resultado: un número de filas afectadas o la secuencia de filas leídas.
+
+        Con una secuencia, los bytes se estiman a partir de las primeras ``sample_size`` filas.
+        """
+        if isinstance(rows, int):
+            self.rows = max(rows, 0)
+            return
+        self.rows = len(rows)
+        if not self.rows:
+            return
+        sample_size = sample_size or INSTRUMENTATION_VALUES.get("size_sample")
+        sample = rows[:sample_size]
+        self.bytes = int(sum(map(_row_bytes, sample)) * self.rows / len(sample))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.operation}, {self.fingerprint[:60]!r})"
+
+
+class BKOraStatementStats:
+    """Métricas acumuladas de una huella de sentencia."""
+
+    __slots__ = ("fingerprint", "sample_sql", "operations", "calls", "errors", "rows", "bytes",
+                 "pool_wait", "latency", "last_error")
+
+    def __init__(self, fingerprint, sample_sql, buckets_ms=None):
+        self.fingerprint = fingerprint
+        self.sample_sql = sample_sql
+        self.operations = {}
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.bytes = 0
+        self.pool_wait = 0.0
+        self.latency = BKOraLatencyHistogram(buckets_ms)
+        self.last_error = None
+
+    def add(self, ctx: BKOraQueryContext):
+        self.calls += 1
+        self.operations[ctx.operation] = self.operations.get(ctx.operation, 0) + 1
+        self.rows += ctx.rows
+        self.bytes += ctx.bytes
+        self.pool_wait += ctx.pool_wait
+        self.latency.record(ctx.elapsed)
+        if ctx.error is not None:
+            self.errors += 1
+            self.last_error = repr(ctx.error)
+
+    def to_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "sample_sql": self.sample_sql,
+            "operations": dict(self.operations),
+            "calls": self.calls,
+            "errors": self.errors,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "pool_wait": self.pool_wait,
+            "latency": self.latency.to_dict(),
+            "last_error": self.last_error,
+        }
+
+
+class BKOraInstrumentation:
+    """
+    Hooks y agregador en memoria de las consultas de los managers.
+
+    Args:
+        buckets_ms (Sequence[float], optional): Buckets de los histogramas. Por defecto
+            ``INSTRUMENTATION_VALUES["buckets_ms"]``.
+        max_statements (int, optional): Huellas distintas que se conservan; las nuevas por encima del
+            límite se acumulan en la huella ``"<otras>"``. Por defecto ``INSTRUMENTATION_VALUES["max_statements"]``.
+        aggregate (bool, optional): Si ``False`` solo se llaman los hooks (sin agregador).
+
+    Métodos:
+        add_before_hook(callback) / add_after_hook(callback): Hooks que reciben un `BKOraQueryContext`.
+        observe(operation, sql, params, manager): Context manager que mide una llamada.
+        stats(fingerprint=None): Métricas de todas las huellas o de una.
+        top(n, by): Las ``n`` huellas con mayor ``total`` de latencia (o ``p95``, ``calls``, ``errors``…).
+        reset(): Vacía el agregador.
+    """
+
+    OTHER = "<otras>"
+
+    def __init__(self, buckets_ms=None, max_statements=None, aggregate=True):
+        self.buckets_ms = tuple(buckets_ms or INSTRUMENTATION_VALUES.get("buckets_ms"))
+        self.max_statements = max_statements or INSTRUMENTATION_VALUES.get("max_statements")
+        self.aggregate = aggregate
+        self.before_hooks = []
+        self.after_hooks = []
+        self._statements = {}
+        self._lock = threading.Lock()
+
+    def add_before_hook(self, callback):
+        """Añade ``callback(ctx)``, llamado antes de ejecutar cada consulta."""
+        self.before_hooks.append(callback)
+
+    def add_after_hook(self, callback):
+        """Añade ``callback(ctx)``, llamado tras cada consulta (también si ha fallado)."""
+        self.after_hooks.append(callback)
+
+    @contextmanager
+    def observe(self, operation, sql, params=None, manager=None):
+        """
+        Mide la llamada ejecutada en su interior.
+
+        El bloque debe informar del resultado con ``ctx.set_rows(...)``. El tiempo de espera por
+        conexión se toma de ``manager.connector.pool_stats`` si la llamada hizo un checkout del pool.
+
+        Yields:
+            BKOraQueryContext: Contexto de la llamada.
+        """
+        ctx = BKOraQueryContext(_operation_label.get() or operation, sql, params, manager)
+        pool_stats = getattr(getattr(manager, "connector", None), "pool_stats", None)
+        if pool_stats is not None:
+            pool_stats.pop_last_wait()
+        for hook in self.before_hooks:
+            hook(ctx)
+        ctx.started = time.perf_counter()
+        try:
+            yield ctx
+        except BaseException as e:
+            ctx.error = e
+            raise
+        finally:
+            ctx.elapsed = time.perf_counter() - ctx.started
+            if pool_stats is not None:
+                ctx.pool_wait = pool_stats.pop_last_wait()
+            if self.aggregate:
+                self.record(ctx)
+            for hook in self.after_hooks:
+                hook(ctx)
+
+    def record(self, ctx: BKOraQueryContext):
+        """Acumula un `BKOraQueryContext` ya medido."""
+        with self._lock:
+            stats = self._statements.get(ctx.fingerprint)
+            if stats is None:
+                fingerprint = ctx.fingerprint
+                if len(self._statements) >= self.max_statements:
+                    fingerprint = self.OTHER
+                stats = self._statements.get(fingerprint)
+                if stats is None:
+                    sample_sql = ctx.sql if fingerprint != self.OTHER else None
+                    stats = self._statements[fingerprint] = BKOraStatementStats(fingerprint, sample_sql, self.buckets_ms)
+            stats.add(ctx)
+
+    def stats(self, fingerprint=None):
+        """
+        Devuelve las métricas acumuladas.
+
+        Args:
+            fingerprint (str, optional): Huella (o SQL, que se normaliza). Por defecto, todas.
+
+        Returns:
+            list[dict] | dict | None: Métricas por huella (ver `BKOraStatementStats.to_dict`).
+        """
+        with self._lock:
+            if fingerprint is None:
+                return [stats.to_dict() for stats in self._statements.values()]
+            stats = self._statements.get(fingerprint) or self._statements.get(sql_fingerprint(fingerprint))
+            return stats.to_dict() if stats else None
+
+    def top(self, n=10, by="total") -> list:
+        """
+        Devuelve las ``n`` huellas con mayor valor de ``by``.
+
+        Args:
+            n (int, optional): Número de huellas.
+            by (str, optional): ``total``, ``avg``, ``max``, ``p50``, ``p95``, ``p99`` (latencia) o
+                ``calls``, ``errors``, ``rows``, ``bytes``, ``pool_wait``.
+
+        Returns:
+            list[dict]: Métricas ordenadas de mayor a menor.
+        """
+        rows = self.stats()
+        latency_keys = ("total", "avg", "max", "p50", "p95", "p99")
+        if by in latency_keys:
+            key = lambda row: row["latency"][by] or 0.0
+        elif rows and by not in rows[0]:
+            raise ValueError(f"Criterio '{by}' no válido.")
+        else:
+            key = lambda row: row[by] or 0
+        return sorted(rows, key=key, reverse=True)[:n]
+
+    def reset(self):
+        """Vacía el agregador (los hooks se mantienen)."""
+        with self._lock:
+            self._statements.clear()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}: {len(self._statements)} sentencias"
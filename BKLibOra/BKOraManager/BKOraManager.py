@@ -10,11 +10,48 @@ Clases:
 
 Dependencias:
     - contextlib
+    - contextvars
     - sqlalchemy (a través del conector proporcionado)
 """
 
+from BKLibOra.config import FETCH_VALUES, BULK_VALUES, GATHER_VALUES
+from BKLibOra.BKOraManager.BKOraManager_utils import row_mapper, mark_session_writes
+from BKLibOra.BKOraManager.BKOraColumnar import BKOraColumnarBuilder
+from BKLibOra.BKOraManager.BKOraStatementCache import default_statement_cache
+from BKLibOra.BKOraManager.BKOraFetchTuner import fetch_options
+from BKLibOra.BKOraManager.BKOraParallel import gather_calls
 from sqlalchemy.sql import text
 from contextlib import contextmanager
+from contextvars import ContextVar
+import inspect
+
+# Sesiones ligadas por `unit_of_work()` en el contexto actual: {id(connector): session}.
+# Al ser una ContextVar, cada hilo y cada tarea asyncio ve únicamente sus propias sesiones.
+_bound_sessions: ContextVar = ContextVar("bk_bound_sessions", default=None)
+
+_NO_OPTIONS = {}
+
+
+def _consume_dicts(result):
+    rows = result.fetchall()
+    keys = result.keys()
+    return [dict(zip(keys, row)) for row in rows], rows
+
+
+def _consume_one(result):
+    row = result.fetchone()
+    if row:
+        return dict(zip(result.keys(), row)), [row]
+    return None, []
+
+
+def _consume_tuples(result):
+    rows = [tuple(row) for row in result]
+    return (tuple(result.keys()), rows), rows
+
+
+def _consume_rowcount(result):
+    return None, result.rowcount
 
 
 class BKOraManager:
@@ -29,11 +66,34 @@ class BKOraManager:
 
     Métodos:
         session_scope(): Context manager que maneja la apertura, commit, rollback y cierre de la sesión.
+        unit_of_work(): Context manager que liga una única sesión a todas las llamadas realizadas en su interior.
         fetch_all(query, params=None): Ejecuta una consulta y devuelve todos los resultados como lista de diccionarios.
+            ``fetch_all``, ``fetch_models`` y ``fetch_rows`` admiten ``arraysize`` y ``prefetchrows`` por llamada.
         fetch_one(query, params=None): Ejecuta una consulta y devuelve un único resultado como diccionario.
+        fetch_models(query, model, params=None): Ejecuta una consulta y devuelve instancias de ``model``.
+        fetch_rows(query, params=None): Ejecuta una consulta y devuelve columnas y filas como tuplas.
+        fetch_iter(query, params=None): Ejecuta una consulta y devuelve un generador de filas en streaming.
+        fetch_columnar(query, params=None): Ejecuta una consulta y devuelve el resultado en formato columnar.
         execute(query, params=None): Ejecuta una instrucción SQL sin retornar resultados (ideal para INSERT, UPDATE, DELETE).
+        execute_many(query, params_list): Ejecuta una instrucción DML por lotes con ``executemany`` (array DML).
+        build_query(builder): Construye ``(sql, params)`` de un `BKOraQueryBuilder` usando la caché de sentencias.
+        gather(jobs): Ejecuta varias consultas independientes a la vez y devuelve sus resultados en orden.
+
+    Atributos de clase:
+        statement_cache (BKOraStatementCache | None): Caché de sentencias y consultas generadas. Se
+            comparte entre managers; ``None`` desactiva la caché para la clase o la instancia.
+        instrumentation (BKOraInstrumentation | None): Hooks y métricas por sentencia de ``fetch_all``,
+            ``fetch_one``, ``fetch_models``, ``fetch_rows``, ``execute``, ``execute_many`` y las rutinas
+            (ver `BKOraInstrumentation`). ``None`` (por defecto) no instrumenta nada.
+        fetch_tuner (BKOraFetchTuner | None): Ajuste adaptativo del ``arraysize`` de ``fetch_all``,
+            ``fetch_models`` y ``fetch_rows`` por consulta (ver `BKOraFetchTuner`). ``None`` (por
+            defecto) usa los valores de la llamada, del manager, del conector o del driver.
     """
 
+    statement_cache = default_statement_cache
+    instrumentation = None
+    fetch_tuner = None
+
     def __init__(self, connector):
         """
         Inicializa una instancia de BKOraManager.
@@ -49,11 +109,56 @@ class BKOraManager:
         Context manager que proporciona un ámbito de sesión seguro.
 
         Abre una sesión, realiza commit si todo va bien o rollback en caso de excepción, y finalmente cierra la sesión.
+        Dentro de un `unit_of_work()` activo se reutiliza su sesión y el commit/cierre queda en manos de este.
 
         Yields:
             sqlalchemy.orm.Session: Objeto sesión activo.
         """
+        bound = self.bound_session()
+        if bound is not None:
+            yield bound
+            return
+
+        session = self.connector.get_session()
+        try:
+            yield session
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    @contextmanager
+    def unit_of_work(self):
+        """
+        Context manager que liga una única sesión a todas las llamadas hechas en su interior.
+
+        Mientras está activo, cualquier ``fetch_all``, ``fetch_one``, ``execute``, ``call_procedure``…
+        sin ``sess`` explícito (de este manager o de cualquier otro que comparta el mismo conector)
+        usa la misma sesión: una operación de varios pasos cuesta un único checkout y un único commit.
+        Al salir se hace commit, o rollback si se produjo una excepción, y se cierra la sesión.
+
+        La sesión se guarda en una ``ContextVar``, por lo que hilos y tareas asyncio concurrentes no
+        la comparten. Los ``unit_of_work()`` anidados reutilizan la sesión del más externo.
+
+        Yields:
+            sqlalchemy.orm.Session: Sesión ligada al contexto.
+
+        Example:
+            >>> with manager.unit_of_work():
+            ...     data = manager.getlist_numerated()
+            ...     manager.call_procedure("pkg.refresh", {"p_id": 1})
+        """
+        bound = self.bound_session()
+        if bound is not None:
+            yield bound
+            return
+
         session = self.connector.get_session()
+        sessions = dict(_bound_sessions.get() or {})
+        sessions[id(self.connector)] = session
+        token = _bound_sessions.set(sessions)
         try:
             yield session
             session.commit()
@@ -61,28 +166,104 @@ class BKOraManager:
             session.rollback()
             raise e
         finally:
+            _bound_sessions.reset(token)
             session.close()
 
-    def fetch_all(self, query, params=None, sess=None):
+    def bound_session(self):
+        """
+        Devuelve la sesión ligada por un `unit_of_work()` activo para este conector.
+
+        Returns:
+            sqlalchemy.orm.Session | None: Sesión ligada o ``None`` si no hay unidad de trabajo activa.
+        """
+        sessions = _bound_sessions.get()
+        if not sessions:
+            return None
+        return sessions.get(id(self.connector))
+
+    def _statement(self, query):
+        """Devuelve el ``TextClause`` de ``query``, reutilizado desde `statement_cache` si está activa."""
+        if not isinstance(query, str):
+            return query
+        if self.statement_cache is None:
+            return text(query)
+        return self.statement_cache.statement(query)
+
+    def build_query(self, builder):
+        """
+        Construye la consulta de un `BKOraQueryBuilder`.
+
+        Con `statement_cache` activa, los builders con la misma forma (SQL base, columnas, operadores,
+        funciones y número de valores) reutilizan el SQL y la plantilla de binds de la primera llamada.
+
+        Args:
+            builder (BKOraQueryBuilder): Builder con el SQL base, los filtros y los valores.
+
+        Returns:
+            tuple[str, dict]: SQL final y parámetros.
+        """
+        if self.statement_cache is None:
+            return builder.build()
+        return self.statement_cache.build_query(builder)
+
+    def _run(self, operation, query, params, sess, consume, options=None):
+        """
+        Ejecuta ``query`` en ``sess`` (o en una sesión propia) y devuelve el valor de ``consume(result)``.
+
+        ``consume`` devuelve ``(valor, filas)``, donde filas es la secuencia de filas leídas o el número
+        de filas afectadas; se usa para las métricas de `instrumentation` si está activa. ``options``
+        son las opciones de ejecución de la sentencia (``arraysize``, ``prefetchrows``…).
+        """
+        options = options or _NO_OPTIONS
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            if sess:
+                return consume(sess.execute(self._statement(query), params or {}, execution_options=options))[0]
+            with self.session_scope() as session:
+                return consume(session.execute(self._statement(query), params or {}, execution_options=options))[0]
+
+        with instrumentation.observe(operation, query, params, self) as ctx:
+            if sess:
+                value, rows = consume(sess.execute(self._statement(query), params or {}, execution_options=options))
+            else:
+                with self.session_scope() as session:
+                    value, rows = consume(session.execute(self._statement(query), params or {}
+                                                          , execution_options=options))
+            ctx.set_rows(rows)
+        return value
+
+    def _read(self, operation, query, params, sess, consume, arraysize=None, prefetchrows=None):
+        """
+        Como `_run` para las lecturas completas: resuelve ``arraysize``/``prefetchrows`` (ver
+        `fetch_options`) y, si el tamaño es adaptativo, comunica a `fetch_tuner` las filas leídas.
+        """
+        options, tuner = fetch_options(self, query, arraysize, prefetchrows)
+        if tuner is None:
+            return self._run(operation, query, params, sess, consume, options)
+
+        def observed(result):
+            value, rows = consume(result)
+            tuner.record(query, len(rows))
+            return value, rows
+
+        return self._run(operation, query, params, sess, observed, options)
+
+    def fetch_all(self, query, params=None, sess=None, arraysize=None, prefetchrows=None):
         """
         Ejecuta una consulta SQL y devuelve todos los resultados.
 
         Args:
             query (str): Consulta SQL (de tipo SELECT).
             params (dict, optional): Parámetros para la consulta.
+            arraysize (int, optional): Filas por round-trip. Por defecto el del manager
+                (``kwargs["fetch_arraysize"]``), el de `fetch_tuner`, el del conector o el del driver.
+            prefetchrows (int, optional): Filas que llegan con el propio execute (mismo orden de valores
+                por defecto que ``arraysize``).
 
         Returns:
             list[dict]: Lista de filas como diccionarios (clave=nombre de columna).
         """
-        result=[]
-        
-        if sess:
-            result = sess.execute(text(query), params or {})
-        else:
-            with self.session_scope() as session:
-                result = session.execute(text(query), params or {})
-        keys = result.keys()
-        return [dict(zip(keys, row)) for row in result]
+        return self._read("fetch_all", query, params, sess, _consume_dicts, arraysize, prefetchrows)
 
     def fetch_one(self, query, params=None, sess=None):
         """
@@ -95,17 +276,215 @@ class BKOraManager:
         Returns:
             dict | None: Fila como diccionario o None si no hay resultados.
         """
-        result=[]
-        
+        return self._run("fetch_one", query, params, sess, _consume_one)
+
+    def fetch_models(self, query, model, params=None, sess=None, trusted=False, arraysize=None,
+                     prefetchrows=None):
+        """
+        Ejecuta una consulta SQL y devuelve los resultados como instancias de ``model``.
+
+        Las filas se convierten directamente desde las tuplas del cursor (ver `row_mapper`),
+        sin construir el diccionario intermedio de `fetch_all`.
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            model (object): Clase modelo con ``row_factory()`` o ``from_dict()``.
+            params (dict, optional): Parámetros para la consulta.
+            sess (sqlalchemy.orm.Session, optional): Sesión a reutilizar.
+            trusted (bool, optional): Crea los objetos en modo ``trusted`` (sin validación de lectura).
+            arraysize, prefetchrows (int, optional): Ver `fetch_all`.
+
+        Returns:
+            list[object]: Lista de instancias del modelo.
+        """
+        def consume(result):
+            rows = result.fetchall()
+            return list(map(row_mapper(model, result.keys(), trusted), rows)), rows
+
+        return self._read("fetch_models", query, params, sess, consume, arraysize, prefetchrows)
+
+    def fetch_rows(self, query, params=None, sess=None, arraysize=None, prefetchrows=None):
+        """
+        Ejecuta una consulta SQL y devuelve las columnas y las filas como tuplas.
+
+        Es la forma más ligera del resultado (sin diccionarios ni objetos por fila) y la que
+        se guarda en la caché de resultados (ver `BKOraResultCache`).
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            params (dict, optional): Parámetros para la consulta.
+            sess (sqlalchemy.orm.Session, optional): Sesión a reutilizar.
+            arraysize, prefetchrows (int, optional): Ver `fetch_all`.
+
+        Returns:
+            tuple[tuple[str], list[tuple]]: Nombres de columna y filas.
+        """
+        return self._read("fetch_rows", query, params, sess, _consume_tuples, arraysize, prefetchrows)
+
+    def fetch_iter(self, query, params=None, sess=None, arraysize=None, model=None, trusted=False):
+        """
+        Ejecuta una consulta SQL y devuelve sus filas de forma perezosa (streaming).
+
+        La consulta se lanza con un cursor de servidor (``stream_results``) y las filas se
+        recuperan en bloques de ``arraysize`` (``yield_per``), de modo que la memoria ocupada
+        no depende del tamaño total del resultado. Si no se proporciona ``sess``, la sesión
+        se abre al consumir la primera fila y se cierra cuando el generador termina o se
+        cierra (``close()`` / salida anticipada de un ``for``).
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            params (dict, optional): Parámetros para la consulta.
+            sess (sqlalchemy.orm.Session, optional): Sesión a reutilizar. No se cierra al terminar.
+            arraysize (int, optional): Filas por round-trip. Por defecto ``FETCH_VALUES["arraysize"]``.
+            model (object, optional): Clase modelo con ``from_dict()``. Si se indica, se
+                devuelven instancias del modelo en lugar de diccionarios.
+            trusted (bool, optional): Crea los objetos en modo ``trusted`` (sin validación de lectura).
+
+        Yields:
+            dict | object: Cada fila como diccionario o como instancia de ``model``.
+        """
+        arraysize = arraysize or FETCH_VALUES.get("arraysize")
+        options = {"stream_results": True, "yield_per": arraysize, "arraysize": arraysize}
+
         if sess:
-            result = sess.execute(text(query), params or {})
+            yield from self._iter_result(sess, query, params, options, model, trusted)
         else:
             with self.session_scope() as session:
-                result = session.execute(text(query), params or {})
-        row = result.fetchone()
-        if row:
-            return dict(zip(result.keys(), row))
-        return None
+                yield from self._iter_result(session, query, params, options, model, trusted)
+
+    def fetch_columnar(self, query, params=None, sess=None, dtypes=None, batch_size=None):
+        """
+        Ejecuta una consulta SQL y devuelve el resultado en formato columnar (un array por columna).
+
+        Las filas se leen en streaming en lotes de ``batch_size`` y cada lote se convierte a arrays de
+        NumPy antes de leer el siguiente, sin crear diccionarios ni objetos por fila. Requiere NumPy.
+
+        Args:
+            query (str): Consulta SQL (de tipo SELECT).
+            params (dict, optional): Parámetros para la consulta.
+            sess (sqlalchemy.orm.Session, optional): Sesión a reutilizar.
+            dtypes (dict[str, str], optional): dtype de NumPy por columna (ver `columnar_dtypes`).
+                Las columnas no indicadas se infieren del primer lote.
+            batch_size (int, optional): Filas por lote y por round-trip. Por defecto ``FETCH_VALUES["arraysize"]``.
+
+        Returns:
+            BKOraColumnarResult: Arrays por columna y máscaras de nulos.
+        """
+        batch_size = batch_size or FETCH_VALUES.get("arraysize")
+        options = {"stream_results": True, "yield_per": batch_size, "arraysize": batch_size}
+
+        if sess:
+            return self._build_columnar(sess, query, params, options, dtypes)
+        with self.session_scope() as session:
+            return self._build_columnar(session, query, params, options, dtypes)
+
+    def _build_columnar(self, session, query, params, options, dtypes):
+        """Convierte un resultado en streaming a columnas lote a lote."""
+        result = session.execute(self._statement(query), params or {}, execution_options=options)
+        try:
+            builder = BKOraColumnarBuilder(result.keys(), dtypes)
+            for partition in result.partitions():
+                builder.add_batch(partition)
+        finally:
+            result.close()
+        return builder.build()
+
+    def _iter_result(self, session, query, params, options, model, trusted=False):
+        """Recorre un resultado en streaming garantizando el cierre del cursor."""
+        result = session.execute(self._statement(query), params or {}, execution_options=options)
+        try:
+            keys = tuple(result.keys())
+            if model:
+                yield from map(row_mapper(model, keys, trusted), result)
+            else:
+                for row in result:
+                    yield dict(zip(keys, row))
+        finally:
+            result.close()
+
+    def _job_call(self, job):
+        """Convierte un trabajo de `gather` en una llamada sin argumentos."""
+        if callable(job):
+            return job
+        if isinstance(job, str):
+            return lambda: self.fetch_all(job)
+        if isinstance(job, (tuple, list)):
+            if len(job) == 2 and isinstance(job[0], str):
+                sql, params = job
+                return lambda: self.fetch_all(sql, params)
+            if len(job) == 3 and hasattr(job[0], "getlist"):
+                manager, filters, values = job
+                self._check_builder_getlist(manager)
+                return lambda: manager.getlist(filters, values)
+        raise TypeError(f"Trabajo no válido para gather: {job!r}; use (sql, params), (manager, filtros, valores) "
+                        "o una función sin argumentos.")
+
+    @staticmethod
+    def _check_builder_getlist(manager):
+        """
+        Comprueba que ``manager.getlist`` admite ``(filtros, valores)`` y es síncrono, como el de
+        `BKOraManagerBuilder` (el de `BKOraManagerDB` solo recibe la sesión).
+
+        Raises:
+            TypeError: Si el ``getlist`` del manager no tiene esa forma.
+        """
+        getlist = manager.getlist
+        try:
+            inspect.signature(getlist).bind([], [])
+        except (TypeError, ValueError):
+            valid = False
+        else:
+            valid = not inspect.iscoroutinefunction(getlist)
+        if not valid:
+            raise TypeError(f"{type(manager).__name__}.getlist no admite (filtros, valores); los trabajos "
+                            "(manager, filtros, valores) de gather requieren un BKOraManagerBuilder. Use una "
+                            "función sin argumentos (p. ej. manager.getlist) para el resto de managers.")
+
+    def gather(self, jobs, workers: int|None=None, raise_errors: bool=False) -> list:
+        """
+        Ejecuta varias consultas independientes a la vez y devuelve sus resultados en el orden de ``jobs``.
+
+        Pensado para pantallas e informes que necesitan varias consultas sin relación entre sí: cada
+        trabajo se ejecuta en un hilo con su propia sesión (su propia conexión del pool), de modo que el
+        tiempo total es el de la consulta más lenta y no la suma. Los trabajos no comparten la sesión de
+        un ``unit_of_work()`` activo, y ``workers`` no debería superar ``pool_size + max_overflow`` del
+        conector (el resto esperaría una conexión libre).
+
+        Cada trabajo puede ser:
+
+        * ``(sql, params)`` (o solo ``sql``): se ejecuta con ``fetch_all`` de este manager.
+        * ``(manager, filtros, valores)``: ``manager.getlist(filtros, valores)``. Solo para
+          `BKOraManagerBuilder`; con otros managers (``getlist`` sin filtros) se lanza ``TypeError``.
+        * Una función sin argumentos, para cualquier otra lectura (p. ej.
+          ``functools.partial(manager_db.getlist_page, {"page_init": 0, "page_fin": 50})``).
+
+        Args:
+            jobs (Iterable): Trabajos a ejecutar.
+            workers (int | None, opcional): Hilos simultáneos. Por defecto ``GATHER_VALUES["workers"]``.
+            raise_errors (bool, opcional): Si es ``True``, al terminar todos los trabajos se relanza el
+                error del primero que haya fallado; si es ``False`` los errores se devuelven en ``error``.
+
+        Returns:
+            list[dict]: Por trabajo, ``result`` (``None`` si falló), ``error`` (la excepción o ``None``) y
+            ``time`` con ``time_queue`` (espera hasta tener hilo) y ``time_exec`` (ejecución), en segundos.
+
+        Raises:
+            TypeError: Si algún trabajo no tiene una de las formas admitidas (antes de ejecutar ninguno).
+
+        Example:
+            >>> ventas, stock, clientes = (job["result"] for job in manager.gather([
+            ...     ("SELECT * FROM VENTAS WHERE FECHA >= :f", {"f": desde}),
+            ...     (stock_manager, filtros, valores),
+            ...     clientes_manager.getlist,
+            ... ], raise_errors=True))
+        """
+        calls = [self._job_call(job) for job in jobs]
+        results = gather_calls(calls, workers or GATHER_VALUES.get("workers"))
+        if raise_errors:
+            for item in results:
+                if item["error"] is not None:
+                    raise item["error"]
+        return results
 
     def execute(self, query, params=None, sess=None):
         """
@@ -115,8 +494,90 @@ class BKOraManager:
             query (str): Consulta SQL.
             params (dict, optional): Parámetros de la consulta.
         """
+        self._mark_writes(sess)
+        self._run("execute", query, params, sess, _consume_rowcount)
+
+    def _mark_writes(self, sess):
+        """Marca la transacción de ``sess`` (o del ``unit_of_work()`` activo) como pendiente de confirmar escrituras."""
+        session = sess or self.bound_session()
+        if session is not None:
+            mark_session_writes(session)
+
+    def execute_many(self, query, params_list, sess=None, batch_size=None, batch_errors=False):
+        """
+        Ejecuta una instrucción DML para una colección de parámetros usando ``executemany``.
+
+        Los parámetros se envían al driver en lotes de ``batch_size`` filas (array DML), de
+        modo que N filas cuestan N / batch_size round-trips en lugar de N.
+
+        Con ``batch_errors=True`` se usa directamente el cursor del driver con
+        ``batcherrors=True``: las filas erróneas no detienen el lote y se devuelven en
+        ``errors`` (el resto de filas se aplica y la transacción sigue abierta).
+
+        Args:
+            query (str): Consulta SQL DML con binds por nombre.
+            params_list (Iterable[dict]): Parámetros de cada fila.
+            sess (sqlalchemy.orm.Session, optional): Sesión a reutilizar.
+            batch_size (int, optional): Filas por lote. Por defecto ``BULK_VALUES["batch_size"]``.
+            batch_errors (bool, optional): Recoge los errores por fila en lugar de abortar.
+
+        Returns:
+            dict: ``rowcount`` (int) con las filas afectadas y ``errors`` (list[dict]) con
+            ``index``, ``code`` y ``message`` de cada fila rechazada.
+        """
+        params_list = list(params_list)
+        batch_size = batch_size or BULK_VALUES.get("batch_size")
+        self._mark_writes(sess)
+
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return self._execute_many(sess, query, params_list, batch_size, batch_errors)
+        with instrumentation.observe("execute_many", query, None, self) as ctx:
+            summary = self._execute_many(sess, query, params_list, batch_size, batch_errors)
+            ctx.set_rows(summary["rowcount"])
+        return summary
+
+    def _execute_many(self, sess, query, params_list, batch_size, batch_errors):
+        """Ejecuta los lotes en ``sess`` o en una sesión propia."""
         if sess:
-            sess.execute(text(query), params or {})
-        else:
-            with self.session_scope() as session:
-                session.execute(text(query), params or {})
+            return self._execute_batches(sess, query, params_list, batch_size, batch_errors)
+        with self.session_scope() as session:
+            return self._execute_batches(session, query, params_list, batch_size, batch_errors)
+
+    def _execute_batches(self, session, query, params_list, batch_size, batch_errors):
+        """
+        Envía ``params_list`` en lotes de ``batch_size`` filas sobre la sesión dada.
+
+        Con ``batch_errors`` los lotes van directamente al cursor del driver, que solo acepta SQL en texto:
+        un ``TextClause`` se envía con su ``.text``.
+
+        Raises:
+            TypeError: Si ``batch_errors`` está activo y ``query`` no es ``str`` ni ``TextClause``.
+        """
+        summary = {"rowcount": 0, "errors": []}
+        statement = self._statement(query)
+        raw_sql = query if isinstance(query, str) else getattr(query, "text", None)
+        if batch_errors and not isinstance(raw_sql, str):
+            raise TypeError("Con batch_errors la consulta debe ser un str o un TextClause (text())")
+
+        for start in range(0, len(params_list), batch_size):
+            batch = params_list[start:start + batch_size]
+            if not batch_errors:
+                result = session.execute(statement, batch)
+                summary["rowcount"] += max(result.rowcount, 0)
+                continue
+
+            cursor = session.connection().connection.cursor()
+            try:
+                cursor.executemany(raw_sql, batch, batcherrors=True)
+                summary["rowcount"] += max(cursor.rowcount, 0)
+                for error in cursor.getbatcherrors():
+                    summary["errors"].append({
+                        "index": start + error.offset,
+                        "code": error.code,
+                        "message": error.message,
+                    })
+            finally:
+                cursor.close()
+
+        return summary
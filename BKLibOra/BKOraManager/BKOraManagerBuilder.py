@@ -1,6 +1,9 @@
-from BKLibOra.config import PAGE_VALUES
+from BKLibOra.config import PAGE_VALUES, FETCH_VALUES, BULK_VALUES, IN_VALUES, RESULT_CACHE_VALUES, PROCESS_VALUES
 from BKLibOra.BKOraManager.BKOraManager import BKOraManager
-from BKLibOra.BKOraManager.BKOraManager_utils import wrapper_where_query, counter_row_query, range_row_query, BKOraRoutineExecutor
+from BKLibOra.BKOraManager.BKOraColumnar import columnar_dtypes
+from BKLibOra.BKOraManager.BKOraManager_utils import (wrapper_where_query, BKOraCounterExecutor, BKOraKeysetExecutor
+                                                      , BKOraRoutineExecutor, BKOraResultCacheExecutor, BKOraProcessExecutor
+                                                      , validate_for_write)
 from BKLibOra.BKOraManager.BKOraQueryBuilder import BKOraQueryBuilder
 from sqlalchemy.orm import sessionmaker
 from abc import ABC, abstractmethod
@@ -8,9 +11,11 @@ from typing import Any, Dict, List, Tuple
 import time
 import copy
 
-class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
+class BKOraManagerBuilder(BKOraManager, BKOraCounterExecutor, BKOraKeysetExecutor, BKOraRoutineExecutor
+                          , BKOraResultCacheExecutor, BKOraProcessExecutor):
     
-    DEFAULT_KWARGS = copy.deepcopy(PAGE_VALUES)
+    DEFAULT_KWARGS = copy.deepcopy(PAGE_VALUES | FETCH_VALUES | BULK_VALUES | IN_VALUES | RESULT_CACHE_VALUES
+                                   | PROCESS_VALUES)
     
     def __init__(self, connector, model, *args, **kwargs):
         
@@ -19,7 +24,20 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         self.args = args
         self.kwargs = self.DEFAULT_KWARGS | kwargs
         self.QueryBuilder = BKOraQueryBuilder
-        
+
+    def query_builder(self, sql, filter, params):
+        """
+        Crea el ``QueryBuilder`` de una consulta con las opciones IN del manager
+        (``in_strategy``, ``in_chunk_size`` e ``in_array_threshold``, ver `BKOraQueryBuilder`).
+
+        Returns:
+            BKOraQueryBuilder: Builder listo para `build_query`.
+        """
+        return self.QueryBuilder(base_sql=sql, filters=filter, values=params
+                                 , in_strategy=self.kwargs.get("in_strategy")
+                                 , in_chunk_size=self.kwargs.get("in_chunk_size")
+                                 , in_array_threshold=self.kwargs.get("in_array_threshold"))
+
     @abstractmethod
     def get_sql_select(self):
         """
@@ -73,19 +91,78 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_select()
         sql = wrapper_where_query(sql)
 
-        qb = self.QueryBuilder(base_sql=sql, filters=filter, values=params)
-        sql, params = qb.build()
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
         
-        results = self.fetch_all(sql, params, sess=session)
+        results = self.cached_models(sql, params, session=session)
 
         if session and _close_sess:
             session.close()
 
-        return self.model.from_list(results)
+        return results
+
+    def getlist_iter(self, filter: List[Dict[str, Any]]
+                     , params: List[Dict[str, Any]]
+                     , session: sessionmaker|None=None
+                     , arraysize: int|None=None):
+        """
+        Ejecuta la consulta SELECT filtrada en modo streaming.
+
+        Construye la consulta igual que :py:meth:`getlist` pero devuelve un generador
+        que crea cada instancia del modelo a medida que se consume, leyendo del cursor
+        en bloques de ``arraysize`` filas.
+
+        Args:
+            filter (list[dict]): Reglas de filtrado para ``BKOraQueryBuilder``.
+            params (list[dict]): Valores asociados a los filtros.
+            session (sessionmaker | None, opcional): Sesión de SQLAlchemy a reutilizar.
+            arraysize (int | None, opcional): Filas por round-trip. Si es ``None`` se usa
+                ``self.kwargs["arraysize"]``.
+
+        Yields:
+            object: Instancias del modelo definido.
+        """
+        sql, _ = self.get_sql_select()
+        sql = wrapper_where_query(sql)
+
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
+
+        arraysize = arraysize or self.kwargs.get("arraysize")
+        return self.iter_models(sql, params, session=session, arraysize=arraysize)
+
+    def getlist_columnar(self, filter: List[Dict[str, Any]]
+                         , params: List[Dict[str, Any]]
+                         , session: sessionmaker|None=None
+                         , batch_size: int|None=None
+                         , dtypes: dict|None=None):
+        """
+        Ejecuta la consulta SELECT filtrada y devuelve el resultado en formato columnar.
+
+        Construye la consulta igual que :py:meth:`getlist` y la lee con
+        :py:meth:`BKOraManager.fetch_columnar` usando los dtypes declarados en el modelo.
+
+        Args:
+            filter (list[dict]): Reglas de filtrado para ``BKOraQueryBuilder``.
+            params (list[dict]): Valores asociados a los filtros.
+            session (sessionmaker | None, opcional): Sesión de SQLAlchemy a reutilizar.
+            batch_size (int | None, opcional): Filas por lote. Si es ``None`` se usa ``self.kwargs["arraysize"]``.
+            dtypes (dict | None, opcional): dtypes que sustituyen a los deducidos del modelo.
+
+        Returns:
+            BKOraColumnarResult: Arrays por columna y máscaras de nulos.
+        """
+        sql, _ = self.get_sql_select()
+        sql = wrapper_where_query(sql)
+
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
+
+        batch_size = batch_size or self.kwargs.get("arraysize")
+        dtypes = columnar_dtypes(self.model) | (dtypes or {})
+        return self.fetch_columnar(sql, params, sess=session, dtypes=dtypes, batch_size=batch_size)
     
     def getlist_numerated(self, filter: List[Dict[str, Any]]
                           , params: List[Dict[str, Any]]
                           , session: sessionmaker|None=None
+                          , count_over: bool|None=None
                           , _close_sess: bool=False) -> dict:
         """
         Devuelve todos los registros que cumple la consulta, el total de filas
@@ -105,6 +182,10 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
                 Sesión de SQLAlchemy a reutilizar.  
                 Si ``None`` se usa la configuración por defecto
                 interna de ``fetch_all``.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict:  
@@ -127,26 +208,19 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_select()
         sql = wrapper_where_query(sql)
 
-        qb = self.QueryBuilder(base_sql=sql, filters=filter, values=params)
-        sql, params = qb.build()
-
-        counter_query = counter_row_query(sql)
-
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
 
         time_result_init = time.perf_counter()
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
-        time_result = time.perf_counter() - time_result_init
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session, count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
 
         time_exec = time.perf_counter() - time_exec_init
 
         result_dict = {
             "result": result_models,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "count": count,
             "time": {
                 "time_result": time_result,
                 "time_count": time_count,
@@ -162,6 +236,7 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
     def getlist_paginated(self, filter: List[Dict[str, Any]]
                           , params: List[Dict[str, Any]]
                           , session: sessionmaker|None=None
+                          , count_over: bool|None=None
                           , _close_sess: bool=False) -> dict:
         """
         Obtiene todos los registros pero los divide en páginas de tamaño fijo.
@@ -180,6 +255,10 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         Args:
             session (sessionmaker | None, opcional):
                 Sesión de SQLAlchemy a reutilizar.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict:  
@@ -199,18 +278,12 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_select()
         sql = wrapper_where_query(sql)
 
-        qb = self.QueryBuilder(base_sql=sql, filters=filter, values=params)
-        sql, params = qb.build()
-        counter_query = counter_row_query(sql)
-
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
 
         time_result_init = time.perf_counter()
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
-        time_result = time.perf_counter() - time_result_init
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session, count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
 
         time_page_init = time.perf_counter()
         chunks = [result_models[i:i + self.kwargs.get("rows_page")]
@@ -222,7 +295,7 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         result_dict = {
             "result": chunks,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "count": count,
             "time": {
                 "time_page": time_page,
                 "time_result": time_result,
@@ -240,6 +313,7 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
                      , params: List[Dict[str, Any]]
                      , page_range: dict|None=None
                      , session: sessionmaker|None=None
+                     , count_over: bool|None=None
                      , _close_sess: bool=False) -> dict:
         """
         Devuelve solo la página solicitada mediante límites ``OFFSET``/``LIMIT``.
@@ -258,6 +332,10 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
                 Si es ``None`` se utiliza el rango por defecto indicado arriba.
             session (sessionmaker | None, opcional):
                 Sesión de SQLAlchemy a reutilizar.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict: estructura análoga a :py:meth:`getlist_numerated`.
@@ -278,26 +356,22 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_select()
         sql = wrapper_where_query(sql)
 
-        qb = self.QueryBuilder(base_sql=sql, filters=filter, values=params)
-        sql, params = qb.build()
-        counter_query = counter_row_query(sql)
-
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
 
         time_result_init = time.perf_counter()
-        sql = range_row_query(sql, offset=page_range.get("page_init"), limit=page_range.get("page_fin"))
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
-        time_result = time.perf_counter() - time_result_init
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session
+                                                           , offset=page_range.get("page_init")
+                                                           , limit=page_range.get("page_fin")
+                                                           , count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
 
         time_exec = time.perf_counter() - time_exec_init
 
         result_dict = {
             "result": result_models,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "count": count,
             "time": {
                 "time_result": time_result,
                 "time_count": time_count,
@@ -314,6 +388,7 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
                       , params: List[Dict[str, Any]]
                       , _range: tuple|None=None
                       , session: sessionmaker|None=None
+                      , count_over: bool|None=None
                       , _close_sess: bool=False) -> dict:
         """
         Recupera los registros comprendidos en el rango dado
@@ -325,6 +400,10 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
                 ``page_range`` pero se pasa como tupla.
             session (sessionmaker | None, opcional):
                 Sesión de SQLAlchemy a reutilizar.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict: estructura análoga a :py:meth:`getlist_numerated`.
@@ -341,18 +420,87 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_select()
         sql = wrapper_where_query(sql)
 
-        qb = self.QueryBuilder(base_sql=sql, filters=filter, values=params)
-        sql, params = qb.build()
-        counter_query = counter_row_query(sql)
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
+
+        time_result_init = time.perf_counter()
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session
+                                                           , offset=start
+                                                           , limit=fin
+                                                           , count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
+
+        time_exec = time.perf_counter() - time_exec_init
+
+        result_dict = {
+            "result": result_models,
+            "result_set": result_set,
+            "count": count,
+            "time": {
+                "time_result": time_result,
+                "time_count": time_count,
+                "time_exec": time_exec,
+            }
+        }
+
+        if session and _close_sess:
+            session.close()
+
+        return result_dict
+
+    def getlist_keyset(self, filter: List[Dict[str, Any]]
+                       , params: List[Dict[str, Any]]
+                       , cursor: str|None=None
+                       , sort_key: str|list|None=None
+                       , rows: int|None=None
+                       , descending: bool=False
+                       , session: sessionmaker|None=None
+                       , _close_sess: bool=False) -> dict:
+        """
+        Devuelve una página de registros paginando por *keyset* en lugar de ``OFFSET``.
+
+        Las filas se ordenan por ``sort_key`` seguido de las columnas de clave primaria
+        del modelo (``primary_key=True``) y cada página se localiza a partir de los
+        valores de la última fila de la anterior, por lo que las páginas profundas
+        cuestan lo mismo que la primera.
 
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
+        Args:
+            cursor (str | None, opcional):
+                Token opaco devuelto en ``cursor`` por la página anterior.
+                ``None`` para la primera página.
+            sort_key (str | list[str] | None, opcional):
+                Columna(s) de ordenación previas a la clave primaria.
+            rows (int | None, opcional):
+                Filas por página. Por defecto ``self.kwargs["rows_page"]``.
+            descending (bool, opcional):
+                Orden descendente.
+            session (sessionmaker | None, opcional):
+                Sesión de SQLAlchemy a reutilizar.
+
+        Returns:
+            dict:
+                * ``result`` (list[Model]): instancias del modelo de la página.
+                * ``result_set`` (list[dict]): datos crudos de la página.
+                * ``cursor`` (str | None): token de la página siguiente o ``None``
+                  si no hay más filas.
+                * ``time`` (dict): ``time_result`` y ``time_exec``.
+
+        Raises:
+            ValueError: si el modelo no declara clave primaria, ``sort_key`` no es una
+            columna del modelo o el cursor no es válido o no corresponde a la ordenación pedida.
+        """
+
+        time_exec_init = time.perf_counter()
+
+        sql, _ = self.get_sql_select()
+        sql = wrapper_where_query(sql)
+
+        sql, params = self.build_query(self.query_builder(sql, filter, params))
 
         time_result_init = time.perf_counter()
-        sql = range_row_query(sql, offset=start, limit=fin)
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
+        result_set, next_cursor = self.fetch_keyset(sql, params, cursor=cursor, sort_key=sort_key
+                                                    , rows=rows, descending=descending, session=session)
+        result_models = self.models_from_result(result_set)
         time_result = time.perf_counter() - time_result_init
 
         time_exec = time.perf_counter() - time_exec_init
@@ -360,10 +508,9 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         result_dict = {
             "result": result_models,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "cursor": next_cursor,
             "time": {
                 "time_result": time_result,
-                "time_count": time_count,
                 "time_exec": time_exec,
             }
         }
@@ -387,8 +534,9 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_insert()
         if hasattr(self, "before_insert"):
             objmodel, dict_value = self.before_insert(objmodel, dict_value, session=session)
-        params = objmodel.to_dict()
-        self.execute(sql, params, session=session)
+        params = validate_for_write(objmodel).to_dict()
+        self.execute(sql, params, sess=session)
+        self.invalidate_cache(session)
         if hasattr(self, "after_insert"):
             objmodel, dict_value = self.after_insert(objmodel, dict_value, session=session)
 
@@ -417,8 +565,9 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_update()
         if hasattr(self, "before_update"):
             objmodel, dict_value = self.before_update(objmodel, dict_value, session=session)
-        params = objmodel.to_dict()
-        self.execute(sql, params, session=session)
+        params = validate_for_write(objmodel).to_dict()
+        self.execute(sql, params, sess=session)
+        self.invalidate_cache(session)
         if hasattr(self, "after_update"):
             objmodel, dict_value = self.after_update(objmodel, dict_value, session=session)
 
@@ -448,7 +597,8 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         if hasattr(self, "before_delete"):
             objmodel, dict_value = self.before_delete(objmodel, dict_value, session=session)
         params = objmodel.to_dict()
-        self.execute(sql, params, session=session)
+        self.execute(sql, params, sess=session)
+        self.invalidate_cache(session)
         if hasattr(self, "after_delete"):
             objmodel, dict_value = self.after_delete(objmodel, dict_value, session=session)
 
@@ -463,6 +613,147 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
         if only:
             return objmodel
 
+    def insert_many(self, objmodels
+                    , dict_value: dict|None=None
+                    , session: sessionmaker|None=None
+                    , batch_size: int|None=None
+                    , batch_errors: bool|None=None
+                    , _close_sess: bool=False
+                    , only: bool=False) -> dict:
+        """
+        Inserta una colección de instancias del modelo mediante ``executemany``.
+
+        Args:
+            objmodels (Iterable[object]): Instancias del modelo a insertar.
+            dict_value (dict | None, opcional): Valores auxiliares que reciben los hooks. Los hooks por
+                defecto (``before_insert_many``…) llaman al hook de fila para cada objeto y le pasan el
+                ``dict_value`` devuelto por la fila anterior.
+            session (sessionmaker | None, opcional): Sesión de SQLAlchemy a reutilizar.
+            batch_size (int | None, opcional): Filas por lote. Por defecto ``self.kwargs["batch_size"]``.
+            batch_errors (bool | None, opcional): Recoge los errores por fila en lugar de abortar.
+                Por defecto ``self.kwargs["batch_errors"]``.
+            only (bool, opcional): Si es ``True`` el resultado incluye los objetos procesados.
+
+        Returns:
+            dict: Resumen descrito en :py:meth:`_execute_model_batch`.
+        """
+        sql, _ = self.get_sql_insert()
+        return self._execute_model_batch(sql, objmodels, dict_value, self.before_insert_many, self.after_insert_many
+                                         , session, batch_size, batch_errors, _close_sess, only, validate=True)
+
+    def update_many(self, objmodels
+                    , dict_value: dict|None=None
+                    , session: sessionmaker|None=None
+                    , batch_size: int|None=None
+                    , batch_errors: bool|None=None
+                    , _close_sess: bool=False
+                    , only: bool=False) -> dict:
+        """
+        Actualiza una colección de instancias del modelo mediante ``executemany``.
+
+        Args:
+            objmodels (Iterable[object]): Instancias del modelo a actualizar.
+            dict_value, session, batch_size, batch_errors, only: Ver :py:meth:`insert_many`.
+
+        Returns:
+            dict: Resumen descrito en :py:meth:`_execute_model_batch`.
+        """
+        sql, _ = self.get_sql_update()
+        return self._execute_model_batch(sql, objmodels, dict_value, self.before_update_many, self.after_update_many
+                                         , session, batch_size, batch_errors, _close_sess, only, validate=True)
+
+    def delete_many(self, objmodels
+                    , dict_value: dict|None=None
+                    , session: sessionmaker|None=None
+                    , batch_size: int|None=None
+                    , batch_errors: bool|None=None
+                    , _close_sess: bool=False
+                    , only: bool=False) -> dict:
+        """
+        Elimina una colección de instancias del modelo mediante ``executemany``.
+
+        Args:
+            objmodels (Iterable[object]): Instancias del modelo a eliminar.
+            dict_value, session, batch_size, batch_errors, only: Ver :py:meth:`insert_many`.
+
+        Returns:
+            dict: Resumen descrito en :py:meth:`_execute_model_batch`.
+        """
+        sql, _ = self.get_sql_delete()
+        return self._execute_model_batch(sql, objmodels, dict_value, self.before_delete_many, self.after_delete_many
+                                         , session, batch_size, batch_errors, _close_sess, only)
+
+    def _execute_model_batch(self, sql, objmodels, dict_value, before, after
+                             , session, batch_size, batch_errors, _close_sess, only, validate=False):
+        """
+        Ejecuta ``sql`` por lotes para una colección de modelos aplicando los hooks de lote.
+
+        Returns:
+            dict:
+                * ``rowcount`` (int): filas afectadas.
+                * ``errors`` (list[dict]): filas rechazadas (``index``, ``code``, ``message``)
+                  cuando se recogen errores por lote.
+                * ``time`` (dict): ``time_hooks``, ``time_exec_many`` y ``time_exec``.
+                * ``result`` (list[object]): objetos procesados, solo si ``only``.
+        """
+        time_exec_init = time.perf_counter()
+
+        if batch_size is None:
+            batch_size = self.kwargs.get("batch_size")
+        if batch_errors is None:
+            batch_errors = self.kwargs.get("batch_errors")
+
+        time_hooks_init = time.perf_counter()
+        objmodels, dict_value = before(list(objmodels), dict_value, session=session)
+        if validate:
+            objmodels = [validate_for_write(objmodel) for objmodel in objmodels]
+        params_list = [objmodel.to_dict() for objmodel in objmodels]
+        time_hooks = time.perf_counter() - time_hooks_init
+
+        time_exec_many_init = time.perf_counter()
+        summary = self.execute_many(sql, params_list, sess=session, batch_size=batch_size, batch_errors=batch_errors)
+        self.invalidate_cache(session)
+        time_exec_many = time.perf_counter() - time_exec_many_init
+
+        time_hooks_init = time.perf_counter()
+        objmodels, dict_value = after(objmodels, dict_value, session=session)
+        time_hooks += time.perf_counter() - time_hooks_init
+
+        if session and _close_sess:
+            try:
+                session.commit()
+            except:
+                session.rollback()
+            finally:
+                session.close()
+
+        summary["time"] = {
+            "time_hooks": time_hooks,
+            "time_exec_many": time_exec_many,
+            "time_exec": time.perf_counter() - time_exec_init,
+        }
+        if only:
+            summary["result"] = objmodels
+        return summary
+
+    @staticmethod
+    def _apply_row_hook(hook, objmodels, dict_value, session):
+        """
+        Aplica un hook de fila a cada objeto de un lote, en orden.
+
+        ``dict_value`` pasa de una fila a la siguiente: cada llamada recibe el valor devuelto por la
+        anterior, como si los objetos se procesaran uno a uno con ``insert_model``/``update_model``/
+        ``delete_model``.
+
+        Returns:
+            tuple[list[object], dict | None]: Objetos devueltos por el hook y ``dict_value`` final.
+        """
+        result = []
+        for objmodel in objmodels:
+            objmodel, dict_value = hook(objmodel, dict_value, session=session)
+            result.append(objmodel)
+        return result, dict_value
+
     def before_insert(self, objmodel: object|None=None
                       , dict_value: dict|None=None
                       , session: sessionmaker|None=None):
@@ -498,3 +789,39 @@ class BKOraManagerBuilder(BKOraManager, BKOraRoutineExecutor):
                      , session: sessionmaker|None=None):
         """Hook opcional: lógica posterior a un DELETE."""
         return objmodel, dict_value
+
+    def before_insert_many(self, objmodels: list
+                           , dict_value: dict|None=None
+                           , session: sessionmaker|None=None):
+        """Hook opcional: lógica previa a un INSERT por lotes. Por defecto aplica ``before_insert`` a cada objeto."""
+        return self._apply_row_hook(self.before_insert, objmodels, dict_value, session)
+
+    def after_insert_many(self, objmodels: list
+                          , dict_value: dict|None=None
+                          , session: sessionmaker|None=None):
+        """Hook opcional: lógica posterior a un INSERT por lotes. Por defecto aplica ``after_insert`` a cada objeto."""
+        return self._apply_row_hook(self.after_insert, objmodels, dict_value, session)
+
+    def before_update_many(self, objmodels: list
+                           , dict_value: dict|None=None
+                           , session: sessionmaker|None=None):
+        """Hook opcional: lógica previa a un UPDATE por lotes. Por defecto aplica ``before_update`` a cada objeto."""
+        return self._apply_row_hook(self.before_update, objmodels, dict_value, session)
+
+    def after_update_many(self, objmodels: list
+                          , dict_value: dict|None=None
+                          , session: sessionmaker|None=None):
+        """Hook opcional: lógica posterior a un UPDATE por lotes. Por defecto aplica ``after_update`` a cada objeto."""
+        return self._apply_row_hook(self.after_update, objmodels, dict_value, session)
+
+    def before_delete_many(self, objmodels: list
+                           , dict_value: dict|None=None
+                           , session: sessionmaker|None=None):
+        """Hook opcional: lógica previa a un DELETE por lotes. Por defecto aplica ``before_delete`` a cada objeto."""
+        return self._apply_row_hook(self.before_delete, objmodels, dict_value, session)
+
+    def after_delete_many(self, objmodels: list
+                          , dict_value: dict|None=None
+                          , session: sessionmaker|None=None):
+        """Hook opcional: lógica posterior a un DELETE por lotes. Por defecto aplica ``after_delete`` a cada objeto."""
+        return self._apply_row_hook(self.after_delete, objmodels, dict_value, session)
@@ -18,9 +18,19 @@ Dependencias:
 
 Resumen de métodos:
     - getlist(): Ejecuta una consulta SELECT definida por la subclase y devuelve una lista de objetos del modelo.
+      Con ``result_cache`` el resultado se guarda en una `BKOraResultCache` y las escrituras del manager
+      (insert/update/delete) invalidan los resultados de su tabla al confirmarse la transacción.
+    - getlist_iter(): Igual que getlist() pero devuelve un generador en streaming de objetos del modelo.
+    - getlist_keyset(cursor, sort_key): Devuelve una página paginando por keyset y el cursor de la siguiente.
+    - getlist_parallel(partitions, strategy): Igual que getlist_iter() pero leyendo la consulta repartida en
+      particiones (hash, range o rowid) ejecutadas en paralelo, cada una con su propia conexión del pool.
+    Con ``process_pool`` (`BKOraProcessPool`), los getlist* construyen y validan los objetos del modelo en
+    varios procesos, por lotes de filas, y los devuelven en orden.
     - insert_model(objmodel): Inserta un objeto en la base de datos, usando los hooks before/after_insert.
     - update_model(objmodel): Actualiza un objeto en la base de datos, usando los hooks before/after_update.
     - delete_model(objmodel): Elimina un objeto en la base de datos, usando los hooks before/after_delete.
+    - insert_many / update_many / delete_many(objmodels): Igual que los anteriores para una colección de objetos,
+      por lotes con executemany y los hooks before/after_<op>_many.
     - call_procedure(proc_name, params): Ejecuta un procedimiento almacenado.
     - call_function(func_name, params): Ejecuta una función almacenada y devuelve su valor.
 
@@ -28,6 +38,9 @@ Hooks personalizables (opcionalmente sobreescribibles):
     - before_insert / after_insert
     - before_update / after_update
     - before_delete / after_delete
+    - before_insert_many / after_insert_many (por defecto aplican before/after_insert a cada objeto)
+    - before_update_many / after_update_many
+    - before_delete_many / after_delete_many
 
 Métodos abstractos que deben ser implementados por la subclase:
     - get_sql_select()
@@ -36,16 +49,21 @@ Métodos abstractos que deben ser implementados por la subclase:
     - get_sql_delete()
 """
 
-from BKLibOra.config import PAGE_VALUES
+from BKLibOra.config import (PAGE_VALUES, FETCH_VALUES, BULK_VALUES, RESULT_CACHE_VALUES, PARALLEL_VALUES
+                             , PROCESS_VALUES)
 from BKLibOra.BKOraManager.BKOraManager import BKOraManager
-from BKLibOra.BKOraManager.BKOraManager_utils import counter_row_query, range_row_query, BKOraRoutineExecutor
+from BKLibOra.BKOraManager.BKOraColumnar import columnar_dtypes
+from BKLibOra.BKOraManager.BKOraManager_utils import (BKOraCounterExecutor, BKOraKeysetExecutor, BKOraRoutineExecutor
+                                                      , BKOraResultCacheExecutor, BKOraParallelExecutor, BKOraProcessExecutor
+                                                      , validate_for_write)
 from sqlalchemy.orm import sessionmaker
 from abc import ABC, abstractmethod
 import time
 import copy
 
 
-class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
+class BKOraManagerDB(BKOraManager, BKOraCounterExecutor, BKOraKeysetExecutor, BKOraRoutineExecutor
+                     , BKOraResultCacheExecutor, BKOraParallelExecutor, BKOraProcessExecutor):
     """
     Clase base abstracta para manejar operaciones CRUD sobre una tabla Oracle usando un modelo.
 
@@ -71,8 +89,10 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         after_update(params): Lógica posterior a la ejecución de un UPDATE.
         before_delete(params): Lógica previa a la ejecución de un DELETE.
         after_delete(params): Lógica posterior a la ejecución de un DELETE.
+        before_<op>_many(objmodels) / after_<op>_many(objmodels): Versiones por lotes de los hooks anteriores.
     """
-    DEFAULT_KWARGS = copy.deepcopy(PAGE_VALUES)
+    DEFAULT_KWARGS = copy.deepcopy(PAGE_VALUES | FETCH_VALUES | BULK_VALUES | RESULT_CACHE_VALUES | PARALLEL_VALUES
+                                   | PROCESS_VALUES)
 
     def __init__(self, connector, model, *args, **kwargs):
         """
@@ -135,10 +155,82 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
             list[object]: Lista de instancias del modelo definido.
         """
         sql, params = self.get_sql_select()
-        results = self.fetch_all(sql, params, sess=session)
-        return self.model.from_list(results)
+        return self.cached_models(sql, params, session=session)
+
+    def getlist_iter(self, session: sessionmaker|None=None, arraysize: int|None=None):
+        """
+        Ejecuta la consulta SELECT definida por `get_sql_select()` en modo streaming.
+
+        A diferencia de :py:meth:`getlist`, los resultados no se materializan en una lista:
+        se devuelve un generador que construye cada instancia del modelo a medida que se
+        consume, leyendo del cursor en bloques de ``arraysize`` filas.
+
+        Args:
+            session (sessionmaker | None, opcional): Sesión de SQLAlchemy a reutilizar.
+            arraysize (int | None, opcional): Filas por round-trip. Si es ``None`` se usa
+                ``self.kwargs["arraysize"]``.
+
+        Yields:
+            object: Instancias del modelo definido.
+        """
+        sql, params = self.get_sql_select()
+        arraysize = arraysize or self.kwargs.get("arraysize")
+        return self.iter_models(sql, params, session=session, arraysize=arraysize)
+
+    def getlist_parallel(self, partitions: int|None=None, strategy: str|None=None, column: str|None=None
+                         , workers: int|None=None, ordered: bool|None=None, arraysize: int|None=None):
+        """
+        Ejecuta la consulta SELECT definida por `get_sql_select()` repartida en particiones paralelas.
+
+        Pensado para extracciones completas de tablas grandes, donde una única lectura en serie queda
+        limitada por los round-trips de una sola conexión. La consulta se divide con ``strategy``
+        (``hash``, ``range`` o ``rowid``, ver `partition_plan`) y cada partición se lee en streaming en
+        su propio hilo y con su propia conexión del pool; el resultado es un único generador, como
+        en :py:meth:`getlist_iter`.
+
+        Args:
+            partitions (int | None, opcional): Particiones. Por defecto ``kwargs["parallel_partitions"]``
+                o ``kwargs["parallel_workers"]``.
+            strategy (str | None, opcional): Estrategia. Por defecto ``kwargs["partition_strategy"]``.
+            column (str | None, opcional): Columna de reparto. Por defecto ``kwargs["partition_column"]``
+                o la clave primaria del modelo.
+            workers (int | None, opcional): Hilos (y conexiones) simultáneos. Por defecto
+                ``kwargs["parallel_workers"]``.
+            ordered (bool | None, opcional): Devuelve las particiones en orden. Por defecto
+                ``kwargs["parallel_ordered"]``.
+            arraysize (int | None, opcional): Filas por round-trip. Por defecto ``kwargs["arraysize"]``.
+
+        Yields:
+            object: Instancias del modelo definido.
+        """
+        sql, params = self.get_sql_select()
+        return self.fetch_parallel(sql, params, strategy=strategy, partitions=partitions, workers=workers
+                                   , ordered=ordered, column=column, arraysize=arraysize, model=self.model
+                                   , trusted=self.kwargs.get("trusted_read"))
+
+    def getlist_columnar(self, session: sessionmaker|None=None, batch_size: int|None=None
+                         , dtypes: dict|None=None):
+        """
+        Ejecuta la consulta SELECT definida por `get_sql_select()` y devuelve el resultado en formato columnar.
+
+        Pensado para procesos analíticos: no se crea ningún objeto por fila, sino un array de NumPy
+        por columna (con su máscara de nulos). El dtype de cada columna se toma de las columnas
+        declaradas en el modelo (``BKOraColumn.type`` / tipos ``BKNumber``, ``BKFloat``…).
+
+        Args:
+            session (sessionmaker | None, opcional): Sesión de SQLAlchemy a reutilizar.
+            batch_size (int | None, opcional): Filas por lote. Si es ``None`` se usa ``self.kwargs["arraysize"]``.
+            dtypes (dict | None, opcional): dtypes que sustituyen a los deducidos del modelo.
+
+        Returns:
+            BKOraColumnarResult: Arrays por columna y máscaras de nulos.
+        """
+        sql, params = self.get_sql_select()
+        batch_size = batch_size or self.kwargs.get("arraysize")
+        dtypes = columnar_dtypes(self.model) | (dtypes or {})
+        return self.fetch_columnar(sql, params, sess=session, dtypes=dtypes, batch_size=batch_size)
     
-    def getlist_numerated(self, session: sessionmaker|None=None) -> dict:
+    def getlist_numerated(self, session: sessionmaker|None=None, count_over: bool|None=None) -> dict:
         """
         Devuelve todos los registros que cumple la consulta, el total de filas
         y métricas de tiempo de ejecución.
@@ -157,6 +249,10 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
                 Sesión de SQLAlchemy a reutilizar.  
                 Si ``None`` se usa la configuración por defecto
                 interna de ``fetch_all``.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict:  
@@ -177,23 +273,17 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         time_exec_init = time.perf_counter()
 
         sql, params = self.get_sql_select()
-        counter_query = counter_row_query(sql)
-
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
-
         time_result_init = time.perf_counter()
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
-        time_result = time.perf_counter() - time_result_init
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session, count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
 
         time_exec = time.perf_counter() - time_exec_init
 
         result_dict = {
             "result": result_models,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "count": count,
             "time": {
                 "time_result": time_result,
                 "time_count": time_count,
@@ -203,7 +293,7 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
 
         return result_dict
 
-    def getlist_paginated(self, session: sessionmaker|None=None) -> dict:
+    def getlist_paginated(self, session: sessionmaker|None=None, count_over: bool|None=None) -> dict:
         """
         Obtiene todos los registros pero los divide en páginas de tamaño fijo.
 
@@ -221,6 +311,10 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         Args:
             session (sessionmaker | None, opcional):
                 Sesión de SQLAlchemy a reutilizar.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict:  
@@ -238,16 +332,10 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         time_exec_init = time.perf_counter()
 
         sql, params = self.get_sql_select()
-        counter_query = counter_row_query(sql)
-
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
-
         time_result_init = time.perf_counter()
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
-        time_result = time.perf_counter() - time_result_init
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session, count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
 
         time_page_init = time.perf_counter()
         chunks = [result_models[i:i + self.kwargs.get("rows_page")]
@@ -259,7 +347,7 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         result_dict = {
             "result": chunks,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "count": count,
             "time": {
                 "time_page": time_page,
                 "time_result": time_result,
@@ -270,7 +358,8 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
 
         return result_dict
     
-    def getlist_page(self, page_range: dict|None=None, session: sessionmaker|None=None) -> dict:
+    def getlist_page(self, page_range: dict|None=None, session: sessionmaker|None=None
+                     , count_over: bool|None=None) -> dict:
         """
         Devuelve solo la página solicitada mediante límites ``OFFSET``/``LIMIT``.
 
@@ -288,6 +377,10 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
                 Si es ``None`` se utiliza el rango por defecto indicado arriba.
             session (sessionmaker | None, opcional):
                 Sesión de SQLAlchemy a reutilizar.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict: estructura análoga a :py:meth:`getlist_numerated`.
@@ -306,24 +399,20 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
             }
 
         sql, params = self.get_sql_select()
-        counter_query = counter_row_query(sql)
-
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
-
         time_result_init = time.perf_counter()
-        sql = range_row_query(sql, offset=page_range.get("page_init"), limit=page_range.get("page_fin"))
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
-        time_result = time.perf_counter() - time_result_init
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session
+                                                           , offset=page_range.get("page_init")
+                                                           , limit=page_range.get("page_fin")
+                                                           , count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
 
         time_exec = time.perf_counter() - time_exec_init
 
         result_dict = {
             "result": result_models,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "count": count,
             "time": {
                 "time_result": time_result,
                 "time_count": time_count,
@@ -333,7 +422,8 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
 
         return result_dict
 
-    def getlist_range(self, _range: tuple|None=None, session: sessionmaker|None=None):
+    def getlist_range(self, _range: tuple|None=None, session: sessionmaker|None=None
+                      , count_over: bool|None=None):
         """
         Recupera los registros comprendidos en el rango dado
         (basado en *OFFSET* y *LIMIT*).
@@ -344,6 +434,10 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
                 ``page_range`` pero se pasa como tupla.
             session (sessionmaker | None, opcional):
                 Sesión de SQLAlchemy a reutilizar.
+            count_over (bool | None, opcional):
+                Si es ``True`` el total se obtiene en la misma sentencia que los
+                datos (``COUNT(*) OVER ()``) en lugar de con una consulta de
+                conteo aparte. Si es ``None`` se usa ``self.kwargs["count_over"]``.
 
         Returns:
             dict: estructura análoga a :py:meth:`getlist_numerated`.
@@ -358,16 +452,74 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         start, fin = _range
 
         sql, params = self.get_sql_select()
-        counter_query = counter_row_query(sql)
+        time_result_init = time.perf_counter()
+        result_set, count, time_count = self.fetch_counted(sql, params, session=session
+                                                           , offset=start
+                                                           , limit=fin
+                                                           , count_over=count_over)
+        result_models = self.models_from_result(result_set)
+        time_result = time.perf_counter() - time_result_init - time_count
+
+        time_exec = time.perf_counter() - time_exec_init
+
+        result_dict = {
+            "result": result_models,
+            "result_set": result_set,
+            "count": count,
+            "time": {
+                "time_result": time_result,
+                "time_count": time_count,
+                "time_exec": time_exec,
+            }
+        }
 
-        time_count_init = time.perf_counter()
-        count = self.fetch_one(counter_query, params, sess=session)
-        time_count = time.perf_counter() - time_count_init
+        return result_dict
+
+    def getlist_keyset(self, cursor: str|None=None, sort_key: str|list|None=None
+                       , rows: int|None=None, descending: bool=False
+                       , session: sessionmaker|None=None) -> dict:
+        """
+        Devuelve una página de registros paginando por *keyset* en lugar de ``OFFSET``.
+
+        Las filas se ordenan por ``sort_key`` seguido de las columnas de clave primaria
+        del modelo (``primary_key=True``) y cada página se localiza a partir de los
+        valores de la última fila de la anterior, por lo que las páginas profundas
+        cuestan lo mismo que la primera.
+
+        Args:
+            cursor (str | None, opcional):
+                Token opaco devuelto en ``cursor`` por la página anterior.
+                ``None`` para la primera página.
+            sort_key (str | list[str] | None, opcional):
+                Columna(s) de ordenación previas a la clave primaria.
+            rows (int | None, opcional):
+                Filas por página. Por defecto ``self.kwargs["rows_page"]``.
+            descending (bool, opcional):
+                Orden descendente.
+            session (sessionmaker | None, opcional):
+                Sesión de SQLAlchemy a reutilizar.
+
+        Returns:
+            dict:
+                * ``result`` (list[Model]): instancias del modelo de la página.
+                * ``result_set`` (list[dict]): datos crudos de la página.
+                * ``cursor`` (str | None): token de la página siguiente o ``None``
+                  si no hay más filas.
+                * ``time`` (dict): ``time_result`` y ``time_exec``.
+
+        Raises:
+            ValueError: si el modelo no declara clave primaria, ``sort_key`` no es una
+            columna del modelo o el cursor no es válido o no corresponde a la ordenación pedida.
+        """
+
+        time_exec_init = time.perf_counter()
+
+        sql, params = self.get_sql_select()
 
         time_result_init = time.perf_counter()
-        sql = range_row_query(sql, offset=start, limit=fin)
-        result_set = self.fetch_all(sql, params, sess=session)
-        result_models = self.model.from_list(result_set)
+        result_set, next_cursor = self.fetch_keyset(sql, params, cursor=cursor, sort_key=sort_key
+                                                    , rows=rows, descending=descending, session=session)
+        result_models = self.models_from_result(result_set)
         time_result = time.perf_counter() - time_result_init
 
         time_exec = time.perf_counter() - time_exec_init
@@ -375,10 +527,9 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         result_dict = {
             "result": result_models,
             "result_set": result_set,
-            "count": count.get("counter"),
+            "cursor": next_cursor,
             "time": {
                 "time_result": time_result,
-                "time_count": time_count,
                 "time_exec": time_exec,
             }
         }
@@ -395,8 +546,9 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_insert()
         if hasattr(self, "before_insert"):
             objmodel = self.before_insert(objmodel, session=session)
-        params = objmodel.to_dict()
-        self.execute(sql, params, session=session)
+        params = validate_for_write(objmodel).to_dict()
+        self.execute(sql, params, sess=session)
+        self.invalidate_cache(session)
         if hasattr(self, "after_insert"):
             objmodel = self.after_insert(objmodel, session=session)
 
@@ -413,8 +565,9 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         sql, _ = self.get_sql_update()
         if hasattr(self, "before_update"):
             objmodel = self.before_update(objmodel, session=session)
-        params = objmodel.to_dict()
-        self.execute(sql, params, session=session)
+        params = validate_for_write(objmodel).to_dict()
+        self.execute(sql, params, sess=session)
+        self.invalidate_cache(session)
         if hasattr(self, "after_update"):
             objmodel = self.after_update(objmodel, session=session)
 
@@ -432,13 +585,110 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
         if hasattr(self, "before_delete"):
             objmodel = self.before_delete(objmodel, session=session)
         params = objmodel.to_dict()
-        self.execute(sql, params, session=session)
+        self.execute(sql, params, sess=session)
+        self.invalidate_cache(session)
         if hasattr(self, "after_delete"):
             objmodel = self.after_delete(objmodel, session=session)
 
         if only:
             return objmodel
 
+    def insert_many(self, objmodels, session: sessionmaker|None=None, batch_size: int|None=None
+                    , batch_errors: bool|None=None, only: bool=False) -> dict:
+        """
+        Inserta una colección de instancias del modelo mediante ``executemany``.
+
+        Args:
+            objmodels (Iterable[object]): Instancias del modelo a insertar.
+            session (sessionmaker | None, opcional): Sesión de SQLAlchemy a reutilizar.
+            batch_size (int | None, opcional): Filas por lote. Por defecto ``self.kwargs["batch_size"]``.
+            batch_errors (bool | None, opcional): Recoge los errores por fila en lugar de abortar.
+                Por defecto ``self.kwargs["batch_errors"]``.
+            only (bool, opcional): Si es ``True`` el resultado incluye los objetos procesados.
+
+        Returns:
+            dict: Resumen descrito en :py:meth:`_execute_model_batch`.
+        """
+        sql, _ = self.get_sql_insert()
+        return self._execute_model_batch(sql, objmodels, self.before_insert_many, self.after_insert_many
+                                         , session, batch_size, batch_errors, only, validate=True)
+
+    def update_many(self, objmodels, session: sessionmaker|None=None, batch_size: int|None=None
+                    , batch_errors: bool|None=None, only: bool=False) -> dict:
+        """
+        Actualiza una colección de instancias del modelo mediante ``executemany``.
+
+        Args:
+            objmodels (Iterable[object]): Instancias del modelo a actualizar.
+            session, batch_size, batch_errors, only: Ver :py:meth:`insert_many`.
+
+        Returns:
+            dict: Resumen descrito en :py:meth:`_execute_model_batch`.
+        """
+        sql, _ = self.get_sql_update()
+        return self._execute_model_batch(sql, objmodels, self.before_update_many, self.after_update_many
+                                         , session, batch_size, batch_errors, only, validate=True)
+
+    def delete_many(self, objmodels, session: sessionmaker|None=None, batch_size: int|None=None
+                    , batch_errors: bool|None=None, only: bool=False) -> dict:
+        """
+        Elimina una colección de instancias del modelo mediante ``executemany``.
+
+        Args:
+            objmodels (Iterable[object]): Instancias del modelo a eliminar.
+            session, batch_size, batch_errors, only: Ver :py:meth:`insert_many`.
+
+        Returns:
+            dict: Resumen descrito en :py:meth:`_execute_model_batch`.
+        """
+        sql, _ = self.get_sql_delete()
+        return self._execute_model_batch(sql, objmodels, self.before_delete_many, self.after_delete_many
+                                         , session, batch_size, batch_errors, only)
+
+    def _execute_model_batch(self, sql, objmodels, before, after, session, batch_size, batch_errors, only, validate=False):
+        """
+        Ejecuta ``sql`` por lotes para una colección de modelos aplicando los hooks de lote.
+
+        Returns:
+            dict:
+                * ``rowcount`` (int): filas afectadas.
+                * ``errors`` (list[dict]): filas rechazadas (``index``, ``code``, ``message``)
+                  cuando se recogen errores por lote.
+                * ``time`` (dict): ``time_hooks``, ``time_exec_many`` y ``time_exec``.
+                * ``result`` (list[object]): objetos procesados, solo si ``only``.
+        """
+        time_exec_init = time.perf_counter()
+
+        if batch_size is None:
+            batch_size = self.kwargs.get("batch_size")
+        if batch_errors is None:
+            batch_errors = self.kwargs.get("batch_errors")
+
+        time_hooks_init = time.perf_counter()
+        objmodels = before(list(objmodels), session=session)
+        if validate:
+            objmodels = [validate_for_write(objmodel) for objmodel in objmodels]
+        params_list = [objmodel.to_dict() for objmodel in objmodels]
+        time_hooks = time.perf_counter() - time_hooks_init
+
+        time_exec_many_init = time.perf_counter()
+        summary = self.execute_many(sql, params_list, sess=session, batch_size=batch_size, batch_errors=batch_errors)
+        self.invalidate_cache(session)
+        time_exec_many = time.perf_counter() - time_exec_many_init
+
+        time_hooks_init = time.perf_counter()
+        objmodels = after(objmodels, session=session)
+        time_hooks += time.perf_counter() - time_hooks_init
+
+        summary["time"] = {
+            "time_hooks": time_hooks,
+            "time_exec_many": time_exec_many,
+            "time_exec": time.perf_counter() - time_exec_init,
+        }
+        if only:
+            summary["result"] = objmodels
+        return summary
+
     def before_insert(self, objmodel: object|None=None, session: sessionmaker|None=None):
         """Hook opcional: lógica previa a un INSERT."""
         return objmodel
@@ -462,3 +712,27 @@ class BKOraManagerDB(BKOraManager, BKOraRoutineExecutor):
     def after_delete(self, objmodel: object|None=None, session: sessionmaker|None=None):
         """Hook opcional: lógica posterior a un DELETE."""
         return objmodel
+
+    def before_insert_many(self, objmodels: list, session: sessionmaker|None=None):
+        """Hook opcional: lógica previa a un INSERT por lotes. Por defecto aplica ``before_insert`` a cada objeto."""
+        return [self.before_insert(objmodel, session=session) for objmodel in objmodels]
+
+    def after_insert_many(self, objmodels: list, session: sessionmaker|None=None):
+        """Hook opcional: lógica posterior a un INSERT por lotes. Por defecto aplica ``after_insert`` a cada objeto."""
+        return [self.after_insert(objmodel, session=session) for objmodel in objmodels]
+
+    def before_update_many(self, objmodels: list, session: sessionmaker|None=None):
+        """Hook opcional: lógica previa a un UPDATE por lotes. Por defecto aplica ``before_update`` a cada objeto."""
+        return [self.before_update(objmodel, session=session) for objmodel in objmodels]
+
+    def after_update_many(self, objmodels: list, session: sessionmaker|None=None):
+        """Hook opcional: lógica posterior a un UPDATE por lotes. Por defecto aplica ``after_update`` a cada objeto."""
+        return [self.after_update(objmodel, session=session) for objmodel in objmodels]
+
+    def before_delete_many(self, objmodels: list, session: sessionmaker|None=None):
+        """Hook opcional: lógica previa a un DELETE por lotes. Por defecto aplica ``before_delete`` a cada objeto."""
+        return [self.before_delete(objmodel, session=session) for objmodel in objmodels]
+
+    def after_delete_many(self, objmodels: list, session: sessionmaker|None=None):
+        """Hook opcional: lógica posterior a un DELETE por lotes. Por defecto aplica ``after_delete`` a cada objeto."""
+        return [self.after_delete(objmodel, session=session) for objmodel in objmodels]
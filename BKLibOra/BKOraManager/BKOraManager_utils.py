@@ -1,4 +1,16 @@
+from BKLibOra.BKOraManager.BKOraInstrumentation import operation_label
+from BKLibOra.BKOraManager.BKOraFetchTuner import page_fetch_options
+from BKLibOra.BKOraManager.BKOraParallel import merge_iterators
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
+from datetime import date, datetime
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+import base64
+import json
+import re
+import time
 
 def wrapper_where_query(query: str) -> str:
     """
@@ -105,12 +117,651 @@ def range_row_query(query: str, offset: int, limit: int) -> str:
     """
     return format_query
 
+def counter_window_query(query: str, offset: int|None=None, limit: int|None=None) -> str:
+    """
+    Envuelve la consulta añadiendo el total de filas como columna analítica
+    ``COUNT(*) OVER ()`` y, opcionalmente, la paginación ``OFFSET … FETCH NEXT …``.
+
+    La función analítica se evalúa antes de ``OFFSET/FETCH``, por lo que cada fila
+    de la página lleva el total de la consulta completa: recuento y datos se obtienen
+    en una sola ejecución.
+
+    El orden de la consulta original queda dentro de la vista, donde Oracle no garantiza
+    que se conserve; la página se ordena por ``ROWNUM``, que numera las filas en el orden
+    en que salen de la vista ordenada, de modo que ``OFFSET/FETCH`` se aplica sobre el
+    mismo orden que la consulta original.
+
+    Args:
+        query (str): Consulta SQL original.
+        offset (int | None): Filas a omitir. Si es ``None`` no se pagina.
+        limit (int | None): Máximo de filas a devolver.
+
+    Returns:
+        str: Consulta SQL con la columna ``BK_TOTAL_ROWS``.
+
+    Example:
+        >>> print(counter_window_query("SELECT id FROM users ORDER BY id", 20, 10))
+        SELECT QUERY_WINDOW.*, COUNT(*) OVER () AS BK_TOTAL_ROWS FROM (
+            SELECT id FROM users ORDER BY id
+        ) QUERY_WINDOW
+        ORDER BY ROWNUM
+        OFFSET 20 ROWS FETCH NEXT 10 ROWS ONLY
+    """
+    format_query = f"""
+        SELECT QUERY_WINDOW.*, COUNT(*) OVER () AS BK_TOTAL_ROWS FROM (
+            {query}
+        ) QUERY_WINDOW
+    """
+    if offset is not None:
+        format_query = range_row_query(f"{format_query}    ORDER BY ROWNUM", offset=offset, limit=limit)
+    return format_query
+
+def row_mapper(model, keys, trusted: bool=False):
+    """
+    Devuelve una función ``fila -> instancia del modelo`` para un resultado con columnas ``keys``.
+
+    Si el modelo ofrece ``row_factory()`` (``BKOraModelDB``) se usa su constructor compilado,
+    que asigna los valores por posición sin pasar por diccionarios (o, si el modelo sobrescribe
+    ``__init__``, ``from_dict`` o ``from_list``, delega en ellos); en otro caso se construye un
+    diccionario por fila y se delega en ``from_dict()``.
+
+    Args:
+        model (object): Clase modelo con ``row_factory()`` o ``from_dict()``.
+        keys (Iterable[str]): Nombres de columna del resultado, en orden.
+        trusted (bool, optional): Crea los objetos en modo ``trusted`` (sin validar, ver
+            `BKOraModelComplex.from_dict`).
+
+    Returns:
+        Callable[[tuple], object]: Constructor de instancias por fila.
+    """
+    keys = tuple(keys)
+    if hasattr(model, "row_factory"):
+        return model.row_factory(keys)
+    if trusted and hasattr(model, "pending_validation"):
+        return lambda row: model.from_dict(dict(zip(keys, row)), trusted=True)
+    return lambda row: model.from_dict(dict(zip(keys, row)))
+
+def models_from_list(model, data_list: list, trusted: bool=False) -> list:
+    """
+    Convierte filas ``list[dict]`` en instancias del modelo, en modo ``trusted`` si se indica.
+
+    Args:
+        model (object): Clase modelo con ``from_list()``.
+        data_list (list[dict]): Filas del resultado.
+        trusted (bool, optional): Omite la validación de lectura. Solo afecta a los modelos que la
+            aplazan (``BKOraModelComplex``); el resto no valida al leer y se crea igual.
+
+    Returns:
+        list[object]: Instancias del modelo.
+    """
+    if trusted and hasattr(model, "pending_validation"):
+        return model.from_list(data_list, trusted=True)
+    return model.from_list(data_list)
+
+def dict_batches(iterator, batch_size: int):
+    """
+    Agrupa un iterador de filas ``dict`` en lotes ``(cabecera, filas)`` con las filas como tuplas.
+
+    Es el formato con el que se envían los resultados a otros procesos (ver `BKOraProcessPool`).
+
+    Args:
+        iterator (Iterable[dict]): Filas del resultado (todas con las mismas columnas).
+        batch_size (int): Filas por lote.
+
+    Yields:
+        tuple[tuple[str], list[tuple]]: Columnas y filas de cada lote.
+    """
+    iterator = iter(iterator)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield tuple(batch[0]), [tuple(row.values()) for row in batch]
+
+def validate_for_write(objmodel):
+    """
+    Valida un objeto leído en modo ``trusted`` antes de escribirlo en la base de datos.
+
+    Los objetos creados normalmente ya se validaron al construirse y se devuelven sin cambios.
+
+    Args:
+        objmodel (object): Instancia del modelo.
+
+    Returns:
+        object: La misma instancia.
+
+    Raises:
+        TypeError, ValueError: Si algún campo no cumple sus validaciones.
+    """
+    if getattr(objmodel, "pending_validation", False):
+        objmodel.validate()
+    return objmodel
+
+_DML_TABLE = re.compile(r"^\s*(?:INSERT\s+INTO|UPDATE|DELETE\s+FROM|DELETE|MERGE\s+INTO)\s+([\w$#.\"]+)", re.I)
+
+def dml_table_name(sql: str|None) -> str|None:
+    """
+    Devuelve la tabla afectada por una sentencia INSERT, UPDATE, DELETE o MERGE.
+
+    Args:
+        sql (str | None): Sentencia DML.
+
+    Returns:
+        str | None: Nombre de la tabla en mayúsculas (con esquema si lo lleva) o ``None``.
+    """
+    match = _DML_TABLE.match(sql or "")
+    if not match:
+        return None
+    return match.group(1).replace('"', '').upper()
+
+# Claves de ``Session.info`` con el estado de la transacción en curso (ver `mark_session_writes`)
+_TX_TRACKED = "bk_tx_tracked"
+_TX_WRITES = "bk_tx_writes"
+_TX_ON_COMMIT = "bk_tx_on_commit"
+
+
+def _after_commit(session):
+    for callback in session.info.pop(_TX_ON_COMMIT, ()):
+        callback()
+
+
+def _after_transaction_end(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_TX_WRITES, None)
+        session.info.pop(_TX_ON_COMMIT, None)
+
+
+def _track_transaction(session):
+    """Registra una vez por sesión los eventos que cierran el estado de su transacción."""
+    if not session.info.get(_TX_TRACKED):
+        session.info[_TX_TRACKED] = True
+        event.listen(session, "after_commit", _after_commit)
+        event.listen(session, "after_transaction_end", _after_transaction_end)
+
+
+def mark_session_writes(session):
+    """
+    Marca que la transacción en curso de ``session`` tiene escrituras sin confirmar.
+
+    La marca se borra al terminar la transacción (commit, rollback o cierre).
+    """
+    _track_transaction(session)
+    session.info[_TX_WRITES] = True
+
+
+def session_has_writes(session) -> bool:
+    """``True`` si la transacción en curso de ``session`` tiene escrituras sin confirmar (ver `mark_session_writes`)."""
+    return session is not None and bool(session.info.get(_TX_WRITES))
+
+
+def on_commit(session, callback):
+    """
+    Ejecuta ``callback()`` cuando se confirme la transacción en curso de ``session``.
+
+    Si la transacción termina con rollback (o se cierra sin commit), ``callback`` se descarta.
+    """
+    _track_transaction(session)
+    session.info.setdefault(_TX_ON_COMMIT, []).append(callback)
+
+
+def primary_key_columns(model) -> list:
+    """
+    Devuelve los nombres de columna marcados como clave primaria en el modelo.
+
+    Se apoya en ``model.get_columns_info()`` (``BKOraColumn(primary_key=True)`` o
+    los tipos ``BKString``/``BKNumber``… con ``primary_key=True``).
+
+    Args:
+        model (object): Clase modelo con ``get_columns_info()``.
+
+    Returns:
+        list[str]: Columnas de la clave primaria en orden de declaración.
+    """
+    if not hasattr(model, "get_columns_info"):
+        return []
+    return [column for column, info in model.get_columns_info().items() if info.get("primary_key")]
+
+_SQL_IDENTIFIER = re.compile(r"[A-Za-z][A-Za-z0-9_$#]*")
+
+def model_column(model, name: str, argument: str="column") -> str:
+    """
+    Comprueba que ``name`` es una columna que se puede insertar en el SQL generado (``ORDER BY``,
+    predicados de keyset o de reparto).
+
+    Si el modelo declara columnas (``get_columns_info()``), ``name`` debe ser una de ellas, sin distinguir
+    mayúsculas, y se devuelve con el nombre declarado; si no, debe ser un identificador simple de Oracle
+    (letra inicial seguida de letras, dígitos, ``_``, ``$`` o ``#``).
+
+    Args:
+        model (object): Clase modelo, opcionalmente con ``get_columns_info()``.
+        name (str): Nombre de columna recibido.
+        argument (str): Nombre del argumento, para el mensaje de error.
+
+    Returns:
+        str: Nombre de la columna.
+
+    Raises:
+        ValueError: Si ``name`` no es una columna del modelo o un identificador válido.
+    """
+    columns = model.get_columns_info() if hasattr(model, "get_columns_info") else {}
+    if isinstance(name, str):
+        if columns:
+            for column in columns:
+                if column.lower() == name.lower():
+                    return column
+        elif _SQL_IDENTIFIER.fullmatch(name):
+            return name
+    raise ValueError(f"{argument} {name!r} no es una columna del modelo {getattr(model, '__name__', model)}")
+
+def keyset_row_query(query: str, columns: list, limit: int, descending: bool=False, seek: bool=False) -> str:
+    """
+    Genera la consulta de una página por *keyset* (*seek method*).
+
+    En lugar de saltar filas con ``OFFSET``, la página siguiente se localiza con un
+    predicado sobre las columnas de ordenación a partir de los valores de la última
+    fila leída, por lo que cualquier página cuesta lo mismo que la primera cuando
+    existe un índice sobre esas columnas. Oracle no admite comparaciones de tuplas
+    ``(a, b) > (:a, :b)``, así que el predicado se expande en su forma equivalente::
+
+        (c0 > :keyset_0) OR (c0 = :keyset_0 AND c1 > :keyset_1) OR ...
+
+    Args:
+        query (str): Consulta SQL original.
+        columns (list[str]): Columnas de ordenación; deben identificar la fila de forma
+            única (se completan con la clave primaria) y no admitir nulos.
+        limit (int): Filas a devolver.
+        descending (bool): Orden descendente.
+        seek (bool): Si es ``True`` se añade el predicado con los binds ``keyset_<n>``.
+
+    Returns:
+        str: Consulta SQL paginada por keyset.
+
+    Raises:
+        ValueError: Si no hay columnas o ``limit`` no es positivo.
+    """
+    if not columns:
+        raise ValueError("La paginación keyset requiere al menos una columna de ordenación")
+    if limit <= 0:
+        raise ValueError("limit debe ser un valor positivo")
+
+    comparator = "<" if descending else ">"
+    direction = " DESC" if descending else ""
+
+    where = ""
+    if seek:
+        branches = []
+        for i, column in enumerate(columns):
+            terms = [f"{prev} = :keyset_{j}" for j, prev in enumerate(columns[:i])]
+            terms.append(f"{column} {comparator} :keyset_{i}")
+            branches.append("(" + " AND ".join(terms) + ")")
+        where = "WHERE " + "\n               OR ".join(branches)
+
+    order_by = ", ".join(f"{column}{direction}" for column in columns)
+    format_query = f"""
+        SELECT * FROM (
+            {query}
+        ) QUERY_KEYSET
+        {where}
+        ORDER BY {order_by}
+        FETCH FIRST {limit} ROWS ONLY
+    """
+    return format_query
+
+def partition_query(query: str, predicate: str) -> str:
+    """
+    Envuelve la consulta y le añade el predicado que selecciona una partición.
+
+    Args:
+        query (str): Consulta SQL original.
+        predicate (str): Condición de la partición (por ejemplo ``ORA_HASH(ID, 3) = :bk_partition``).
+
+    Returns:
+        str: Consulta SQL de la partición.
+
+    Example:
+        >>> print(partition_query("SELECT id FROM users", "ORA_HASH(id, 3) = :bk_partition"))
+        SELECT * FROM (
+            SELECT id FROM users
+        ) QUERY_PARTITION
+        WHERE ORA_HASH(id, 3) = :bk_partition
+    """
+    format_query = f"""
+        SELECT * FROM (
+            {query}
+        ) QUERY_PARTITION
+        WHERE {predicate}
+    """
+    return format_query
+
+def rowid_chunks_query(owner: str|None=None) -> str:
+    """
+    Genera la consulta que reparte los extents de una tabla en rangos de ROWID de tamaño parecido.
+
+    Es el mismo reparto que ``DBMS_PARALLEL_EXECUTE.CREATE_CHUNKS_BY_ROWID`` pero sin crear una tarea
+    (no requiere el privilegio ``CREATE JOB``): los extents se ordenan por objeto, fichero y bloque, se
+    agrupan en ``:chunks`` grupos con un número similar de bloques y cada grupo se convierte en un rango
+    ``ROWID`` con ``DBMS_ROWID.ROWID_CREATE``. Las tablas particionadas se reparten con los extents de
+    todas sus particiones.
+
+    Args:
+        owner (str | None): Si se indica se consultan ``DBA_EXTENTS``/``DBA_OBJECTS`` filtrando por
+            ``:owner``; si no, ``USER_EXTENTS``/``USER_OBJECTS`` del esquema conectado.
+
+    Returns:
+        str: Consulta con los binds ``:table_name``, ``:chunks`` (y ``:owner``) que devuelve las columnas
+        ``BK_ROWID_LO`` y ``BK_ROWID_HI`` (ROWID como texto) en orden.
+    """
+    if owner:
+        source = """DBA_EXTENTS E
+                JOIN DBA_OBJECTS O ON O.OWNER = E.OWNER AND O.OBJECT_NAME = E.SEGMENT_NAME
+                 AND NVL(O.SUBOBJECT_NAME, '-') = NVL(E.PARTITION_NAME, '-')
+                WHERE E.OWNER = :owner AND E.SEGMENT_NAME = :table_name"""
+    else:
+        source = """USER_EXTENTS E
+                JOIN USER_OBJECTS O ON O.OBJECT_NAME = E.SEGMENT_NAME
+                 AND NVL(O.SUBOBJECT_NAME, '-') = NVL(E.PARTITION_NAME, '-')
+                WHERE E.SEGMENT_NAME = :table_name"""
+    position = "ORDER BY DATA_OBJECT_ID, RELATIVE_FNO, BLOCK_ID"
+    format_query = f"""
+        SELECT ROWIDTOCHAR(DBMS_ROWID.ROWID_CREATE(1, LO_OBJECT, LO_FILE, LO_BLOCK, 0)) AS BK_ROWID_LO
+             , ROWIDTOCHAR(DBMS_ROWID.ROWID_CREATE(1, HI_OBJECT, HI_FILE, HI_BLOCK, 32767)) AS BK_ROWID_HI
+        FROM (
+            SELECT GRP
+                 , MIN(DATA_OBJECT_ID) KEEP (DENSE_RANK FIRST {position}) AS LO_OBJECT
+                 , MIN(RELATIVE_FNO) KEEP (DENSE_RANK FIRST {position}) AS LO_FILE
+                 , MIN(BLOCK_ID) KEEP (DENSE_RANK FIRST {position}) AS LO_BLOCK
+                 , MAX(DATA_OBJECT_ID) KEEP (DENSE_RANK LAST {position}) AS HI_OBJECT
+                 , MAX(RELATIVE_FNO) KEEP (DENSE_RANK LAST {position}) AS HI_FILE
+                 , MAX(BLOCK_ID + BLOCKS - 1) KEEP (DENSE_RANK LAST {position}) AS HI_BLOCK
+            FROM (
+                SELECT O.DATA_OBJECT_ID, E.RELATIVE_FNO, E.BLOCK_ID, E.BLOCKS
+                     , TRUNC((SUM(E.BLOCKS) OVER (ORDER BY O.DATA_OBJECT_ID, E.RELATIVE_FNO, E.BLOCK_ID) - E.BLOCKS)
+                             * :chunks / SUM(E.BLOCKS) OVER ()) AS GRP
+                FROM {source}
+                 AND O.DATA_OBJECT_ID IS NOT NULL
+            )
+            GROUP BY GRP
+        )
+        ORDER BY GRP
+    """
+    return format_query
+
+def split_range(low, high, partitions: int) -> list:
+    """
+    Divide el intervalo numérico ``[low, high]`` en ``partitions`` tramos de igual anchura.
+
+    Args:
+        low (int | float | Decimal): Valor mínimo.
+        high (int | float | Decimal): Valor máximo.
+        partitions (int): Número de tramos.
+
+    Returns:
+        list: ``partitions - 1`` límites interiores ordenados y sin repetidos (con enteros, los
+        límites son enteros y nunca hay más tramos que valores).
+
+    Raises:
+        TypeError: Si los límites no son numéricos.
+    """
+    if isinstance(low, bool) or not isinstance(low, (int, float, Decimal)) \
+            or isinstance(high, bool) or not isinstance(high, (int, float, Decimal)):
+        raise TypeError("La partición por rango requiere una columna numérica; use la estrategia 'hash' o 'rowid'")
+    integral = isinstance(low, int) and isinstance(high, int)
+    width = (high - low + (1 if integral else 0)) / partitions
+    bounds = []
+    for index in range(1, partitions):
+        bound = low + int(width * index) if integral else low + width * index
+        if low < bound <= high and (not bounds or bound > bounds[-1]):
+            bounds.append(bound)
+    return bounds
+
+def keyset_sort_columns(model, sort_key: str|list|None=None) -> list:
+    """
+    Devuelve las columnas de ordenación keyset: ``sort_key`` seguido de la clave primaria del modelo.
+
+    Args:
+        model (object): Clase modelo con ``get_columns_info()``.
+        sort_key (str | list[str] | None): Columna(s) de ordenación previas a la clave primaria.
+
+    Returns:
+        list[str]: Columnas de ordenación sin duplicados.
+
+    Raises:
+        ValueError: Si el modelo no declara clave primaria o alguna columna de ``sort_key`` no es
+            una columna del modelo (ver `model_column`).
+    """
+    pk_columns = primary_key_columns(model)
+    if not pk_columns:
+        raise ValueError(f"El modelo {getattr(model, '__name__', model)} no declara columnas primary_key")
+    if sort_key is None:
+        sort_columns = []
+    elif isinstance(sort_key, str):
+        sort_columns = [sort_key]
+    else:
+        sort_columns = list(sort_key)
+    sort_columns = [model_column(model, column, "sort_key") for column in sort_columns]
+    lowered = {c.lower() for c in sort_columns}
+    return sort_columns + [c for c in pk_columns if c.lower() not in lowered]
+
+def keyset_next_cursor(result_set: list, columns: list, rows: int, descending: bool=False):
+    """
+    Recorta la fila extra de una página keyset y calcula el cursor de la siguiente.
+
+    Args:
+        result_set (list[dict]): Filas leídas (hasta ``rows + 1``).
+        columns (list[str]): Columnas de ordenación.
+        rows (int): Filas por página.
+        descending (bool): Orden descendente de la lectura.
+
+    Returns:
+        tuple[list[dict], str | None]: Filas de la página y cursor de la siguiente
+        (``None`` si es la última).
+    """
+    if len(result_set) <= rows:
+        return result_set, None
+    result_set = result_set[:rows]
+    last = result_set[-1]
+    values = [last[c] if c in last else last.get(c.lower()) for c in columns]
+    return result_set, encode_keyset_cursor(columns, values, descending)
+
+def _keyset_default(value):
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {"$b": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Tipo no soportado en un cursor keyset: {type(value).__name__}")
+
+def _keyset_hook(obj):
+    if "$dt" in obj:
+        return datetime.fromisoformat(obj["$dt"])
+    if "$d" in obj:
+        return date.fromisoformat(obj["$d"])
+    if "$dec" in obj:
+        return Decimal(obj["$dec"])
+    if "$b" in obj:
+        return base64.b64decode(obj["$b"])
+    return obj
+
+def encode_keyset_cursor(columns: list, values: list, descending: bool=False) -> str:
+    """
+    Serializa la posición de una página keyset en un token opaco (base64 url-safe).
+
+    El token guarda también las columnas y el sentido de la ordenación, de modo que no se
+    pueda reutilizar con otra ordenación (ver `decode_keyset_cursor`).
+
+    Args:
+        columns (list[str]): Columnas de ordenación.
+        values (list): Valores de esas columnas en la última fila de la página.
+        descending (bool): Orden descendente.
+
+    Returns:
+        str: Token del cursor.
+    """
+    payload = json.dumps({"c": list(columns), "d": bool(descending), "v": list(values)}
+                         , default=_keyset_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_keyset_cursor(token: str, columns: list, descending: bool=False) -> list:
+    """
+    Recupera los valores de un token generado por :func:`encode_keyset_cursor`.
+
+    Args:
+        token (str): Token del cursor.
+        columns (list[str]): Columnas de ordenación esperadas.
+        descending (bool): Sentido de ordenación esperado.
+
+    Returns:
+        list: Valores de la última fila de la página anterior.
+
+    Raises:
+        ValueError: Si el token no es válido o corresponde a otra ordenación.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")), object_hook=_keyset_hook)
+        token_columns, token_descending, values = payload["c"], payload["d"], payload["v"]
+    except (ValueError, KeyError, TypeError, AttributeError):
+        raise ValueError("Cursor keyset no válido")
+    if (not isinstance(token_columns, list) or not all(isinstance(c, str) for c in token_columns)
+            or not isinstance(token_descending, bool) or not isinstance(values, list)):
+        raise ValueError("Cursor keyset no válido")
+    if [c.lower() for c in token_columns] != [c.lower() for c in columns] or len(values) != len(columns):
+        raise ValueError("El cursor keyset no corresponde a las columnas de ordenación indicadas")
+    if token_descending is not bool(descending):
+        raise ValueError("El cursor keyset no corresponde al sentido de ordenación indicado")
+    return values
+
+
+class BKOraKeysetExecutor:
+    """Proporciona fetch_keyset, la lectura paginada por keyset común a los managers.
+
+    Requiere que la clase que lo use exponga:
+      * self.fetch_all()
+      * self.model (con ``get_columns_info()``)
+      * self.kwargs
+    """
+    def keyset_columns(self, sort_key: str|list|None=None) -> list:
+        """
+        Devuelve las columnas de ordenación: ``sort_key`` seguido de la clave primaria del modelo.
+
+        Raises:
+            ValueError: Si el modelo no declara clave primaria.
+        """
+        return keyset_sort_columns(self.model, sort_key)
+
+    def fetch_keyset(self, sql: str, params: dict|None=None, cursor: str|None=None
+                     , sort_key: str|list|None=None, rows: int|None=None
+                     , descending: bool=False, session: sessionmaker|None=None):
+        """
+        Lee una página por keyset y calcula el cursor de la siguiente.
+
+        Se pide una fila más de las necesarias para saber si existe página siguiente
+        sin ejecutar un recuento; ``arraysize``/``prefetchrows`` se ajustan a ese tamaño para
+        que la página llegue en un único round-trip (ver `page_fetch_options`).
+
+        Args:
+            sql (str): Consulta SQL base.
+            params (dict | None): Parámetros de la consulta.
+            cursor (str | None): Token devuelto por la página anterior; ``None`` para la primera.
+            sort_key (str | list[str] | None): Columnas de ordenación previas a la clave primaria.
+            rows (int | None): Filas por página. Por defecto ``self.kwargs["rows_page"]``.
+            descending (bool): Orden descendente.
+            session (sessionmaker | None): Sesión de SQLAlchemy a reutilizar.
+
+        Returns:
+            tuple[list[dict], str | None]: Filas de la página y cursor de la siguiente
+            (``None`` si es la última).
+        """
+        rows = rows or self.kwargs.get("rows_page")
+        columns = self.keyset_columns(sort_key)
+        params = dict(params or {})
+
+        if cursor:
+            values = decode_keyset_cursor(cursor, columns, descending)
+            params.update({f"keyset_{i}": value for i, value in enumerate(values)})
+
+        sql = keyset_row_query(sql, columns, limit=rows + 1, descending=descending, seek=bool(cursor))
+        result_set = self.fetch_all(sql, params, sess=session, **page_fetch_options(rows + 1))
+        return keyset_next_cursor(result_set, columns, rows, descending)
+
+
+class BKOraCounterExecutor:
+    """Proporciona fetch_counted, el recuento + lectura común a los getlist_*.
+
+    Requiere que la clase que lo use exponga:
+      * self.fetch_one()
+      * self.fetch_all()
+      * self.kwargs
+    """
+    COUNTER_WINDOW_KEY = "bk_total_rows"
+
+    def fetch_counted(self, sql: str, params: dict|None=None, session: sessionmaker|None=None
+                      , offset: int|None=None, limit: int|None=None, count_over: bool|None=None):
+        """
+        Obtiene las filas de la consulta (opcionalmente paginadas) y el total de filas.
+
+        En el modo por defecto se ejecuta ``counter_row_query(sql)`` y después la consulta
+        de datos. Con ``count_over`` el total viaja en la misma sentencia que la página
+        (``COUNT(*) OVER ()``), de modo que la consulta base se ejecuta una sola vez; sin
+        paginación el total es directamente el número de filas leídas. Si la página pedida
+        queda fuera del resultado, no hay filas que transporten el total y se recurre a la
+        consulta de conteo. Las páginas se leen con ``arraysize``/``prefetchrows`` ajustados a
+        ``limit`` (ver `page_fetch_options`), de modo que llegan en un único round-trip.
+
+        Args:
+            sql (str): Consulta SQL base.
+            params (dict | None): Parámetros de la consulta.
+            session (sessionmaker | None): Sesión de SQLAlchemy a reutilizar.
+            offset (int | None): Filas a omitir. ``None`` para no paginar.
+            limit (int | None): Filas a devolver cuando se pagina.
+            count_over (bool | None): Modo de recuento. Si es ``None`` se usa
+                ``self.kwargs["count_over"]``.
+
+        Returns:
+            tuple[list[dict], int, float]: Filas, total de filas y segundos empleados
+            en el recuento (0.0 cuando el total llega con los datos).
+        """
+        if count_over is None:
+            count_over = self.kwargs.get("count_over", False)
+
+        if not count_over:
+            time_count_init = time.perf_counter()
+            count = self.fetch_one(counter_row_query(sql), params, sess=session)
+            time_count = time.perf_counter() - time_count_init
+
+            if offset is None:
+                result_set = self.fetch_all(sql, params, sess=session)
+            else:
+                result_set = self.fetch_all(range_row_query(sql, offset=offset, limit=limit), params, sess=session
+                                            , **page_fetch_options(limit))
+            return result_set, count.get("counter"), time_count
+
+        if offset is None:
+            result_set = self.fetch_all(sql, params, sess=session)
+            return result_set, len(result_set), 0.0
+
+        result_set = self.fetch_all(counter_window_query(sql, offset=offset, limit=limit), params, sess=session
+                                    , **page_fetch_options(limit))
+        if result_set:
+            total = result_set[0].get(self.COUNTER_WINDOW_KEY)
+            for row in result_set:
+                row.pop(self.COUNTER_WINDOW_KEY, None)
+            return result_set, total, 0.0
+
+        time_count_init = time.perf_counter()
+        count = self.fetch_one(counter_row_query(sql), params, sess=session)
+        time_count = time.perf_counter() - time_count_init
+        return result_set, count.get("counter"), time_count
+
 
 class BKOraRoutineExecutor:
     """Proporciona call_procedure y call_function.
 
     Requiere que la clase que lo use exponga:
-      * self.session_scope()
+      * self.execute()
       * self.fetch_one()
     """
     def call_procedure(self, proc_name:str, params: dict|None=None, session: sessionmaker|None=None):
@@ -131,11 +782,8 @@ class BKOraRoutineExecutor:
         placeholders = ', '.join(f':{k}' for k in params)
         sql = f"BEGIN {proc_name}({placeholders}); END;"
 
-        if session:
-            session.execute(sql, params)
-        else:
-            with self.session_scope() as session:
-                session.execute(sql, params)
+        with operation_label("call_procedure"):
+            self.execute(sql, params, sess=session)
 
     def call_function(self, func_name:str, params: dict|None=None, session: sessionmaker|None=None):
         """
@@ -155,5 +803,346 @@ class BKOraRoutineExecutor:
         placeholders = ', '.join(f':{k}' for k in params)
         sql = f"SELECT {func_name}({placeholders}) AS result FROM DUAL"
 
-        result = self.fetch_one(sql, params, sess=session)
-        return result.get('result') if result else None
\ No newline at end of file
+        with operation_label("call_function"):
+            result = self.fetch_one(sql, params, sess=session)
+        return result.get('result') if result else None
+
+class BKOraResultCacheExecutor:
+    """Proporciona la caché de resultados opcional de getlist (ver `BKOraResultCache`).
+
+    Requiere que la clase que lo use exponga:
+      * self.fetch_rows()
+      * self.model
+      * self.kwargs (``result_cache``, ``cache_ttl``, ``cache_namespace``, ``trusted_read``, ``process_pool``)
+      * self.process_pool() / self.models_from_rows() (`BKOraProcessExecutor`)
+      * self.bound_session()
+      * self.get_sql_insert() / get_sql_update() / get_sql_delete()
+    """
+
+    def cache_namespace(self) -> str:
+        """
+        Devuelve el ámbito de invalidación de la caché de este manager.
+
+        Es ``kwargs["cache_namespace"]`` si se indica; si no, la tabla de las sentencias DML del
+        manager, de modo que cualquier manager sobre la misma tabla invalida los resultados de los
+        demás; y, en último caso, el nombre completo del modelo.
+
+        Returns:
+            str: Namespace de la caché.
+        """
+        namespace = self.kwargs.get("cache_namespace")
+        if namespace:
+            return namespace
+        namespace = self.__dict__.get("_bk_cache_namespace")
+        if namespace is None:
+            for get_sql in (self.get_sql_insert, self.get_sql_update, self.get_sql_delete):
+                statement = get_sql()
+                namespace = dml_table_name(statement[0] if statement else None)
+                if namespace:
+                    break
+            else:
+                namespace = f"{self.model.__module__}.{self.model.__qualname__}"
+            self._bk_cache_namespace = namespace
+        return namespace
+
+    def cached_models(self, sql: str, params: dict|None=None, session: sessionmaker|None=None) -> list:
+        """
+        Ejecuta la consulta y devuelve instancias del modelo, pasando por la caché de resultados si está activa.
+
+        Se cachean las filas crudas (no los objetos), de modo que cada llamada recibe instancias nuevas.
+        Las lecturas en una sesión con escrituras sin confirmar (``session`` o el ``unit_of_work()`` activo)
+        no usan la caché: verían datos anteriores a sus propios cambios y podrían guardar filas que
+        después se deshacen con un rollback. Con
+        ``process_pool`` los objetos se construyen en sus procesos (ver `BKOraProcessExecutor`).
+
+        Args:
+            sql (str): Consulta SQL final.
+            params (dict, opcional): Parámetros de la consulta.
+            session (sessionmaker | None, opcional): Sesión a reutilizar.
+
+        Returns:
+            list[object]: Instancias del modelo.
+        """
+        cache = self.kwargs.get("result_cache")
+        if cache is None or session_has_writes(session or self.bound_session()):
+            if self.process_pool() is None:
+                return self.fetch_models(sql, self.model, params, sess=session, trusted=self.kwargs.get("trusted_read"))
+            return self.models_from_rows(*self.fetch_rows(sql, params, sess=session))
+
+        key = cache.make_key(sql, params or {})
+        entry = cache.get(key)
+        if entry is None:
+            entry = self.fetch_rows(sql, params, sess=session)
+            cache.set(key, entry, ttl=self.kwargs.get("cache_ttl"), namespace=self.cache_namespace())
+        return self.models_from_rows(*entry)
+
+    def invalidate_cache(self, session: sessionmaker|None=None) -> int:
+        """
+        Invalida los resultados cacheados del namespace de este manager (se llama tras cada escritura).
+
+        Si la escritura se hizo en una transacción aún abierta (``session`` o el ``unit_of_work()``
+        activo), la invalidación se aplaza hasta su commit: invalidar antes permitiría que una lectura
+        concurrente volviera a guardar las filas anteriores al cambio. Si la transacción termina con
+        rollback no hay nada que invalidar.
+
+        Args:
+            session (sessionmaker | None, opcional): Sesión en la que se hizo la escritura.
+
+        Returns:
+            int: Resultados eliminados (0 si la caché no está activa o la invalidación se aplaza).
+        """
+        cache = self.kwargs.get("result_cache")
+        if cache is None:
+            return 0
+        namespace = self.cache_namespace()
+        session = session or self.bound_session()
+        if session is not None and session.in_transaction():
+            on_commit(session, partial(cache.invalidate, namespace))
+            return 0
+        return cache.invalidate(namespace)
+
+
+class BKOraParallelExecutor:
+    """Proporciona fetch_parallel, la lectura de una consulta repartida en particiones concurrentes.
+
+    Requiere que la clase que lo use exponga:
+      * self.fetch_iter()
+      * self.fetch_rows()
+      * self.model (con ``get_columns_info()``, para la columna de reparto por defecto)
+      * self.kwargs (``PARALLEL_VALUES`` y ``arraysize``)
+      * self.get_sql_insert() (estrategia ``rowid`` sin ``partition_table``)
+    """
+    PARTITION_STRATEGIES = ("hash", "range", "rowid")
+
+    def partition_column(self, column: str|None=None) -> str:
+        """
+        Devuelve la columna de reparto: ``column``, ``kwargs["partition_column"]`` o la clave primaria del modelo.
+
+        Raises:
+            ValueError: Si la columna indicada no es una columna del modelo (ver `model_column`) o, sin
+                columna, la clave primaria no es de una sola columna.
+        """
+        column = column or self.kwargs.get("partition_column")
+        if column:
+            return model_column(self.model, column, "partition_column")
+        pk_columns = primary_key_columns(self.model)
+        if len(pk_columns) != 1:
+            raise ValueError("Indique partition_column: el modelo no declara una clave primaria de una sola columna")
+        return pk_columns[0]
+
+    def partition_table(self, table: str|None=None) -> tuple:
+        """
+        Devuelve ``(owner, tabla)`` de la estrategia ``rowid``: ``table``, ``kwargs["partition_table"]`` o la
+        tabla del INSERT del manager. ``owner`` es ``None`` si la tabla no lleva esquema.
+
+        Raises:
+            ValueError: Si no se puede determinar la tabla.
+        """
+        table = table or self.kwargs.get("partition_table")
+        if not table:
+            statement = self.get_sql_insert()
+            table = dml_table_name(statement[0] if statement else None)
+        if not table:
+            raise ValueError("Indique partition_table para la estrategia 'rowid'")
+        owner, _, name = table.replace('"', '').upper().rpartition(".")
+        return owner or None, name
+
+    def partition_plan(self, sql: str, params: dict|None=None, strategy: str|None=None
+                       , partitions: int|None=None, column: str|None=None, table: str|None=None
+                       , session: sessionmaker|None=None) -> list:
+        """
+        Reparte la consulta en particiones disjuntas que juntas devuelven todas sus filas.
+
+        * ``hash``: ``ORA_HASH(columna, N - 1) = :bk_partition``. Vale para cualquier tipo de columna,
+          pero cada partición recorre la consulta completa.
+        * ``range``: tramos de igual anchura entre ``MIN`` y ``MAX`` de una columna numérica
+          (``columna >= :bk_part_lo AND columna < :bk_part_hi``); con un índice sobre la columna,
+          cada partición lee solo su tramo.
+
+        Las filas con la columna de reparto a ``NULL`` no cumplen ninguno de esos predicados; en ``hash``
+        y ``range`` se leen en la primera partición (``OR columna IS NULL``), de modo que el resultado
+        coincide con el de la consulta sin repartir.
+        * ``rowid``: rangos de ROWID sobre los extents de la tabla (ver `rowid_chunks_query`); cada
+          partición lee solo sus bloques. La consulta base debe ser de una única tabla sin ``DISTINCT``,
+          ``GROUP BY`` ni uniones, para que Oracle exponga el ``ROWID`` de la vista en línea.
+
+        Args:
+            sql (str): Consulta SQL base.
+            params (dict | None): Parámetros de la consulta.
+            strategy (str | None): Estrategia. Por defecto ``kwargs["partition_strategy"]``.
+            partitions (int | None): Particiones. Por defecto ``kwargs["parallel_partitions"]`` o
+                ``kwargs["parallel_workers"]``.
+            column (str | None): Columna de reparto de ``hash`` y ``range`` (ver `partition_column`).
+            table (str | None): Tabla de ``rowid`` (ver `partition_table`).
+            session (sessionmaker | None): Sesión para las consultas de preparación (``MIN``/``MAX``,
+                extents).
+
+        Returns:
+            list[tuple[str, dict]]: Consulta y parámetros de cada partición, en orden.
+
+        Raises:
+            ValueError: Si la estrategia no es válida, ``partitions`` no es positivo o la columna de
+                reparto no es una columna del modelo.
+        """
+        strategy = (strategy or self.kwargs.get("partition_strategy")).lower()
+        if strategy not in self.PARTITION_STRATEGIES:
+            raise ValueError(f"partition_strategy '{strategy}' no válida; use una de "
+                             f"{', '.join(self.PARTITION_STRATEGIES)}.")
+        partitions = partitions or self.kwargs.get("parallel_partitions") or self.kwargs.get("parallel_workers")
+        if partitions < 1:
+            raise ValueError("partitions debe ser un valor positivo")
+        params = dict(params or {})
+        if partitions == 1:
+            return [(sql, params)]
+
+        if strategy == "hash":
+            column = self.partition_column(column)
+            predicate = f"ORA_HASH({column}, {partitions - 1}) = :bk_partition"
+            partition_sql = partition_query(sql, predicate)
+            plan = [(partition_sql, params | {"bk_partition": index}) for index in range(partitions)]
+            plan[0] = (partition_query(sql, f"{predicate} OR {column} IS NULL"), plan[0][1])
+            return plan
+
+        if strategy == "range":
+            column = self.partition_column(column)
+            _, rows = self.fetch_rows(f"SELECT MIN({column}), MAX({column}) FROM ({sql}) QUERY_BOUNDS"
+                                      , params, sess=session)
+            low, high = rows[0]
+            if low is None:
+                return [(sql, params)]
+            bounds = split_range(low, high, partitions)
+            if not bounds:
+                return [(sql, params)]
+            plan = [(partition_query(sql, f"{column} < :bk_part_hi OR {column} IS NULL")
+                     , params | {"bk_part_hi": bounds[0]})]
+            for lower, upper in zip(bounds, bounds[1:]):
+                plan.append((partition_query(sql, f"{column} >= :bk_part_lo AND {column} < :bk_part_hi")
+                             , params | {"bk_part_lo": lower, "bk_part_hi": upper}))
+            plan.append((partition_query(sql, f"{column} >= :bk_part_lo"), params | {"bk_part_lo": bounds[-1]}))
+            return plan
+
+        owner, table_name = self.partition_table(table)
+        chunk_params = {"table_name": table_name, "chunks": partitions}
+        if owner:
+            chunk_params["owner"] = owner
+        _, chunks = self.fetch_rows(rowid_chunks_query(owner), chunk_params, sess=session)
+        if not chunks:
+            return [(sql, params)]
+        partition_sql = partition_query(sql, "ROWID BETWEEN CHARTOROWID(:bk_rowid_lo) AND CHARTOROWID(:bk_rowid_hi)")
+        return [(partition_sql, params | {"bk_rowid_lo": low, "bk_rowid_hi": high}) for low, high in chunks]
+
+    def fetch_parallel(self, sql: str, params: dict|None=None, strategy: str|None=None
+                       , partitions: int|None=None, workers: int|None=None, ordered: bool|None=None
+                       , column: str|None=None, table: str|None=None, arraysize: int|None=None
+                       , model=None, trusted: bool=False):
+        """
+        Lee la consulta repartida en particiones (ver `partition_plan`) ejecutadas en paralelo.
+
+        Cada partición se lee con ``fetch_iter`` en su propio hilo y con su propia sesión (una conexión
+        del pool por hilo: ``workers`` no debería superar ``pool_size + max_overflow``). Los resultados
+        llegan por un único generador (ver `merge_iterators`): con ``ordered`` se devuelven las
+        particiones en orden (con ``range`` o ``rowid`` y una consulta base ordenada por la columna
+        de reparto, el orden global de la consulta); sin él, según van llegando. Las sesiones de un
+        ``unit_of_work()`` activo no se comparten con los hilos.
+
+        Args:
+            sql (str): Consulta SQL base.
+            params (dict | None): Parámetros de la consulta.
+            strategy, partitions, column, table: Ver `partition_plan`.
+            workers (int | None): Hilos. Por defecto ``kwargs["parallel_workers"]``.
+            ordered (bool | None): Fusión ordenada. Por defecto ``kwargs["parallel_ordered"]``.
+            arraysize (int | None): Filas por round-trip y por lote. Por defecto ``kwargs["arraysize"]``.
+            model (object | None): Clase modelo; si se indica se devuelven instancias en lugar de diccionarios.
+            trusted (bool): Crea los objetos en modo ``trusted`` (sin validación de lectura).
+
+        Returns:
+            Iterator[dict | object]: Filas de todas las particiones.
+        """
+        workers = workers or self.kwargs.get("parallel_workers")
+        if ordered is None:
+            ordered = self.kwargs.get("parallel_ordered")
+        arraysize = arraysize or self.kwargs.get("arraysize")
+        plan = self.partition_plan(sql, params, strategy=strategy, partitions=partitions, column=column, table=table)
+        factories = [partial(self.fetch_iter, partition_sql, partition_params, arraysize=arraysize, model=model
+                             , trusted=trusted)
+                     for partition_sql, partition_params in plan]
+        return merge_iterators(factories, workers, ordered=ordered, queue_size=self.kwargs.get("parallel_queue_size")
+                               , batch_size=arraysize)
+
+
+class BKOraProcessExecutor:
+    """Proporciona la validación de los modelos de los getlist* en un `BKOraProcessPool` opcional.
+
+    Requiere que la clase que lo use exponga:
+      * self.fetch_iter()
+      * self.model
+      * self.kwargs (``process_pool``, ``trusted_read``)
+    """
+
+    def process_pool(self):
+        """
+        Devuelve ``kwargs["process_pool"]`` si valida las filas de este manager en sus procesos.
+
+        Returns:
+            BKOraProcessPool | None: ``None`` si no hay pool, o si el modelo no valida al leer o la
+            lectura es ``trusted`` (los objetos se crean igual en el propio proceso).
+        """
+        pool = self.kwargs.get("process_pool")
+        if pool is None or not pool.offloads(self.model, self.kwargs.get("trusted_read")):
+            return None
+        return pool
+
+    def models_from_rows(self, keys, rows) -> list:
+        """
+        Convierte filas ``(cabecera, tuplas)`` en instancias del modelo, validándolas en los procesos de
+        `process_pool` si lo hay.
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+            rows (Sequence[tuple]): Filas del resultado.
+
+        Returns:
+            list[object]: Instancias del modelo, en el orden de ``rows``.
+        """
+        pool = self.process_pool()
+        if pool is None:
+            return list(map(row_mapper(self.model, keys, self.kwargs.get("trusted_read")), rows))
+        return pool.materialize(self.model, keys, rows)
+
+    def models_from_result(self, result_set: list) -> list:
+        """
+        Convierte filas ``list[dict]`` en instancias del modelo (ver `models_from_list`), validándolas en los
+        procesos de `process_pool` si lo hay.
+
+        Args:
+            result_set (list[dict]): Filas del resultado.
+
+        Returns:
+            list[object]: Instancias del modelo, en el orden de ``result_set``.
+        """
+        pool = self.process_pool()
+        if pool is None or not result_set:
+            return models_from_list(self.model, result_set, self.kwargs.get("trusted_read"))
+        return pool.materialize(self.model, tuple(result_set[0]), [tuple(row.values()) for row in result_set])
+
+    def iter_models(self, sql: str, params: dict|None=None, session: sessionmaker|None=None
+                    , arraysize: int|None=None):
+        """
+        Lee la consulta en streaming y devuelve instancias del modelo, validadas por lotes de
+        ``batch_size`` filas en los procesos de `process_pool` si lo hay.
+
+        Args:
+            sql (str): Consulta SQL.
+            params (dict | None): Parámetros de la consulta.
+            session (sessionmaker | None): Sesión a reutilizar.
+            arraysize (int | None): Filas por round-trip.
+
+        Returns:
+            Iterator[object]: Instancias del modelo.
+        """
+        pool = self.process_pool()
+        if pool is None:
+            return self.fetch_iter(sql, params, sess=session, arraysize=arraysize, model=self.model
+                                   , trusted=self.kwargs.get("trusted_read"))
+        rows = self.fetch_iter(sql, params, sess=session, arraysize=arraysize)
+        return pool.materialize_iter(self.model, dict_batches(rows, pool.batch_size))
@@ -0,0 +1,176 @@
+"""
+Módulo BKOraParallel
+--------------------
+
+Este módulo ejecuta varias lecturas en paralelo sobre un pool de hilos: fusionadas en un único iterador
+(`merge_iterators`, usado por ``getlist_parallel``) o como consultas independientes con un resultado
+cada una (`gather_calls`, usado por ``BKOraManager.gather``).
+
+Cada lectura se define con una función sin argumentos que devuelve un iterador (por ejemplo, un
+``fetch_iter`` del manager, que abre su propia sesión y, por tanto, su propia conexión del pool). Los
+hilos leen en lotes y los dejan en colas acotadas: si el consumidor va más lento, los hilos se detienen
+al llenarse su cola en lugar de acumular el resultado completo en memoria.
+
+Funciones:
+    merge_iterators(factories, workers, ordered, queue_size, batch_size)
+    gather_calls(calls, workers)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import queue
+import threading
+import time
+
+_DONE = object()
+_PUT_TIMEOUT = 0.1
+
+
+class _Failure:
+    """Excepción de un hilo productor, reenviada al consumidor."""
+    __slots__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _produce(factory, target, index, stop, batch_size):
+    """Lee ``factory()`` en lotes y los deja en ``target`` hasta agotarlo o hasta que se pida parar."""
+    def put(item):
+        while not stop.is_set():
+            try:
+                target.put((index, item), timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    iterator = None
+    try:
+        if stop.is_set():
+            return
+        iterator = iter(factory())
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
+            if not put(batch):
+                return
+    except BaseException as error:
+        put(_Failure(error))
+        return
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+    put(_DONE)
+
+
+def merge_iterators(factories, workers: int, ordered: bool = False, queue_size: int = 4, batch_size: int = 1000):
+    """
+    Ejecuta cada ``factory()`` en un hilo y devuelve un generador con todos sus elementos.
+
+    Los hilos se lanzan al pedir el primer elemento. Con ``ordered=True`` los elementos salen en el
+    orden de ``factories`` (primero todos los de la primera, después los de la segunda…) y cada lectura
+    tiene su propia cola; con ``ordered=False`` salen según van llegando, por lotes de ``batch_size``.
+    La primera excepción de un hilo se relanza en el consumidor. Al cerrar el generador (``close()``
+    o salida anticipada de un ``for``) los hilos se detienen en su siguiente lote y las lecturas
+    pendientes no llegan a empezar.
+
+    Args:
+        factories (list[Callable[[], Iterable]]): Lecturas a ejecutar.
+        workers (int): Hilos simultáneos.
+        ordered (bool, optional): Conserva el orden de ``factories``.
+        queue_size (int, optional): Lotes en cola por lectura antes de frenar al hilo.
+        batch_size (int, optional): Elementos por lote.
+
+    Yields:
+        Any: Elementos de todas las lecturas.
+
+    Raises:
+        ValueError: Si ``workers``, ``queue_size`` o ``batch_size`` no son positivos.
+    """
+    if workers < 1 or queue_size < 1 or batch_size < 1:
+        raise ValueError("workers, queue_size y batch_size deben ser valores positivos")
+    factories = list(factories)
+    if not factories:
+        return
+
+    stop = threading.Event()
+    if ordered:
+        queues = [queue.Queue(maxsize=queue_size) for _ in factories]
+    else:
+        queues = [queue.Queue(maxsize=queue_size * len(factories))] * len(factories)
+
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(factories)), thread_name_prefix="bk_parallel")
+    try:
+        # El pool atiende las tareas en orden de envío: en modo ordenado, la lectura que espera el
+        # consumidor siempre está en curso o ya ha terminado, por lo que las colas llenas no lo bloquean.
+        for index, factory in enumerate(factories):
+            executor.submit(_produce, factory, queues[index], index, stop, batch_size)
+
+        pending = len(factories)
+        current = 0
+        while pending:
+            _, item = queues[current].get()
+            if item is _DONE:
+                pending -= 1
+                if ordered:
+                    current += 1
+                continue
+            if isinstance(item, _Failure):
+                raise item.error
+            yield from item
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _timed(call, submitted):
+    """Ejecuta ``call()`` y devuelve su resultado, o la excepción, con los tiempos de espera y ejecución."""
+    time_init = time.perf_counter()
+    result = error = None
+    try:
+        result = call()
+    except Exception as e:
+        error = e
+    return {
+        "result": result,
+        "error": error,
+        "time": {
+            "time_queue": time_init - submitted,
+            "time_exec": time.perf_counter() - time_init,
+        },
+    }
+
+
+def gather_calls(calls, workers: int) -> list:
+    """
+    Ejecuta cada ``call()`` en un pool de ``workers`` hilos y devuelve sus resultados en el orden de ``calls``.
+
+    Un error en una llamada no interrumpe las demás: se devuelve en su ``error``. El tiempo total es el
+    de la llamada más lenta (mientras haya hilos para todas), no la suma.
+
+    Args:
+        calls (Iterable[Callable[[], Any]]): Llamadas a ejecutar.
+        workers (int): Hilos simultáneos.
+
+    Returns:
+        list[dict]: Por llamada, ``result`` (``None`` si falló), ``error`` (la excepción o ``None``) y
+        ``time`` con ``time_queue`` (espera hasta tener hilo) y ``time_exec`` (ejecución), en segundos.
+
+    Raises:
+        ValueError: Si ``workers`` no es positivo.
+    """
+    if workers < 1:
+        raise ValueError("workers debe ser un valor positivo")
+    calls = list(calls)
+    if not calls:
+        return []
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(calls)), thread_name_prefix="bk_gather")
+    try:
+        submitted = time.perf_counter()
+        futures = [executor.submit(_timed, call, submitted) for call in calls]
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
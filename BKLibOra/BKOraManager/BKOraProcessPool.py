@@ -0,0 +1,219 @@
+"""
+Módulo BKOraProcessPool
+-----------------------
+
+Este módulo reparte la conversión de filas a instancias del modelo entre varios procesos.
+
+Una vez leídas las filas, validar los campos de `BKOraModelComplex` es trabajo de CPU en Python puro
+que ocupa un único núcleo. `BKOraProcessPool` envía las filas en lotes a un ``ProcessPoolExecutor`` con
+el formato más compacto del resultado: la cabecera de columnas y las filas como tuplas (no diccionarios).
+Cada proceso valida su lote por columnas (``validated_rows``) y devuelve los valores normalizados, también
+como tuplas; el proceso principal crea los objetos con esos valores sin volver a validarlos
+(``from_validated_rows``), recomponiendo los lotes en su orden original.
+
+Los objetos se crean siempre en el proceso principal: devolverlos ya construidos obligaría a
+serializarlos campo a campo, y deserializarlos cuesta más que construirlos. Por eso los modelos que no
+validan al leer (`BKOraModelDB`, `BKOraModel`, las variantes ``lazy()``) y las lecturas ``trusted`` se
+convierten en el propio proceso aunque haya un pool. La validación por columnas requiere NumPy
+(``pip install BKLibOra[validation]``).
+
+Los modelos se envían por referencia (``pickle`` de la clase), por lo que deben estar definidos a nivel
+de módulo en un módulo importable. Con el método de arranque ``spawn`` (Windows, macOS) el programa
+principal debe protegerse con ``if __name__ == "__main__":``.
+
+Se activa en los ``getlist*`` de `BKOraManagerDB` con la opción ``process_pool``::
+
+    pool = BKOraProcessPool(workers=4)
+    manager = MiManager(connector, MiModelo, process_pool=pool)
+    modelos = manager.getlist()
+
+Clases:
+    BKOraProcessPool
+"""
+
+from BKLibOra.config import PROCESS_POOL_VALUES
+from BKLibOra.BKOraManager.BKOraManager_utils import row_mapper
+from BKLibOra.BKOraModel.BKOraModelLazy import BKOraLazyModel
+from BKLibOra.BKOraModel.BKOraValidator import BKOraValidationError
+from BKLibOra.utils import require_numpy
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import pickle
+import threading
+
+
+def _validate_batch(model, keys, rows, start):
+    """Valida un lote en el proceso trabajador; los errores se numeran desde el inicio del resultado."""
+    try:
+        return model.validated_rows(keys, rows)
+    except BKOraValidationError as error:
+        for item in error.report.errors:
+            item["row"] += start
+        raise BKOraValidationError(error.report) from None
+
+
+class BKOraProcessPool:
+    """
+    Pool de procesos para validar en paralelo las filas de los modelos que validan al leer.
+
+    El ``ProcessPoolExecutor`` se crea al primer uso y se reutiliza entre llamadas y managers (arrancar
+    procesos cuesta decenas de milisegundos); se libera con `shutdown` o al salir de un ``with``.
+    Los resultados de menos de ``min_rows`` filas se validan en el propio proceso, donde enviarlos
+    costaría más que validarlos.
+
+    Args:
+        workers (int, optional): Procesos. Por defecto ``PROCESS_POOL_VALUES["workers"]`` o ``os.cpu_count()``.
+        batch_size (int, optional): Filas por lote. Por defecto ``PROCESS_POOL_VALUES["batch_size"]``.
+        min_rows (int, optional): Filas a partir de las que se usan los procesos.
+            Por defecto ``PROCESS_POOL_VALUES["min_rows"]``.
+        max_pending (int, optional): Lotes en curso de `materialize_iter`. Por defecto
+            ``PROCESS_POOL_VALUES["max_pending"]`` o ``2 * workers``.
+        start_method (str, optional): ``fork``, ``spawn`` o ``forkserver``. Por defecto
+            ``PROCESS_POOL_VALUES["start_method"]`` o el de la plataforma.
+
+    Raises:
+        ValueError: Si ``workers``, ``batch_size`` o ``max_pending`` no son positivos.
+    """
+
+    def __init__(self, workers=None, batch_size=None, min_rows=None, max_pending=None, start_method=None):
+        self.workers = workers or PROCESS_POOL_VALUES.get("workers") or os.cpu_count() or 1
+        self.batch_size = batch_size or PROCESS_POOL_VALUES.get("batch_size")
+        self.min_rows = PROCESS_POOL_VALUES.get("min_rows") if min_rows is None else min_rows
+        self.max_pending = max_pending or PROCESS_POOL_VALUES.get("max_pending") or 2 * self.workers
+        self.start_method = start_method or PROCESS_POOL_VALUES.get("start_method")
+        if self.workers < 1 or self.batch_size < 1 or self.max_pending < 1:
+            raise ValueError("workers, batch_size y max_pending deben ser valores positivos")
+        self._executor = None
+        self._lock = threading.Lock()
+        self._checked = set()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """``ProcessPoolExecutor`` del pool, creado al primer uso."""
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context(self.start_method) if self.start_method else None
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._executor
+
+    def _prepare(self, model):
+        """Comprueba una vez por modelo que se puede enviar a los procesos y que NumPy está disponible."""
+        if model in self._checked:
+            return
+        require_numpy("La validación en procesos")
+        try:
+            pickle.dumps(model)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise TypeError(f"El modelo {model!r} no se puede enviar a otro proceso; defínalo a nivel "
+                            f"de módulo: {error}") from error
+        self._checked.add(model)
+
+    @staticmethod
+    def offloads(model, trusted: bool=False) -> bool:
+        """
+        ``True`` si las filas de ``model`` se validan en los procesos.
+
+        Solo los modelos que validan al leer (``_bk_validates_on_read``, con ``validated_rows``) y sin
+        ``trusted``; los perezosos (`BKOraLazyModel`), que validan cada campo al acceder a él, y el resto
+        se convierten en el propio proceso con `row_mapper`.
+        """
+        if trusted or isinstance(model, type) and issubclass(model, BKOraLazyModel):
+            return False
+        return getattr(model, "_bk_validates_on_read", False) and hasattr(model, "validated_rows")
+
+    def materialize(self, model, keys, rows, trusted: bool=False) -> list:
+        """
+        Convierte ``rows`` en instancias de ``model``, validando los lotes en los procesos.
+
+        Args:
+            model (object): Clase modelo (``row_factory()`` o ``from_dict()``).
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+            rows (Sequence[tuple]): Filas del resultado.
+            trusted (bool, optional): Crea los objetos en modo ``trusted`` (sin validación de lectura).
+
+        Returns:
+            list[object]: Instancias del modelo, en el orden de ``rows``.
+
+        Raises:
+            TypeError: Si el modelo no se puede enviar a otro proceso.
+            BKOraValidationError: Si alguna fila no es válida (con el índice de la fila en ``rows``).
+        """
+        keys = tuple(keys)
+        if len(rows) < max(self.min_rows, 1) or not self.offloads(model, trusted):
+            return list(map(row_mapper(model, keys, trusted), rows))
+        self._prepare(model)
+        size = self.batch_size
+        starts = range(0, len(rows), size)
+        futures = [self.executor.submit(_validate_batch, model, keys, rows[start:start + size], start)
+                   for start in starts]
+        result = []
+        try:
+            for future in futures:
+                result.extend(model.from_validated_rows(*self._result(future)))
+        finally:
+            for future in futures:
+                future.cancel()
+        return result
+
+    def materialize_iter(self, model, batches, trusted: bool=False):
+        """
+        Convierte un flujo de lotes ``(cabecera, filas)`` en instancias de ``model``, en orden.
+
+        Mantiene como mucho ``max_pending`` lotes en los procesos: la lectura avanza mientras se
+        construyen los lotes anteriores, sin acumular el resultado completo en memoria.
+
+        Args:
+            model (object): Clase modelo.
+            batches (Iterable[tuple[tuple[str], list[tuple]]]): Lotes (ver `dict_batches`).
+            trusted (bool, optional): Crea los objetos en modo ``trusted``.
+
+        Yields:
+            object: Instancias del modelo, en el orden de los lotes.
+        """
+        if not self.offloads(model, trusted):
+            for keys, rows in batches:
+                yield from map(row_mapper(model, keys, trusted), rows)
+            return
+        self._prepare(model)
+        executor = self.executor
+        pending = deque()
+        start = 0
+        try:
+            for keys, rows in batches:
+                pending.append(executor.submit(_validate_batch, model, tuple(keys), rows, start))
+                start += len(rows)
+                if len(pending) >= self.max_pending:
+                    yield from model.from_validated_rows(*self._result(pending.popleft()))
+            while pending:
+                yield from model.from_validated_rows(*self._result(pending.popleft()))
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _result(self, future):
+        """Resultado de un lote; si un proceso ha muerto, descarta el pool para que el siguiente uso cree otro."""
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait: bool=True):
+        """Detiene los procesos; el siguiente uso crea un pool nuevo."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(workers={self.workers}, batch_size={self.batch_size}"
+                f", min_rows={self.min_rows}, started={self._executor is not None})")
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from BKLibOra.config import IN_VALUES
+from BKLibOra.BKOraConnect.BKOraArrayBind import BKOraArrayBind, array_type_for
 
 
 class BKOraQueryBuilder:
@@ -16,8 +19,23 @@ class BKOraQueryBuilder:
             values=[{"fecha": "2025-01-01"}, {"fecha": "2025-01-31"}],
         )
         final_sql, params = qb.build()
+
+    Las listas IN (varios valores u operador ``"in"``) se generan según ``in_strategy``:
+
+    - ``"expand"``: un bind por valor (``IN (:col, :col_copy1, ...)``).
+    - ``"bucket"``: como ``expand`` pero rellenando hasta la siguiente potencia de dos (repitiendo
+      el último valor), de modo que listas de 5 a 8 valores comparten el mismo SQL.
+    - ``"array"``: un único bind de colección (``IN (SELECT COLUMN_VALUE FROM TABLE(:col))``,
+      ver `BKOraArrayBind`); el SQL no depende del número de valores.
+    - ``"chunk"``: como ``expand`` hasta ``in_chunk_size`` valores; por encima, varias listas
+      unidas con ``OR``, o un bind de colección si se supera ``in_array_threshold``.
+
+    En ``bucket`` y ``chunk`` las listas de más de ``in_chunk_size`` valores (1000, el límite de
+    Oracle) se dividen en varias listas unidas con ``OR``.
     """
 
+    _IN_STRATEGIES = ("expand", "bucket", "array", "chunk")
+
     _OPERATOR_MAP = {
         "equal": "=",
         "not_equal": "!=",
@@ -35,14 +53,26 @@ class BKOraQueryBuilder:
         base_sql: str,
         filters: List[Dict[str, Any]],
         values: List[Dict[str, Any]],
+        in_strategy: Optional[str] = None,
+        in_chunk_size: Optional[int] = None,
+        in_array_threshold: Optional[int] = None,
     ) -> None:
         self.base_sql = base_sql.rstrip()
         self.filters = filters
         self.values = values
+        self.in_strategy = (in_strategy or IN_VALUES.get("in_strategy")).lower()
+        self.in_chunk_size = in_chunk_size or IN_VALUES.get("in_chunk_size")
+        self.in_array_threshold = in_array_threshold or IN_VALUES.get("in_array_threshold")
+        if self.in_strategy not in self._IN_STRATEGIES:
+            raise ValueError(
+                f"in_strategy '{self.in_strategy}' no válida; use una de {', '.join(self._IN_STRATEGIES)}."
+            )
 
         self._bind_counter: Dict[str, int] = defaultdict(int)
         self._params: Dict[str, Any] = {}
         self._where_clauses: List[str] = []
+        self._bind_sources: List[Tuple[str, str, Any]] = []
+        self._column_values: Dict[str, List[Any]] | None = None
 
     # ------------------------------------------------------------------ #
     # API pública
@@ -71,6 +101,49 @@ class BKOraQueryBuilder:
         sql = "\n".join([self.base_sql, *self._where_clauses])
         return sql, self._params
 
+    def shape(self) -> Tuple[Any, ...]:
+        """
+        Devuelve la «forma» de la consulta: SQL base, estrategia IN y, por filtro, columna, operador,
+        función y número de valores (o tipo colección si la lista se enlaza como colección). Dos
+        builders con la misma forma generan el mismo SQL y los mismos binds, aunque los valores
+        sean distintos.
+        """
+        column_values = self.column_values()
+        parts: List[Any] = [self.base_sql, (self.in_strategy, self.in_chunk_size, self.in_array_threshold)]
+        for rule in self.filters:
+            cond = rule.get("condition", {})
+            operator = cond.get("operator", "equal").lower()
+            vals = column_values[rule["column"]]
+            size: Any = len(vals)
+            if size and operator != "between" and (size > 1 or operator == "in") and self._use_array(size):
+                size = array_type_for(vals)
+            parts.append((
+                rule["column"],
+                operator,
+                cond.get("function", "").strip().upper(),
+                size,
+            ))
+        return tuple(parts)
+
+    def bind_template(self) -> Tuple[Tuple[str, str, int], ...]:
+        """
+        Devuelve, tras ``build()``, el origen de cada bind: ``((bind, columna, posición), ...)``,
+        donde posición es el índice del valor entre los de esa columna o, en los binds de
+        colección, el nombre del tipo colección (el bind recibe todos los valores).
+        """
+        return tuple(self._bind_sources)
+
+    def column_values(self) -> Dict[str, List[Any]]:
+        """Devuelve ``{columna: [valores]}`` de las columnas filtradas, en el orden recibido."""
+        if self._column_values is None:
+            result: Dict[str, List[Any]] = {rule["column"]: [] for rule in self.filters}
+            for entry in self.values:
+                for key, value in entry.items():
+                    if key in result:
+                        result[key].append(value)
+            self._column_values = result
+        return self._column_values
+
     # ------------------------------------------------------------------ #
     # Implementación interna
     # ------------------------------------------------------------------ #
@@ -82,21 +155,57 @@ class BKOraQueryBuilder:
         self._bind_counter[column] += 1
         return f"{column}" if count == 0 else f"{column}_copy{count}"
 
-    # --- Operadores ---------------------------------------------------- #
-    def _handle_single(self, sql_col: str, column: str, value: Any, op: str) -> None:
+    def _bind(self, column: str, value: Any, source: Any) -> str:
+        """Registra un bind con su valor y su origen (posición o tipo colección) y devuelve su nombre."""
         bind = self._next_bind(column)
         self._params[bind] = value
+        self._bind_sources.append((bind, column, source))
+        return bind
+
+    def _use_array(self, size: int) -> bool:
+        if self.in_strategy == "array":
+            return True
+        return self.in_strategy == "chunk" and self.in_array_threshold is not None and size > self.in_array_threshold
+
+    @staticmethod
+    def _bucket_size(size: int) -> int:
+        bucket = 1
+        while bucket < size:
+            bucket *= 2
+        return bucket
+
+    # --- Operadores ---------------------------------------------------- #
+    def _handle_single(self, sql_col: str, column: str, value: Any, op: str) -> None:
+        bind = self._bind(column, value, 0)
         sql_op = self._OPERATOR_MAP.get(op, "=")
         self._where_clauses.append(f"AND {sql_col} {sql_op} :{bind}")
 
     def _handle_in(self, sql_col: str, column: str, values: List[Any]) -> None:
-        bind_names = []
-        for val in values:
-            bind = self._next_bind(column)
-            self._params[bind] = val
-            bind_names.append(f":{bind}")
-        placeholders = ", ".join(bind_names)
-        self._where_clauses.append(f"AND {sql_col} IN ({placeholders})")
+        if self._use_array(len(values)):
+            array = BKOraArrayBind(values)
+            bind = self._bind(column, array, array.type_name)
+            self._where_clauses.append(f"AND {sql_col} IN (SELECT COLUMN_VALUE FROM TABLE(:{bind}))")
+            return
+
+        if self.in_strategy == "expand":
+            chunks = [range(len(values))]
+        else:
+            chunks = [range(start, min(start + self.in_chunk_size, len(values)))
+                      for start in range(0, len(values), self.in_chunk_size)]
+
+        lists = []
+        for positions in chunks:
+            if self.in_strategy == "bucket":
+                # Relleno con el último valor: no cambia el resultado y fija el número de binds
+                padding = min(self._bucket_size(len(positions)), self.in_chunk_size) - len(positions)
+                positions = [*positions, *[positions[-1]] * padding]
+            bind_names = [f":{self._bind(column, values[index], index)}" for index in positions]
+            lists.append(f"{sql_col} IN ({', '.join(bind_names)})")
+
+        if len(lists) == 1:
+            self._where_clauses.append(f"AND {lists[0]}")
+        else:
+            self._where_clauses.append(f"AND ({' OR '.join(lists)})")
 
     def _handle_between(self, sql_col: str, column: str, values: List[Any]) -> None:
         if len(values) != 2:
@@ -104,9 +213,8 @@ class BKOraQueryBuilder:
                 f"El operador BETWEEN requiere exactamente 2 valores para '{column}', "
                 f"pero se recibieron {len(values)}."
             )
-        lower_bind = self._next_bind(column)
-        upper_bind = self._next_bind(column)
-        self._params[lower_bind], self._params[upper_bind] = values
+        lower_bind = self._bind(column, values[0], 0)
+        upper_bind = self._bind(column, values[1], 1)
         clause = f"AND {sql_col} BETWEEN :{lower_bind} AND :{upper_bind}"
         self._where_clauses.append(clause)
 
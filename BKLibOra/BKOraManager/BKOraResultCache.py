@@ -0,0 +1,312 @@
+"""
+Módulo BKOraResultCache
+-----------------------
+
+Este módulo define una caché de resultados de consultas para los managers, opcional y con backend intercambiable.
+
+Cada resultado se guarda como ``(columnas, filas)`` (tuplas crudas, no instancias del modelo) bajo una clave
+calculada a partir del SQL y sus parámetros, y dentro de un «namespace» (por defecto la tabla del manager)
+que permite invalidar de una vez todos los resultados de esa tabla cuando se escribe en ella.
+
+Backends:
+    - `BKOraMemoryCacheBackend`: en el proceso, LRU con TTL, número máximo de entradas y memoria máxima.
+    - `BKOraSQLiteCacheBackend`: en disco (SQLite), compartido entre procesos de la misma máquina.
+
+Clases:
+    BKOraResultCache
+    BKOraMemoryCacheBackend
+    BKOraSQLiteCacheBackend
+"""
+
+from BKLibOra.config import CACHE_BACKEND_VALUES
+from BKLibOra.BKOraConnect.BKOraArrayBind import BKOraArrayBind
+from collections import OrderedDict
+import hashlib
+import json
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+
+
+def _key_default(value):
+    """Serializa para la clave los valores que JSON no admite (fechas, Decimal, binds de colección…)."""
+    if isinstance(value, BKOraArrayBind):
+        return [value.type_name, value.values]
+    return repr(value)
+
+
+def _result_size(value) -> int:
+    """Tamaño aproximado en bytes de un resultado ``(columnas, filas)``."""
+    keys, rows = value
+    size = sys.getsizeof(keys) + sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row) + sum(sys.getsizeof(item) for item in row)
+    return size
+
+
+class BKOraMemoryCacheBackend:
+    """
+    Backend en memoria del proceso: LRU con caducidad por entrada.
+
+    Args:
+        maxsize (int, optional): Entradas máximas. Por defecto ``CACHE_BACKEND_VALUES["maxsize"]``.
+        max_bytes (int, optional): Memoria máxima aproximada. Por defecto ``CACHE_BACKEND_VALUES["max_bytes"]``.
+    """
+
+    def __init__(self, maxsize=None, max_bytes=None):
+        self.maxsize = maxsize or CACHE_BACKEND_VALUES.get("maxsize")
+        self.max_bytes = max_bytes or CACHE_BACKEND_VALUES.get("max_bytes")
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _remove(self, key):
+        _, _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key):
+        """Devuelve el valor guardado o ``None`` si no existe o ha caducado."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, _, expires, _ = entry
+            if expires is not None and expires <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None, namespace=None):
+        """Guarda ``value`` durante ``ttl`` segundos (``None``: sin caducidad) en ``namespace``."""
+        size = _result_size(value)
+        if size > self.max_bytes:
+            return
+        expires = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, namespace, expires, size)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, namespace) -> int:
+        """Elimina las entradas de ``namespace`` y devuelve cuántas había."""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[1] == namespace]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "memory_bytes": self._bytes,
+                "maxsize": self.maxsize,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class BKOraSQLiteCacheBackend:
+    """
+    Backend en disco sobre SQLite, compartido por los procesos que usen el mismo fichero.
+
+    Los valores se serializan con ``pickle``; la expulsión LRU usa la hora del último acceso.
+    Cada hilo abre su propia conexión y la base de datos se pone en modo WAL para que
+    lectores y escritores de distintos procesos no se bloqueen entre sí.
+
+    Args:
+        path (str): Ruta del fichero SQLite.
+        maxsize (int, optional): Entradas máximas. Por defecto ``CACHE_BACKEND_VALUES["maxsize"]``.
+        max_bytes (int, optional): Tamaño máximo de los valores serializados. Por defecto
+            ``CACHE_BACKEND_VALUES["max_bytes"]``.
+        timeout (float, optional): Segundos de espera ante un bloqueo de otro proceso.
+    """
+
+    def __init__(self, path, maxsize=None, max_bytes=None, timeout=30.0):
+        self.path = path
+        self.maxsize = maxsize or CACHE_BACKEND_VALUES.get("maxsize")
+        self.max_bytes = max_bytes or CACHE_BACKEND_VALUES.get("max_bytes")
+        self.timeout = timeout
+        self._local = threading.local()
+        self.evictions = 0
+        self.expirations = 0
+        db = self._db()
+        db.execute("CREATE TABLE IF NOT EXISTS bk_result_cache ("
+                   "key TEXT PRIMARY KEY, namespace TEXT, value BLOB, size INTEGER, expires REAL, accessed REAL)")
+        db.execute("CREATE INDEX IF NOT EXISTS bk_result_cache_ns ON bk_result_cache (namespace)")
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+        return db
+
+    def get(self, key):
+        """Devuelve el valor guardado o ``None`` si no existe o ha caducado."""
+        db = self._db()
+        row = db.execute("SELECT value, expires FROM bk_result_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        value, expires = row
+        if expires is not None and expires <= now:
+            db.execute("DELETE FROM bk_result_cache WHERE key = ?", (key,))
+            self.expirations += 1
+            return None
+        db.execute("UPDATE bk_result_cache SET accessed = ? WHERE key = ?", (now, key))
+        return pickle.loads(value)
+
+    def set(self, key, value, ttl=None, namespace=None):
+        """Guarda ``value`` durante ``ttl`` segundos (``None``: sin caducidad) en ``namespace``."""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        now = time.time()
+        expires = now + ttl if ttl else None
+        db = self._db()
+        db.execute("INSERT OR REPLACE INTO bk_result_cache (key, namespace, value, size, expires, accessed) "
+                   "VALUES (?, ?, ?, ?, ?, ?)", (key, namespace, sqlite3.Binary(data), len(data), expires, now))
+        self._evict(db, now)
+
+    def _evict(self, db, now):
+        """Elimina las entradas caducadas y, después, las menos usadas hasta cumplir los límites."""
+        self.expirations += db.execute("DELETE FROM bk_result_cache WHERE expires <= ?", (now,)).rowcount
+        count, total = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM bk_result_cache").fetchone()
+        if count <= self.maxsize and total <= self.max_bytes:
+            return
+        stale = []
+        for key, size in db.execute("SELECT key, size FROM bk_result_cache ORDER BY accessed"):
+            if count <= self.maxsize and total <= self.max_bytes:
+                break
+            stale.append((key,))
+            count -= 1
+            total -= size
+        db.executemany("DELETE FROM bk_result_cache WHERE key = ?", stale)
+        self.evictions += len(stale)
+
+    def invalidate(self, namespace) -> int:
+        """Elimina las entradas de ``namespace`` (en todos los procesos) y devuelve cuántas había."""
+        return self._db().execute("DELETE FROM bk_result_cache WHERE namespace = ?", (namespace,)).rowcount
+
+    def clear(self):
+        self._db().execute("DELETE FROM bk_result_cache")
+
+    def stats(self) -> dict:
+        count, total = self._db().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM bk_result_cache").fetchone()
+        return {
+            "size": count,
+            "memory_bytes": total,
+            "maxsize": self.maxsize,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class BKOraResultCache:
+    """
+    Caché de resultados de consultas compartible entre managers.
+
+    Se activa pasando una instancia al manager (``result_cache=BKOraResultCache()``); los managers
+    que compartan la instancia y el namespace (la tabla) comparten también las invalidaciones.
+
+    Args:
+        backend (object, optional): Backend con ``get``, ``set``, ``invalidate``, ``clear`` y ``stats``.
+            Por defecto `BKOraMemoryCacheBackend`.
+
+    Métodos:
+        make_key(*parts): Clave estable a partir del SQL, los parámetros y cualquier otro dato.
+        get(key) / set(key, value, ttl, namespace): Lectura y escritura con métricas.
+        invalidate(namespace): Elimina todos los resultados de un namespace.
+        stats(): Aciertos, fallos, tasa de acierto, invalidaciones y métricas del backend.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or BKOraMemoryCacheBackend()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        Calcula una clave estable (independiente del orden de los diccionarios y del proceso).
+
+        Returns:
+            str: Resumen SHA-256 de las partes.
+        """
+        data = json.dumps(parts, sort_keys=True, default=_key_default, ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Devuelve el resultado guardado o ``None``, contabilizando el acierto o el fallo."""
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key, value, ttl=None, namespace=None):
+        """Guarda un resultado ``(columnas, filas)``."""
+        self.backend.set(key, value, ttl=ttl, namespace=namespace)
+
+    def invalidate(self, namespace) -> int:
+        """
+        Elimina los resultados de ``namespace``.
+
+        Returns:
+            int: Número de resultados eliminados.
+        """
+        removed = self.backend.invalidate(namespace)
+        with self._lock:
+            self.invalidations += 1
+        return removed
+
+    def clear(self):
+        """Vacía la caché y reinicia las métricas."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """
+        Devuelve las métricas de la caché.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``hit_rate`` e ``invalidations`` más las del backend
+            (``size``, ``memory_bytes``, ``evictions``, ``expirations``…).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+        return stats | self.backend.stats()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.backend.__class__.__name__})"
@@ -0,0 +1,200 @@
+"""
+Módulo BKOraStatementCache
+--------------------------
+
+Este módulo define una caché LRU de sentencias compartida por los managers.
+
+Guarda dos tipos de entradas:
+
+- El ``TextClause`` de cada texto SQL ejecutado, para no volver a crear y analizar ``text()`` en cada llamada.
+- El resultado de `BKOraQueryBuilder` por «forma» de la consulta (SQL base, columnas, operadores, funciones y
+  número de valores): el SQL final y la plantilla de binds. Con la misma forma, el SQL generado es idéntico
+  (Oracle reutiliza el cursor compartido) y solo hay que colocar los valores nuevos en sus binds.
+
+Clases:
+    BKOraCompiledQuery
+    BKOraStatementCache
+
+Atributos:
+    default_statement_cache (BKOraStatementCache): Caché usada por defecto en `BKOraManager`.
+"""
+
+from BKLibOra.config import STATEMENT_CACHE_VALUES
+from BKLibOra.BKOraConnect.BKOraArrayBind import BKOraArrayBind
+from sqlalchemy.sql import text
+from collections import OrderedDict
+import threading
+import sys
+
+
+class BKOraCompiledQuery:
+    """
+    Consulta generada por `BKOraQueryBuilder` lista para reutilizarse con otros valores.
+
+    Args:
+        sql (str): SQL final.
+        statement (TextClause): Sentencia precompilada.
+        binds (tuple): Plantilla ``((bind, columna, posición o tipo colección), ...)``
+            (ver `BKOraQueryBuilder.bind_template`).
+    """
+
+    __slots__ = ("sql", "statement", "binds")
+
+    def __init__(self, sql, statement, binds):
+        self.sql = sql
+        self.statement = statement
+        self.binds = binds
+
+    def params(self, column_values) -> dict:
+        """
+        Coloca los valores en sus binds.
+
+        Args:
+            column_values (dict[str, list]): ``{columna: [valores]}`` (ver `BKOraQueryBuilder.column_values`).
+
+        Returns:
+            dict: Parámetros de la consulta.
+        """
+        params = {}
+        for bind, column, source in self.binds:
+            if isinstance(source, str):
+                # Bind de colección: recibe todos los valores de la columna
+                params[bind] = BKOraArrayBind(column_values[column], source)
+            else:
+                params[bind] = column_values[column][source]
+        return params
+
+
+class BKOraStatementCache:
+    """
+    Caché LRU, segura entre hilos, de sentencias ``TextClause`` y de consultas de `BKOraQueryBuilder`.
+
+    Args:
+        maxsize (int, optional): Entradas máximas. Por defecto ``STATEMENT_CACHE_VALUES["maxsize"]``;
+            con 0 no se guarda nada (cada llamada cuenta como fallo).
+
+    Métodos:
+        statement(sql): Devuelve el ``TextClause`` de un SQL.
+        build_query(builder): Devuelve ``(sql, params)`` de un `BKOraQueryBuilder`.
+        compiled_query(builder): Devuelve la `BKOraCompiledQuery` de la forma del builder.
+        stats(): Aciertos, fallos, tasa de acierto, tamaño y memoria aproximada.
+        clear(): Vacía la caché y reinicia las métricas.
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = STATEMENT_CACHE_VALUES.get("maxsize") if maxsize is None else maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def _put(self, key, value, size):
+        with self._lock:
+            if self.maxsize <= 0 or key in self._entries:
+                return
+            self._entries[key] = (value, size)
+            self._memory += size
+            while len(self._entries) > self.maxsize:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._memory -= evicted_size
+                self.evictions += 1
+
+    def statement(self, sql: str):
+        """
+        Devuelve el ``TextClause`` de ``sql``, creándolo solo la primera vez.
+
+        Args:
+            sql (str): Texto SQL.
+
+        Returns:
+            sqlalchemy.sql.elements.TextClause: Sentencia lista para ``session.execute``.
+        """
+        key = ("sql", sql)
+        statement = self._get(key)
+        if statement is None:
+            statement = text(sql)
+            self._put(key, statement, sys.getsizeof(sql))
+        return statement
+
+    def compiled_query(self, builder) -> BKOraCompiledQuery:
+        """
+        Devuelve la consulta compilada para la forma de ``builder``, construyéndola si no está en caché.
+
+        Args:
+            builder (BKOraQueryBuilder): Builder con el SQL base, los filtros y los valores.
+
+        Returns:
+            BKOraCompiledQuery: SQL final, sentencia y plantilla de binds.
+
+        Raises:
+            ValueError: Si los filtros no son válidos para los valores recibidos (ver `BKOraQueryBuilder`).
+        """
+        key = ("shape", builder.shape())
+        compiled = self._get(key)
+        if compiled is None:
+            sql, _ = builder.build()
+            binds = builder.bind_template()
+            compiled = BKOraCompiledQuery(sql, self.statement(sql), binds)
+            self._put(key, compiled, sys.getsizeof(sql) + sys.getsizeof(binds) + sys.getsizeof(key[1]))
+        return compiled
+
+    def build_query(self, builder):
+        """
+        Equivalente cacheado de ``builder.build()``.
+
+        Args:
+            builder (BKOraQueryBuilder): Builder con el SQL base, los filtros y los valores.
+
+        Returns:
+            tuple[str, dict]: SQL final y parámetros.
+        """
+        compiled = self.compiled_query(builder)
+        return compiled.sql, compiled.params(builder.column_values())
+
+    def stats(self) -> dict:
+        """
+        Devuelve las métricas de la caché.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``hit_rate``, ``evictions``, ``size``, ``maxsize`` y
+            ``memory_bytes`` (aproximada: textos SQL, plantillas y claves guardadas).
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "memory_bytes": self._memory,
+            }
+
+    def clear(self):
+        """Vacía la caché y reinicia las métricas."""
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}: {len(self)}/{self.maxsize} entradas"
+
+
+default_statement_cache = BKOraStatementCache()
@@ -62,6 +62,7 @@ class BKString:
         self.large = large
         self.min_length = min_length
         self.nullable = nullable
+        self.primary_key = primary_key
         self.doc = doc
         self.encoding = _encoding
 
@@ -12,6 +12,8 @@ Clases:
     BKOraModel
 """
 
+from BKLibOra.BKOraModel.BKOraModelCompact import compact_model
+
 
 class BKOraModel:
     """
@@ -23,6 +25,7 @@ class BKOraModel:
     Métodos:
         from_dict(data_dict): Crea una instancia del modelo a partir de un diccionario.
         from_list(data_list): Crea una lista de instancias del modelo a partir de una lista de diccionarios.
+        compact(columns): Genera una variante compacta (con ``__slots__``) del modelo.
         to_dict(): Convierte la instancia del modelo en un diccionario.
     """
 
@@ -62,6 +65,21 @@ class BKOraModel:
         """
         return [cls.from_dict(item) for item in data_list]
 
+    @classmethod
+    def compact(cls, columns):
+        """
+        Devuelve una variante compacta del modelo (ver `BKOraModelCompact`).
+
+        `BKOraModel` no declara columnas, por lo que deben indicarse explícitamente.
+
+        Args:
+            columns (Iterable[str]): Nombres de columna (y de atributo) del resultado.
+
+        Returns:
+            type: Subclase de `BKOraCompactModel` con un slot por columna.
+        """
+        return compact_model(cls, [(column, column, None) for column in columns])
+
     def to_dict(self):
         """
         Convierte la instancia actual del modelo en un diccionario.
@@ -0,0 +1,201 @@
+"""
+Módulo BKOraModelCompact
+------------------------
+
+Este módulo genera variantes compactas (con `__slots__`) de los modelos declarados con `BKOraModel`,
+`BKOraModelDB` o `BKOraModelComplex`.
+
+Una instancia compacta guarda únicamente los valores crudos de cada columna en slots, sin `__dict__` por objeto
+ni clones de `BKString`/`BKNumber`… por campo; los descriptores, tipos y reglas de validación siguen viviendo
+en la clase original (`_bk_source`). Está pensada para resultados grandes de solo lectura y es opcional:
+se obtiene con `Modelo.compact()` y se pasa como modelo al manager.
+
+Clases:
+    BKOraCompactModel
+
+Funciones:
+    compact_model(source, columns)
+"""
+
+import keyword
+
+
+class BKOraCompactModel:
+    """
+    Clase base de los modelos compactos generados por `compact_model`.
+
+    Ofrece la misma interfaz que los modelos declarados (`to_dict`, `from_dict`, `from_list`,
+    `from_rows`, `row_factory`, `get_columns_info`) para que los managers puedan usarla sin cambios.
+
+    Atributos de clase:
+        _bk_columns (tuple): Mapa ``((atributo, columna, default), ...)``.
+        _bk_source (type): Modelo declarado del que procede.
+        _bk_primary_key (tuple): Atributos que forman la clave primaria.
+    """
+
+    __slots__ = ()
+    _bk_columns = ()
+    _bk_source = None
+    _bk_primary_key = ()
+
+    def __init__(self, **kwargs):
+        for key, name, default in self._bk_columns:
+            setattr(self, key, kwargs.get(name, default))
+
+    def to_dict(self):
+        """
+        Convierte la instancia en un diccionario ``{columna: valor}``.
+
+        Returns:
+            dict: Valores crudos de cada columna.
+        """
+        return {name: getattr(self, key) for key, name, _ in self._bk_columns}
+
+    def expand(self):
+        """
+        Devuelve la instancia equivalente del modelo declarado (con sus campos ricos y validaciones).
+
+        Returns:
+            object: Instancia de ``_bk_source``.
+        """
+        return self._bk_source.from_dict(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data_dict):
+        return cls(**data_dict)
+
+    @classmethod
+    def from_list(cls, data_list):
+        """
+        Crea una lista de instancias compactas a partir de una lista de diccionarios.
+
+        Args:
+            data_list (list[dict]): Filas como diccionarios.
+
+        Returns:
+            list[BKOraCompactModel]: Lista de instancias.
+        """
+        return [cls(**item) for item in data_list]
+
+    @classmethod
+    def from_rows(cls, keys, rows):
+        """
+        Crea instancias compactas directamente a partir de tuplas de resultado (ver `BKOraModelDB.from_rows`).
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+            rows (Iterable[tuple]): Filas del resultado.
+
+        Returns:
+            list[BKOraCompactModel]: Lista de instancias.
+        """
+        return list(map(cls.row_factory(keys), rows))
+
+    @classmethod
+    def row_factory(cls, keys):
+        """
+        Devuelve una función ``fila -> instancia`` compilada para un orden de columnas concreto.
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+
+        Returns:
+            Callable[[tuple], BKOraCompactModel]: Constructor de instancias por fila.
+        """
+        keys = tuple(keys)
+        factory = cls._bk_factories.get(keys)
+        if factory is None:
+            position = {name: index for index, name in enumerate(keys)}
+            namespace = {"new": object.__new__, "cls": cls}
+            lines = ["def build(row):", "    obj = new(cls)"]
+            for number, (key, name, default) in enumerate(cls._bk_columns):
+                if name in position:
+                    lines.append(f"    obj.{key} = row[{position[name]}]")
+                else:
+                    namespace[f"_default_{number}"] = default
+                    lines.append(f"    obj.{key} = _default_{number}")
+            lines.append("    return obj")
+            exec("\n".join(lines) + "\n", namespace)
+            factory = cls._bk_factories[keys] = namespace["build"]
+        return factory
+
+    @classmethod
+    def get_columns_info(cls):
+        """
+        Devuelve la metadata de columnas del modelo declarado.
+
+        Returns:
+            dict: ``{columna: {…metadata…}}``.
+        """
+        if hasattr(cls._bk_source, "get_columns_info"):
+            return cls._bk_source.get_columns_info()
+        return {name: {"attribute": key, "default": default} for key, name, default in cls._bk_columns}
+
+    def __reduce__(self):
+        # La clase generada no es accesible por nombre: se serializa el modelo origen y los valores
+        values = tuple(getattr(self, key) for key, _, _ in self._bk_columns)
+        return _restore_compact, (self._bk_source, self._bk_columns, values)
+
+    def __repr__(self):
+        if self._bk_primary_key:
+            pk_str = ", ".join(f"{key}={getattr(self, key, None)}" for key in self._bk_primary_key)
+            return f"{self.__class__.__name__}: {pk_str}"
+        return self.__class__.__name__
+
+
+def compact_model(source, columns):
+    """
+    Genera (o recupera de la caché) la clase compacta de un modelo.
+
+    Args:
+        source (type): Modelo declarado (`BKOraModel`, `BKOraModelDB` o `BKOraModelComplex`).
+        columns (Iterable[tuple]): Columnas ``(atributo, columna, default)`` en orden de declaración.
+
+    Returns:
+        type: Subclase de `BKOraCompactModel` con un slot por columna.
+
+    Raises:
+        ValueError: Si no hay columnas o algún atributo no es un identificador válido, es una palabra
+            reservada, un nombre ``__dunder__`` o coincide con un atributo de `BKOraCompactModel`.
+    """
+    columns = tuple(columns)
+    if not columns:
+        raise ValueError(f"El modelo {source.__name__} no declara columnas para generar su versión compacta")
+    for key, _, _ in columns:
+        # Los atributos se usan como slots y en el código generado por row_factory (obj.<atributo> = ...)
+        if (not isinstance(key, str) or not key.isidentifier() or keyword.iskeyword(key)
+                or key.startswith("__") and key.endswith("__") or hasattr(BKOraCompactModel, key)):
+            raise ValueError(f"'{key}' no es un nombre de atributo válido para un modelo compacto")
+
+    cache = source.__dict__.get("_bk_compact")
+    if cache is None:
+        cache = {}
+        setattr(source, "_bk_compact", cache)
+    signature = tuple(key for key, _, _ in columns), tuple(name for _, name, _ in columns)
+    compact = cache.get(signature)
+    if compact is not None:
+        return compact
+
+    info = source.get_columns_info() if hasattr(source, "get_columns_info") else {}
+    primary_key = tuple(key for key, name, _ in columns if info.get(name, {}).get("primary_key"))
+
+    compact = type(f"{source.__name__}Compact", (BKOraCompactModel,), {
+        "__slots__": tuple(key for key, _, _ in columns),
+        "__module__": source.__module__,
+        "__doc__": f"Versión compacta (con __slots__) de {source.__name__}.",
+        "_bk_columns": columns,
+        "_bk_source": source,
+        "_bk_primary_key": primary_key,
+        "_bk_factories": {},
+    })
+    cache[signature] = compact
+    return compact
+
+
+def _restore_compact(source, columns, values):
+    """Reconstruye una instancia compacta serializada con ``pickle``."""
+    compact = compact_model(source, columns)
+    obj = object.__new__(compact)
+    for (key, _, _), value in zip(columns, values):
+        setattr(obj, key, value)
+    return obj
@@ -1,5 +1,15 @@
 from copy import copy
 from BKLibOra.BKOraModel.BKOraDataType import BKString, BKNumber, BKFloat, BKDate, BKDatetime, BKBytes
+from BKLibOra.BKOraModel.BKOraModelCompact import compact_model
+from BKLibOra.BKOraModel.BKOraModelLazy import lazy_model
+from BKLibOra.BKOraModel.BKOraValidator import BKOraBatchValidator
+
+def _clone_validated(field_template, value):
+    """Clona la plantilla con un valor ya validado, sin volver a ejecutar ``validate_init``."""
+    field_instance = object.__new__(field_template.__class__)
+    field_instance.__dict__ = {**field_template.__dict__, "value": value}
+    return field_instance
+
 
 class BKOraModelComplex:
     """
@@ -17,6 +27,21 @@ class BKOraModelComplex:
         , BKBytes
     )
 
+    # Plantillas de la clase, calculadas una vez en __init_subclass__: {atributo: plantilla}
+    _bk_templates = {}
+
+    # Las lecturas validan cada campo al crear el objeto (salvo en modo ``trusted``)
+    _bk_validates_on_read = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_bk_templates" in cls.__dict__:
+            # Variantes generadas (``lazy()``) que reutilizan las plantillas del modelo declarado
+            return
+        cls._bk_templates = {attr_name: field_template
+                             for attr_name, field_template in cls.__dict__.items()
+                             if isinstance(field_template, cls._FIELD_TYPES)}
+
     # ----------  creación ----------
     def __init__(self, **kwargs):
         """
@@ -25,37 +50,178 @@ class BKOraModelComplex:
           – se clona con el valor recibido,
           – se guarda en la instancia (self.<attr>).
         """
-        for attr_name, field_template in self.__class__.__dict__.items():
-            if isinstance(field_template, self._FIELD_TYPES):
-                col_name = field_template.name or attr_name
-                raw_value = kwargs.get(col_name, None)
-                # Clonamos la plantilla con el valor
-                field_instance = field_template.clone_with_value(raw_value)
-                # Sustituimos en la instancia
-                setattr(self, attr_name, field_instance)
+        for attr_name, field_template in self._bk_templates.items():
+            col_name = field_template.name or attr_name
+            raw_value = kwargs.get(col_name, None)
+            # Clonamos la plantilla con el valor
+            field_instance = field_template.clone_with_value(raw_value)
+            # Sustituimos en la instancia
+            setattr(self, attr_name, field_instance)
+
+    def __setattr__(self, name, value):
+        """
+        Asignar un valor crudo a un campo (``obj.nombre = "x"``) lo envuelve y valida con
+        su plantilla; asignar un campo ya construido (``BKString``…) lo guarda tal cual.
+        """
+        field_template = self._bk_templates.get(name)
+        if field_template is not None and not isinstance(value, self._FIELD_TYPES):
+            value = field_template.clone_with_value(value)
+        object.__setattr__(self, name, value)
+
+    # ----------  validación ----------
+    def validate(self):
+        """
+        Valida todos los campos con las reglas de sus plantillas.
+
+        Es obligatorio antes de escribir un objeto leído en modo ``trusted`` (los managers
+        lo hacen en ``insert_model``/``update_model``) y útil tras modificar ``campo.value``.
+
+        Raises:
+            TypeError, ValueError: Si algún campo no cumple sus validaciones.
+        """
+        for attr_name in self._bk_templates:
+            field_instance = getattr(self, attr_name, None)
+            if field_instance is not None:
+                field_instance.validate_init()
+        self.__dict__.pop("_bk_pending_validation", None)
+
+    @property
+    def pending_validation(self):
+        """``True`` si el objeto se creó en modo ``trusted`` y aún no se ha validado."""
+        return self.__dict__.get("_bk_pending_validation", False)
 
     # ----------  serialización ----------
     def to_dict(self):
         """Devuelve {nombre_columna: valor}."""
         result = {}
-        for attr_name, field_template in self.__class__.__dict__.items():
-            if isinstance(field_template, self._FIELD_TYPES):
-                col_name = field_template.name or attr_name
-                field_instance = getattr(self, attr_name, None)
-                result[col_name] = (
-                    field_instance.value if field_instance else None
-                )
+        for attr_name, field_template in self._bk_templates.items():
+            col_name = field_template.name or attr_name
+            field_instance = getattr(self, attr_name, None)
+            result[col_name] = (
+                field_instance.value if field_instance else None
+            )
         return result
 
     @classmethod
-    def from_dict(cls, data_dict):
+    def from_dict(cls, data_dict, trusted=False):
+        """
+        Crea un objeto desde un dict. Con ``trusted=True`` (filas leídas de la BD, ya
+        restringidas por la definición de las columnas) no se valida al crear: la
+        validación se aplaza hasta que se modifica un campo o se escribe el objeto.
+        """
+        if trusted:
+            return cls._from_trusted(data_dict)
         return cls(**data_dict)
 
     @classmethod
-    def from_list(cls, data_list):
-        """Convierte una lista de dicts (rows) en objs."""
+    def from_list(cls, data_list, trusted=False):
+        """Convierte una lista de dicts (rows) en objs (ver ``from_dict`` para ``trusted``)."""
+        if trusted:
+            return [cls._from_trusted(row) for row in data_list]
         return [cls.from_dict(row) for row in data_list]
 
+    @classmethod
+    def _from_trusted(cls, data_dict):
+        obj = cls.__new__(cls)
+        values = {attr_name: _clone_validated(field_template, data_dict.get(field_template.name or attr_name))
+                  for attr_name, field_template in cls._bk_templates.items()}
+        values["_bk_pending_validation"] = True
+        obj.__dict__.update(values)
+        return obj
+
+    # ----------  validación por lotes ----------
+    @classmethod
+    def validate_list(cls, data_list):
+        """
+        Valida una lista de filas por columnas (ver `BKOraBatchValidator`) sin crear instancias.
+
+        Devuelve un informe con un error por fila y columna inválida, en lugar de
+        detenerse en el primer valor incorrecto como hace ``from_list``.
+        """
+        return BKOraBatchValidator(cls).validate(data_list)
+
+    @classmethod
+    def from_list_batch(cls, data_list, skip_invalid=False, compact=False):
+        """
+        Igual que ``from_list`` pero validando por columnas en un único paso.
+
+        Los campos se construyen con los valores ya validados y normalizados, sin
+        repetir ``clone_with_value`` por celda.
+        Si hay errores se lanza `BKOraValidationError` (subclase de ``ValueError``)
+        con el informe completo; con ``skip_invalid=True`` se descartan esas filas.
+        Con ``compact=True`` se devuelven instancias de ``cls.compact()`` (sin un
+        objeto por campo), la opción más rápida para cargas grandes.
+        """
+        report = cls.validate_list(data_list)
+        skip = set()
+        if not skip_invalid:
+            report.raise_for_errors()
+        else:
+            skip = set(report.invalid_rows())
+
+        keys = [field_template.name or attr_name for attr_name, field_template in cls._bk_templates.items()]
+        rows = zip(*(report.values[name] for name in keys))
+        if skip:
+            rows = (row for index, row in enumerate(rows) if index not in skip)
+        if compact:
+            return cls.compact().from_rows(keys, rows)
+        return cls.from_validated_rows(keys, rows)
+
+    @classmethod
+    def validated_rows(cls, keys, rows):
+        """
+        Valida por columnas filas en forma de tuplas y devuelve sus valores normalizados, sin crear instancias.
+
+        Junto con ``from_validated_rows`` separa la validación (que puede hacerse en otro proceso,
+        ver `BKOraProcessPool`) de la construcción de los objetos.
+        Lanza `BKOraValidationError` con el informe completo si alguna fila no es válida.
+
+        Returns:
+            tuple[list[str], list[tuple]]: Columnas del modelo y filas con los valores normalizados.
+        """
+        report = BKOraBatchValidator(cls).validate_rows(keys, rows)
+        report.raise_for_errors()
+        names = [field_template.name or attr_name for attr_name, field_template in cls._bk_templates.items()]
+        return names, list(zip(*(report.values[name] for name in names)))
+
+    @classmethod
+    def from_validated_rows(cls, keys, rows):
+        """Crea instancias a partir de valores ya validados y normalizados (ver ``validated_rows``), sin validar."""
+        position = {name: index for index, name in enumerate(keys)}
+        fields = [(attr_name, field_template, position.get(field_template.name or attr_name))
+                  for attr_name, field_template in cls._bk_templates.items()]
+        result = []
+        for row in rows:
+            obj = cls.__new__(cls)
+            obj.__dict__.update({attr_name: _clone_validated(field_template, None if index is None else row[index])
+                                 for attr_name, field_template, index in fields})
+            result.append(obj)
+        return result
+
+    @classmethod
+    def compact(cls):
+        """
+        Devuelve la variante compacta del modelo (ver `BKOraModelCompact`).
+
+        Las instancias compactas guardan el valor crudo de cada campo en un slot en lugar de
+        un clon de ``BKString``/``BKNumber``…; las plantillas (y sus validaciones) quedan en
+        esta clase y se recuperan con ``instancia.expand()``.
+        """
+        columns = [(attr_name, field_template.name or attr_name, None)
+                   for attr_name, field_template in cls._bk_templates.items()]
+        return compact_model(cls, columns)
+
+    @classmethod
+    def lazy(cls):
+        """
+        Devuelve la variante perezosa del modelo (ver `BKOraModelLazy`).
+
+        Las instancias perezosas guardan la fila cruda en un buffer y solo crean cada
+        ``BKString``/``BKNumber``… al acceder al campo por primera vez; ``to_dict()`` no
+        materializa ninguno. Siguen siendo instancias de esta clase.
+        """
+        return lazy_model(cls)
+
     # ----------  introspección ----------
     @classmethod
     def get_columns_info(cls):
@@ -64,21 +230,20 @@ class BKOraModelComplex:
         útil para generar ‘CREATE TABLE’, validaciones externas, etc.
         """
         info = {}
-        for attr_name, field_template in cls.__dict__.items():
-            if isinstance(field_template, cls._FIELD_TYPES):
-                col_name = field_template.name or attr_name
-                # vars() da los atributos públicos del objeto
-                meta = {k: v for k, v in vars(field_template).items()
-                        if not k.startswith('_') and k != 'value'}
-                meta['attribute'] = attr_name
-                info[col_name] = meta
+        for attr_name, field_template in cls._bk_templates.items():
+            col_name = field_template.name or attr_name
+            # vars() da los atributos públicos del objeto
+            meta = {k: v for k, v in vars(field_template).items()
+                    if not k.startswith('_') and k != 'value'}
+            meta['attribute'] = attr_name
+            info[col_name] = meta
         return info
 
     # ----------  representación ----------
     def __repr__(self):
         pk_parts = []
-        for attr_name, field_template in self.__class__.__dict__.items():
-            if isinstance(field_template, self._FIELD_TYPES) and field_template.primary_key:
+        for attr_name, field_template in self._bk_templates.items():
+            if field_template.primary_key:
                 field_instance = getattr(self, attr_name, None)
                 value = field_instance.value if field_instance else None
                 pk_parts.append(f"{attr_name}={value}")
@@ -1,18 +1,28 @@
 from BKLibOra.BKOraModel.BKOraColums import BKOraColumn
+from BKLibOra.BKOraModel.BKOraModelCompact import compact_model
 
 class BKOraModelDB:
+    # Mapa de columnas calculado una vez por clase en __init_subclass__: ((atributo, columna, default), ...)
+    _bk_columns = ()
+    _bk_fast = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._bk_columns = tuple((key, column.name or key, column.default)
+                                for key, column in cls.__dict__.items() if isinstance(column, BKOraColumn))
+        # El camino rápido crea instancias sin pasar por __init__/from_dict/from_list, solo es válido si no se sobrescriben
+        cls._bk_fast = (cls.__init__ is BKOraModelDB.__init__
+                        and cls.from_dict.__func__ is BKOraModelDB.from_dict.__func__
+                        and cls.from_list.__func__ is BKOraModelDB.from_list.__func__)
+        cls._bk_factories = {}
+
     def __init__(self, **kwargs):
-        for key, column in self.__class__.__dict__.items():
-            if isinstance(column, BKOraColumn):
-                value = kwargs.get(column.name or key, column.default)
-                setattr(self, key, value)
+        for key, name, default in self._bk_columns:
+            setattr(self, key, kwargs.get(name, default))
 
     def to_dict(self):
-        result = {}
-        for key, column in self.__class__.__dict__.items():
-            if isinstance(column, BKOraColumn):
-                result[column.name or key] = getattr(self, key, column.default)
-        return result
+        values = self.__dict__
+        return {name: values.get(key, default) for key, name, default in self._bk_columns}
 
     @classmethod
     def from_dict(cls, data_dict):
@@ -20,7 +30,90 @@ class BKOraModelDB:
 
     @classmethod
     def from_list(cls, data_list):
-        return [cls.from_dict(item) for item in data_list]
+        if not cls._bk_fast:
+            return [cls.from_dict(item) for item in data_list]
+
+        columns = cls._bk_columns
+        new = object.__new__
+        result = []
+        for item in data_list:
+            obj = new(cls)
+            obj.__dict__ = {key: item.get(name, default) for key, name, default in columns}
+            result.append(obj)
+        return result
+
+    @classmethod
+    def from_rows(cls, keys, rows):
+        """
+        Crea instancias directamente a partir de tuplas de resultado, por posición de columna.
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+            rows (Iterable[tuple]): Filas del resultado.
+
+        Returns:
+            list[BKOraModelDB]: Lista de instancias del modelo.
+        """
+        return list(map(cls.row_factory(keys), rows))
+
+    @classmethod
+    def row_factory(cls, keys):
+        """
+        Devuelve una función ``fila -> instancia`` compilada para un orden de columnas concreto.
+
+        La función se cachea por clase y por tupla de ``keys``. Si la clase sobrescribe
+        ``__init__``, ``from_dict`` o ``from_list`` se usa el camino lento: ``from_list`` por fila
+        si es ``from_list`` lo que se sobrescribe, ``from_dict`` por fila en otro caso.
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+
+        Returns:
+            Callable[[tuple], BKOraModelDB]: Constructor de instancias por fila.
+        """
+        keys = tuple(keys)
+        factory = cls._bk_factories.get(keys)
+        if factory is None:
+            factory = cls._compile_row_factory(keys)
+            cls._bk_factories[keys] = factory
+        return factory
+
+    @classmethod
+    def _compile_row_factory(cls, keys):
+        if not cls._bk_fast:
+            if cls.from_list.__func__ is not BKOraModelDB.from_list.__func__:
+                return lambda row: cls.from_list([dict(zip(keys, row))])[0]
+            return lambda row: cls.from_dict(dict(zip(keys, row)))
+
+        # Se genera el constructor como código para asignar cada atributo por posición sin bucles
+        position = {name: index for index, name in enumerate(keys)}
+        defaults = {}
+        items = []
+        for number, (key, name, default) in enumerate(cls._bk_columns):
+            if name in position:
+                items.append(f"{key!r}: row[{position[name]}]")
+            else:
+                defaults[f"_default_{number}"] = default
+                items.append(f"{key!r}: _default_{number}")
+
+        source = ("def build(row):\n"
+                  "    obj = new(cls)\n"
+                  f"    obj.__dict__ = {{{', '.join(items)}}}\n"
+                  "    return obj\n")
+        namespace = {"new": object.__new__, "cls": cls, **defaults}
+        exec(source, namespace)
+        return namespace["build"]
+
+    @classmethod
+    def compact(cls):
+        """
+        Devuelve la variante compacta del modelo (ver `BKOraModelCompact`): una clase con un slot
+        por columna, sin ``__dict__`` por instancia.
+
+        Returns:
+            type: Subclase de `BKOraCompactModel`.
+        """
+        return compact_model(cls, cls._bk_columns)
 
     @classmethod
     def get_columns_info(cls):
@@ -0,0 +1,230 @@
+"""
+Módulo BKOraModelLazy
+---------------------
+
+Este módulo genera variantes perezosas de los modelos declarados con `BKOraModelComplex`.
+
+Una instancia perezosa guarda los valores crudos de la fila en un buffer (una tupla en el orden de declaración
+de los campos) y solo crea el `BKString`/`BKNumber`… de un campo la primera vez que se accede a él, mediante un
+descriptor por campo. `to_dict()` lee directamente del buffer, sin materializar los campos no usados.
+Está pensada para modelos con muchas columnas de los que solo se consultan unas pocas; se obtiene con
+`Modelo.lazy()` y se pasa como modelo al manager.
+
+Clases:
+    BKOraLazyField
+    BKOraLazyModel
+
+Funciones:
+    lazy_model(source)
+"""
+
+# Claves del __dict__ de una instancia perezosa que no son campos
+_STATE_KEYS = frozenset(("_bk_row", "_bk_pending_validation"))
+
+
+class BKOraLazyField:
+    """
+    Descriptor que materializa un campo de un modelo perezoso en el primer acceso.
+
+    El campo se crea con ``clone_with_value`` (validado) a partir del valor del buffer y se guarda en el
+    ``__dict__`` de la instancia, de modo que los accesos siguientes ya no pasan por el descriptor.
+    Desde la clase devuelve la plantilla, igual que el modelo declarado.
+
+    Args:
+        attr_name (str): Nombre del atributo en el modelo.
+        template (object): Plantilla del campo (`BKString`, `BKNumber`…).
+        index (int): Posición del valor en el buffer de la fila.
+    """
+
+    __slots__ = ("attr_name", "template", "index")
+
+    def __init__(self, attr_name, template, index):
+        self.attr_name = attr_name
+        self.template = template
+        self.index = index
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self.template
+        field_instance = self.template.clone_with_value(obj._bk_row[self.index])
+        obj.__dict__[self.attr_name] = field_instance
+        return field_instance
+
+
+class BKOraLazyModel:
+    """
+    Clase base de los modelos perezosos generados por `lazy_model`.
+
+    La clase generada hereda también del modelo declarado, así que conserva sus métodos y
+    ``isinstance(obj, Modelo)``; esta base solo sustituye la creación y la serialización.
+    Los valores del buffer no se han validado: las instancias quedan con ``pending_validation``
+    y los managers las validan completas antes de escribirlas.
+
+    Atributos de clase:
+        _bk_source (type): Modelo declarado del que procede.
+        _bk_fields (tuple): Campos del buffer ``((atributo, columna), ...)``, en orden.
+        _bk_keys (tuple): Nombres de columna del buffer, en orden.
+    """
+
+    _bk_source = None
+    _bk_fields = ()
+    _bk_keys = ()
+    # Los campos se validan al acceder a ellos, no al leer la fila
+    _bk_validates_on_read = False
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(_bk_row=tuple(kwargs.get(column) for column in self._bk_keys),
+                             _bk_pending_validation=True)
+
+    def to_dict(self):
+        """
+        Devuelve ``{columna: valor}`` leyendo del buffer, o del campo si ya se materializó.
+
+        Returns:
+            dict: Valores de cada columna.
+        """
+        values = self.__dict__
+        row = values["_bk_row"]
+        if values.keys() <= _STATE_KEYS:
+            # Ningún campo materializado: la fila sale tal cual del buffer
+            return dict(zip(self._bk_keys, row))
+        result = {}
+        for index, (attr_name, column) in enumerate(self._bk_fields):
+            field_instance = values.get(attr_name)
+            result[column] = row[index] if field_instance is None else field_instance.value
+        return result
+
+    @classmethod
+    def from_dict(cls, data_dict, trusted=False):
+        """Crea una instancia perezosa desde un dict (``trusted`` se acepta por compatibilidad)."""
+        return cls(**data_dict)
+
+    @classmethod
+    def from_list(cls, data_list, trusted=False):
+        """Convierte una lista de dicts (rows) en instancias perezosas."""
+        return [cls(**row) for row in data_list]
+
+    @classmethod
+    def from_rows(cls, keys, rows):
+        """
+        Crea instancias perezosas directamente a partir de tuplas de resultado.
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+            rows (Iterable[tuple]): Filas del resultado.
+
+        Returns:
+            list[BKOraLazyModel]: Lista de instancias.
+        """
+        return list(map(cls.row_factory(keys), rows))
+
+    @classmethod
+    def row_factory(cls, keys):
+        """
+        Devuelve una función ``fila -> instancia`` compilada para un orden de columnas concreto.
+
+        La función solo reordena la fila en el buffer; no crea ni valida ningún campo.
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+
+        Returns:
+            Callable[[tuple], BKOraLazyModel]: Constructor de instancias por fila.
+        """
+        keys = tuple(keys)
+        factory = cls._bk_factories.get(keys)
+        if factory is None:
+            position = {name: index for index, name in enumerate(keys)}
+            items = [f"row[{position[column]}]" if column in position else "None" for column in cls._bk_keys]
+            lines = ["def build(row):",
+                     "    obj = new(cls)",
+                     f"    obj.__dict__ = {{'_bk_row': ({', '.join(items)},), '_bk_pending_validation': True}}",
+                     "    return obj"]
+            namespace = {"new": object.__new__, "cls": cls}
+            exec("\n".join(lines) + "\n", namespace)
+            factory = cls._bk_factories[keys] = namespace["build"]
+        return factory
+
+    @classmethod
+    def from_list_batch(cls, data_list, skip_invalid=False, compact=False):
+        """
+        Igual que `BKOraModelComplex.from_list_batch`, guardando en el buffer los valores ya validados.
+
+        Las instancias resultantes no quedan pendientes de validación.
+        """
+        if compact:
+            return cls._bk_source.from_list_batch(data_list, skip_invalid=skip_invalid, compact=True)
+        report = cls.validate_list(data_list)
+        skip = set()
+        if not skip_invalid:
+            report.raise_for_errors()
+        else:
+            skip = set(report.invalid_rows())
+
+        result = []
+        rows = zip(*(report.values[column] for column in cls._bk_keys))
+        for index, row in enumerate(rows):
+            if index in skip:
+                continue
+            obj = object.__new__(cls)
+            obj.__dict__ = {"_bk_row": row}
+            result.append(obj)
+        return result
+
+    @classmethod
+    def lazy(cls):
+        return cls
+
+    @classmethod
+    def compact(cls):
+        return cls._bk_source.compact()
+
+    def __reduce__(self):
+        # La clase generada no es accesible por nombre: se serializa el modelo origen y el estado
+        return _restore_lazy, (self._bk_source, dict(self.__dict__))
+
+
+def lazy_model(source):
+    """
+    Genera (o recupera de la caché) la clase perezosa de un modelo `BKOraModelComplex`.
+
+    Args:
+        source (type): Modelo declarado.
+
+    Returns:
+        type: Subclase de `BKOraLazyModel` y de ``source`` con un descriptor por campo.
+
+    Raises:
+        ValueError: Si el modelo no declara campos.
+    """
+    lazy = source.__dict__.get("_bk_lazy")
+    if lazy is not None:
+        return lazy
+
+    templates = source._bk_templates
+    if not templates:
+        raise ValueError(f"El modelo {source.__name__} no declara campos para generar su versión perezosa")
+
+    fields = tuple((attr_name, template.name or attr_name) for attr_name, template in templates.items())
+    namespace = {
+        "__module__": source.__module__,
+        "__doc__": f"Versión perezosa (campos creados al primer acceso) de {source.__name__}.",
+        "_bk_source": source,
+        "_bk_templates": templates,
+        "_bk_fields": fields,
+        "_bk_keys": tuple(column for _, column in fields),
+        "_bk_factories": {},
+    }
+    for index, (attr_name, template) in enumerate(templates.items()):
+        namespace[attr_name] = BKOraLazyField(attr_name, template, index)
+
+    lazy = type(f"{source.__name__}Lazy", (BKOraLazyModel, source), namespace)
+    setattr(source, "_bk_lazy", lazy)
+    return lazy
+
+
+def _restore_lazy(source, state):
+    """Reconstruye una instancia perezosa serializada con ``pickle``."""
+    obj = object.__new__(lazy_model(source))
+    obj.__dict__.update(state)
+    return obj
@@ -0,0 +1,367 @@
+"""
+Módulo BKOraValidator
+---------------------
+
+Este módulo implementa la validación por lotes (por columnas) de los campos de `BKOraModelComplex`.
+
+En lugar de clonar y validar cada plantilla (`BKString`, `BKNumber`, `BKFloat`…) fila a fila, el validador toma
+una columna completa del resultado y aplica comprobaciones vectorizadas con NumPy (longitudes, rangos, dígitos)
+que marcan los valores *sospechosos*. Solo esos valores pasan por la validación exacta del campo
+(`clone_with_value`), por lo que el criterio y los mensajes de error son idénticos a los de la validación por fila.
+
+Clases:
+    BKOraValidationReport
+    BKOraValidationError
+    BKOraBatchValidator
+
+Dependencias:
+    - numpy (opcional, ``pip install BKLibOra[validation]``)
+"""
+
+from BKLibOra.BKOraModel.BKOraDataType import BKString, BKNumber, BKFloat, BKDate, BKDatetime, BKBytes
+from BKLibOra.utils import get_byte_size, require_numpy
+from datetime import date, datetime
+
+# Bytes máximos por carácter en las codificaciones habituales; con otras se mide siempre el valor codificado
+_MAX_BYTES_PER_CHAR = {"utf-8": 4, "utf8": 4, "utf-16": 4, "utf-32": 4, "ascii": 1, "latin-1": 1, "latin1": 1}
+
+# Dígitos significativos máximos de la representación ``str`` de un float
+_FLOAT_REPR_DIGITS = 17
+
+
+class BKOraValidationReport:
+    """
+    Informe de una validación por lotes.
+
+    Atributos:
+        rows (int): Filas validadas.
+        errors (list[dict]): Errores encontrados, cada uno con ``row`` (índice de la fila), ``column``,
+            ``error`` (``"TypeError"`` / ``"ValueError"``) y ``message``.
+        values (dict[str, list]): Valores normalizados por columna (p. ej. ``BKFloat`` redondeado a su
+            escala), tal y como quedarían en el campo tras validarlo.
+
+    Métodos:
+        invalid_rows(): Índices de las filas con algún error.
+        by_column(): Número de errores por columna.
+        raise_for_errors(): Lanza `BKOraValidationError` si hay errores.
+    """
+
+    def __init__(self, rows: int):
+        self.rows = rows
+        self.errors = []
+        self.values = {}
+
+    @property
+    def ok(self) -> bool:
+        """``True`` si no se ha encontrado ningún error."""
+        return not self.errors
+
+    def add(self, row: int, column: str, error: Exception):
+        """Registra el error de validación de una celda."""
+        self.errors.append({
+            "row": row,
+            "column": column,
+            "error": type(error).__name__,
+            "message": str(error),
+        })
+
+    def invalid_rows(self) -> list:
+        """
+        Devuelve los índices de las filas con algún error.
+
+        Returns:
+            list[int]: Índices ordenados.
+        """
+        return sorted({error["row"] for error in self.errors})
+
+    def by_column(self) -> dict:
+        """
+        Devuelve el número de errores por columna.
+
+        Returns:
+            dict[str, int]: ``{columna: errores}``.
+        """
+        counts = {}
+        for error in self.errors:
+            counts[error["column"]] = counts.get(error["column"], 0) + 1
+        return counts
+
+    def raise_for_errors(self):
+        """
+        Lanza `BKOraValidationError` si el informe contiene errores.
+
+        Raises:
+            BKOraValidationError: Con el primer error en el mensaje y el informe completo en ``report``.
+        """
+        if self.errors:
+            raise BKOraValidationError(self)
+
+    def __len__(self):
+        return len(self.errors)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}: {self.rows} filas, {len(self.errors)} errores"
+
+
+class BKOraValidationError(ValueError):
+    """
+    Error de validación por lotes. Hereda de ``ValueError`` para mantener el contrato de los campos.
+
+    Atributos:
+        report (BKOraValidationReport): Informe completo de la validación.
+    """
+
+    def __init__(self, report: BKOraValidationReport):
+        first = report.errors[0]
+        super().__init__(f"{len(report.errors)} errores de validación en {len(report.invalid_rows())} filas; "
+                         f"primero en la fila {first['row']}, columna '{first['column']}': {first['message']}")
+        self.report = report
+
+    def __reduce__(self):
+        # Se reconstruye desde el informe (p. ej. al recibirlo de otro proceso)
+        return self.__class__, (self.report,)
+
+
+def _check_string(field, values, np):
+    """Marca como sospechosos los textos de tipo, longitud o tamaño en bytes no válidos."""
+    lengths = np.fromiter((len(value) if type(value) is str else (-2 if value is None else -1) for value in values),
+                          dtype=np.int64, count=len(values))
+    limit = min(field.large, BKString.MAX_BYTES)
+    suspect = (lengths == -1) | (lengths > limit)
+    if field.min_length:
+        suspect |= (lengths >= 0) & (lengths < field.min_length)
+
+    # Solo se codifican los textos que podrían superar el límite por tener caracteres multibyte
+    factor = _MAX_BYTES_PER_CHAR.get(field.encoding.lower())
+    maybe = (lengths >= 0) & ~suspect
+    if factor is not None:
+        maybe &= lengths * factor > limit
+    for index in np.flatnonzero(maybe):
+        value = values[index]
+        if factor == 4 and value.isascii():
+            continue
+        if get_byte_size(value, field.encoding) > limit:
+            suspect[index] = True
+    return suspect, None
+
+
+def _nulls(field, values, np):
+    """Máscara de nulos y sospechosos por nulo en campos no anulables."""
+    nulls = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    return nulls, (nulls if not field.nullable else np.zeros(len(values), dtype=bool))
+
+
+def _check_number(field, values, np):
+    """Marca como sospechosos los enteros de tipo, número de dígitos o rango no válidos."""
+    nulls, suspect = _nulls(field, values, np)
+    typed = np.fromiter((type(value) is int for value in values), dtype=bool, count=len(values))
+    suspect |= ~typed & ~nulls
+
+    try:
+        numbers = np.array([value if typed[index] else 0 for index, value in enumerate(values)], dtype=np.int64)
+    except OverflowError:
+        # Enteros fuera de int64: se comprueban uno a uno en Python
+        bound = 10 ** BKNumber.MAX_DIGITS
+        for index, value in enumerate(values):
+            if typed[index] and (abs(value) >= bound
+                                 or (field.min_value is not None and value < field.min_value)
+                                 or (field.max_value is not None and value > field.max_value)):
+                suspect[index] = True
+        return suspect, None
+
+    if BKNumber.MAX_DIGITS < 19:
+        suspect |= typed & (np.abs(numbers) >= 10 ** BKNumber.MAX_DIGITS)
+    if field.min_value is not None:
+        suspect |= typed & (numbers < field.min_value)
+    if field.max_value is not None:
+        suspect |= typed & (numbers > field.max_value)
+    return suspect, None
+
+
+def _repr_digits(value) -> int:
+    """Dígitos significativos de ``Decimal(str(value))`` para un int o float finito, sin crear el ``Decimal``."""
+    mantissa = str(value).split("e")[0]
+    return len(mantissa.replace("-", "").replace(".", "").lstrip("0")) or 1
+
+
+def _check_float(field, values, np):
+    """
+    Marca como sospechosos los valores de tipo, precisión o rango no válidos y devuelve los valores normalizados.
+
+    La precisión se acota sin ``Decimal``: un float tiene como mucho 17 dígitos significativos y, con escala,
+    ``dígitos enteros + escala``. Los valores cerca de los límites de rango se confirman con la validación exacta.
+    """
+    nulls, suspect = _nulls(field, values, np)
+    typed = np.fromiter((type(value) is float or type(value) is int for value in values),
+                        dtype=bool, count=len(values))
+    suspect |= ~typed & ~nulls
+
+    numbers = np.array([float(value) if typed[index] else 0.0 for index, value in enumerate(values)],
+                       dtype=np.float64)
+    suspect |= typed & ~np.isfinite(numbers)
+    magnitude = np.abs(numbers)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # +1 de holgura frente a errores de redondeo de log10 cerca de potencias de 10
+        integer_digits = np.where(magnitude >= 1, np.floor(np.log10(magnitude)) + 2, 1)
+
+    if field.scale is not None:
+        suspect |= typed & (integer_digits + field.scale > field.precision)
+        tolerance = 10.0 ** -field.scale
+    else:
+        # Sin escala los dígitos son los de ``str(valor)``: se cuentan sobre el texto solo si la cota los supera
+        is_float = np.fromiter((type(value) is float for value in values), dtype=bool, count=len(values))
+        upper_digits = np.where(is_float, _FLOAT_REPR_DIGITS, integer_digits)
+        for index in np.flatnonzero(typed & (upper_digits > field.precision)):
+            if _repr_digits(values[index]) > field.precision:
+                suspect[index] = True
+        tolerance = 0.0
+
+    if field.min_value is not None:
+        bound = float(field.min_value)
+        suspect |= typed & (numbers < bound + tolerance + 1e-9 * max(1.0, abs(bound)))
+    if field.max_value is not None:
+        bound = float(field.max_value)
+        suspect |= typed & (numbers > bound - tolerance - 1e-9 * max(1.0, abs(bound)))
+
+    # Normalización: con escala, los valores que ya la cumplen no cambian; el resto se redondea de forma exacta
+    if field.scale is not None:
+        with np.errstate(invalid="ignore", over="ignore"):
+            exact = np.round(numbers, field.scale) == numbers
+        suspect |= typed & ~exact
+
+    normalized = numbers.tolist()
+    for index in np.flatnonzero(nulls):
+        normalized[index] = None
+    return suspect, normalized
+
+
+def _check_date(field, values, np):
+    """Marca como sospechosos los valores que no son ``date`` o los nulos no permitidos."""
+    nulls, suspect = _nulls(field, values, np)
+    suspect |= np.fromiter((value is not None and type(value) is not date and type(value) is not datetime
+                            for value in values), dtype=bool, count=len(values))
+    return suspect, None
+
+
+def _check_datetime(field, values, np):
+    """Marca como sospechosos los valores que no son ``datetime`` o los nulos no permitidos."""
+    nulls, suspect = _nulls(field, values, np)
+    suspect |= np.fromiter((value is not None and type(value) is not datetime for value in values),
+                           dtype=bool, count=len(values))
+    return suspect, None
+
+
+def _check_bytes(field, values, np):
+    """Marca como sospechosos los binarios de tipo o tamaño no válidos o los nulos no permitidos."""
+    nulls, suspect = _nulls(field, values, np)
+    suspect |= np.fromiter((value is not None and (type(value) not in (bytes, bytearray)
+                                                   or len(value) > field.max_bytes)
+                            for value in values), dtype=bool, count=len(values))
+    return suspect, None
+
+
+class BKOraBatchValidator:
+    """
+    Validador por columnas para los campos de `BKOraModelComplex`.
+
+    Cada tipo de campo registrado en ``CHECKS`` tiene una comprobación vectorizada que devuelve una máscara
+    de valores sospechosos (un superconjunto de los inválidos); esos valores se confirman con
+    ``clone_with_value`` del campo. Los campos de tipos no registrados se validan siempre valor a valor.
+
+    Args:
+        model (type): Clase modelo con plantillas de campo (`BKOraModelComplex` o subclase).
+
+    Métodos:
+        validate(data_list): Valida una lista de filas (diccionarios).
+        validate_rows(keys, rows): Valida filas en forma de tuplas.
+        validate_columns(columns, rows): Valida columnas ya separadas.
+    """
+
+    CHECKS = {
+        BKString: _check_string,
+        BKNumber: _check_number,
+        BKFloat: _check_float,
+        BKDate: _check_date,
+        BKDatetime: _check_datetime,
+        BKBytes: _check_bytes,
+    }
+
+    def __init__(self, model):
+        self.np = require_numpy("La validación por lotes")
+        self.model = model
+        field_types = getattr(model, "_FIELD_TYPES", tuple(self.CHECKS))
+        source = getattr(model, "_bk_source", None) or model
+        self.fields = [(attr_name, field.name or attr_name, field)
+                       for attr_name, field in vars(source).items() if isinstance(field, field_types)]
+
+    def validate(self, data_list) -> BKOraValidationReport:
+        """
+        Valida una lista de filas en forma de diccionarios ``{columna: valor}``.
+
+        Args:
+            data_list (list[dict]): Filas a validar. Las columnas ausentes se validan como ``None``.
+
+        Returns:
+            BKOraValidationReport: Informe con los errores por fila y columna.
+        """
+        columns = {name: [row.get(name) for row in data_list] for _, name, _ in self.fields}
+        return self.validate_columns(columns, len(data_list))
+
+    def validate_rows(self, keys, rows) -> BKOraValidationReport:
+        """
+        Valida filas en forma de tuplas, tal como las devuelve el cursor.
+
+        Args:
+            keys (Iterable[str]): Nombres de columna del resultado, en orden.
+            rows (Sequence[tuple]): Filas del resultado.
+
+        Returns:
+            BKOraValidationReport: Informe con los errores por fila y columna.
+        """
+        rows = list(rows)
+        transposed = dict(zip(keys, (list(column) for column in zip(*rows)))) if rows else {}
+        columns = {name: transposed.get(name, [None] * len(rows)) for _, name, _ in self.fields}
+        return self.validate_columns(columns, len(rows))
+
+    def validate_columns(self, columns: dict, rows: int) -> BKOraValidationReport:
+        """
+        Valida columnas completas.
+
+        Args:
+            columns (dict[str, list]): Valores de cada columna del modelo.
+            rows (int): Número de filas.
+
+        Returns:
+            BKOraValidationReport: Informe con los errores y los valores normalizados.
+        """
+        report = BKOraValidationReport(rows)
+        for _, name, field in self.fields:
+            values = columns.get(name)
+            if values is None:
+                values = [None] * rows
+            check = self._check_for(field)
+            if check is None:
+                suspect, normalized = self.np.ones(rows, dtype=bool), None
+            else:
+                suspect, normalized = check(field, values, self.np)
+
+            for index in self.np.flatnonzero(suspect):
+                index = int(index)
+                try:
+                    clone = field.clone_with_value(values[index])
+                except (TypeError, ValueError, ArithmeticError) as e:
+                    # ArithmeticError: decimal.InvalidOperation (inf/nan con escala), OverflowError...
+                    report.add(index, name, e)
+                    continue
+                if normalized is not None:
+                    normalized[index] = clone.value
+            report.values[name] = normalized if normalized is not None else values
+        report.errors.sort(key=lambda error: error["row"])
+        return report
+
+    def _check_for(self, field):
+        for field_type in type(field).__mro__:
+            check = self.CHECKS.get(field_type)
+            if check is not None:
+                return check
+        return None
@@ -15,6 +15,7 @@ Atributos:
         Claves:
             - "oracledb" (str): Dialecto SQLAlchemy para el driver `oracledb`.
             - "cx_oracle" (str): Dialecto SQLAlchemy para el driver `cx_Oracle`.
+            - "oracledb_async" (str): Dialecto SQLAlchemy asíncrono para el driver `oracledb`.
             - "default_port" (int): Puerto por defecto del servicio Oracle.
             - "default_host" (str): Host por defecto (normalmente `localhost`).
 """
@@ -23,6 +24,7 @@ import cx_Oracle
 config_conn_lib = {
     "oracledb": "oracle+oracledb",
     "cx_oracle": "oracle+cx_oracle",
+    "oracledb_async": "oracle+oracledb_async",
     "default_port": 1521,
     "default_host": "localhost"
 }
@@ -49,5 +51,109 @@ MAX_VALUES = {
 
 PAGE_VALUES = {
     "rows_page": 20,
-    "row_page_tab" : 5
+    "row_page_tab" : 5,
+    "count_over": False  # True: total de filas con COUNT(*) OVER () en la misma consulta de datos
+}
+
+FETCH_VALUES = {
+    "arraysize": 1000,  # Filas por round-trip en las lecturas en streaming
+    "fetch_arraysize": None,  # Filas por round-trip de fetch_all/getlist (None = la del conector o la del driver)
+    "prefetchrows": None,  # Filas que llegan con el execute (None = las del conector o las del driver)
+    "trusted_read": False  # True: los modelos leídos no se validan hasta modificarse o escribirse
+}
+
+IN_VALUES = {
+    "in_strategy": "expand",    # expand | bucket | array | chunk: cómo se generan los filtros IN
+    "in_chunk_size": 1000,      # Valores máximos por lista IN (límite de Oracle: 1000)
+    "in_array_threshold": None  # chunk: a partir de este número de valores se usa un bind de colección
+}
+
+ARRAY_BIND_TYPES = {
+    "number": "SYS.ODCINUMBERLIST",      # Colección para int, float y Decimal
+    "string": "SYS.ODCIVARCHAR2LIST",    # Colección para str (y valores de otro tipo)
+    "date": "SYS.ODCIDATELIST"           # Colección para date y datetime
+}
+
+BULK_VALUES = {
+    "batch_size": 1000,    # Filas por llamada executemany (array DML)
+    "batch_errors": False  # True: recoge los errores por fila en lugar de abortar el lote
+}
+
+POOL_VALUES = {
+    "pool_size": 5,          # Conexiones persistentes del pool de SQLAlchemy
+    "max_overflow": 10,      # Conexiones extra permitidas por encima de pool_size
+    "pool_timeout": 30,      # Segundos de espera máxima por una conexión libre
+    "pool_recycle": -1,      # Segundos tras los que se recicla una conexión (-1 = nunca)
+    "pool_pre_ping": True,   # Ping de validación en cada checkout
+    "native_min": 1,         # Conexiones mínimas del pool nativo del driver
+    "native_max": 15,        # Conexiones máximas del pool nativo del driver
+    "native_increment": 1,   # Conexiones que abre el pool nativo cuando necesita crecer
+    "native_ping_interval": 60  # Segundos entre pings internos del pool nativo (oracledb)
+}
+
+RESULT_CACHE_VALUES = {
+    "result_cache": None,    # BKOraResultCache usada por getlist (None = sin caché de resultados)
+    "cache_ttl": 60,         # Segundos de validez de un resultado cacheado (None = sin caducidad)
+    "cache_namespace": None  # Ámbito de invalidación; por defecto, la tabla de las sentencias DML
+}
+
+CACHE_BACKEND_VALUES = {
+    "maxsize": 256,                 # Resultados máximos por backend de caché
+    "max_bytes": 64 * 1024 * 1024   # Tamaño máximo aproximado de los resultados guardados
+}
+
+STATEMENT_CACHE_VALUES = {
+    "maxsize": 512  # Sentencias y formas de consulta que conserva la caché LRU (0 = sin caché)
+}
+
+CATALOG_VALUES = {
+    "max_age": 300  # Segundos entre comprobaciones de LAST_DDL_TIME en BKOraCatalog.refresh_if_stale
+}
+
+SESSION_MONITOR_VALUES = {
+    "interval": 5,           # Segundos entre sondeos de BKOraSessionMonitor
+    "long_running": 60,      # Segundos de llamada activa a partir de los que se avisa de SQL de larga duración
+    "sql_cache_size": 1024,  # SQL_ID cuyo texto se conserva (LRU) para no releer V$SQLAREA
+    "with_locks": True       # Consulta también V$LOCK (MgrdbSessionLock) en cada sondeo
+}
+
+INSTRUMENTATION_VALUES = {
+    "buckets_ms": (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000),  # Límites de los histogramas de latencia
+    "max_statements": 1000,    # Huellas de SQL distintas que conserva el agregador
+    "size_sample": 20,         # Filas de muestra para estimar los bytes leídos
+    "fingerprint_cache": 2048  # Textos SQL cuya huella se memoriza
+}
+
+FETCH_TUNER_VALUES = {
+    "initial_arraysize": 100,  # arraysize supuesto para una consulta aún no observada (el del driver)
+    "max_arraysize": 10000,    # Límite del arraysize adaptativo
+    "growth": 4,               # Factor de crecimiento cuando una consulta llena más de un lote
+    "max_prefetchrows": 1000,  # Resultados de hasta este tamaño se piden enteros con el execute
+    "maxsize": 1024            # Consultas distintas cuyo tamaño de lote se recuerda (LRU)
+}
+
+PARALLEL_VALUES = {
+    "parallel_workers": 4,         # Hilos (y conexiones del pool) de getlist_parallel
+    "parallel_partitions": None,   # Particiones de la consulta (None = parallel_workers)
+    "partition_strategy": "hash",  # hash | range | rowid: cómo se reparte la consulta base
+    "partition_column": None,      # Columna de reparto de hash/range (None = clave primaria del modelo)
+    "partition_table": None,       # rowid: tabla ([OWNER.]TABLA) cuyos extents se reparten (None = la del INSERT)
+    "parallel_ordered": False,     # True: las particiones se devuelven en orden; False: según van llegando
+    "parallel_queue_size": 4       # Lotes de arraysize filas en cola por partición antes de frenar la lectura
+}
+
+PROCESS_VALUES = {
+    "process_pool": None  # BKOraProcessPool que construye los modelos de getlist* (None = en el propio proceso)
+}
+
+PROCESS_POOL_VALUES = {
+    "workers": None,       # Procesos de BKOraProcessPool (None = os.cpu_count())
+    "batch_size": 5000,    # Filas por lote enviado a un proceso
+    "min_rows": 20000,     # Los resultados con menos filas se convierten en el propio proceso
+    "max_pending": None,   # Lotes en curso de materialize_iter (None = 2 * workers)
+    "start_method": None   # fork | spawn | forkserver (None = el de la plataforma)
+}
+
+GATHER_VALUES = {
+    "workers": 6  # Hilos (y conexiones del pool) de BKOraManager.gather
 }
\ No newline at end of file
@@ -43,3 +43,23 @@ def get_byte_size(data: Union[str, bytes, None], encoding='utf-8') -> int:
         return len(data.encode(encoding))
     else:
         raise TypeError("Solo se aceptan valores de tipo str, bytes o None.")
+
+
+def require_numpy(feature: str = "esta funcionalidad"):
+    """
+    Importa NumPy bajo demanda (dependencia opcional).
+
+    Args:
+        feature (str, opcional): Nombre de la funcionalidad que lo necesita, para el mensaje de error.
+
+    Returns:
+        module: El módulo ``numpy``.
+
+    Raises:
+        ImportError: Si NumPy no está instalado.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(f"{feature} requiere NumPy (pip install numpy)") from e
+    return numpy
@@ -0,0 +1,157 @@
+"""
+Módulo bench_manager
+--------------------
+
+Benchmarks de lectura y escritura de los managers sobre `BKOraStandIn`:
+
+- ``fetch_all`` / ``fetch_rows`` / ``fetch_models`` y la memoria de ``fetch_all`` frente a ``fetch_iter``.
+- La familia ``getlist*`` (``getlist``, ``getlist_iter``, ``getlist_numerated``, ``getlist_paginated``,
+  ``getlist_page``, ``getlist_range``, ``getlist_keyset``, ``getlist_parallel`` y ``getlist_columnar`` si
+  numpy está instalado), con recuento aparte y con ``count_over``.
+- ``insert_model`` en bucle frente a ``insert_many``.
+- Varias consultas independientes en serie frente a ``gather`` (útil con ``--latency-ms``).
+"""
+
+from benchmarks.standin import BenchManager, BenchModelDB, synthetic_row
+from benchmarks.timing import measure, peak_memory
+from collections import deque
+from functools import partial
+
+
+def bench_fetch(ctx) -> dict:
+    manager = BenchManager(ctx.connector)
+    sql, params = manager.get_sql_select()
+    rows = ctx.rows
+    return {
+        "fetch_all": measure(lambda: manager.fetch_all(sql, params), ctx.repeat, rows=rows),
+        "fetch_rows": measure(lambda: manager.fetch_rows(sql, params), ctx.repeat, rows=rows),
+        "fetch_models": measure(lambda: manager.fetch_models(sql, BenchModelDB, params), ctx.repeat, rows=rows),
+        "fetch_iter": measure(lambda: deque(manager.fetch_iter(sql, params), maxlen=0), ctx.repeat, rows=rows),
+    }
+
+
+def bench_fetch_memory(ctx) -> dict:
+    """Pico de memoria (``tracemalloc`` y RSS) de leer el resultado completo frente a recorrerlo en streaming."""
+    manager = BenchManager(ctx.connector)
+    sql, params = manager.get_sql_select()
+
+    def consume_all():
+        for _ in manager.fetch_all(sql, params):
+            pass
+
+    def consume_iter():
+        for _ in manager.fetch_iter(sql, params):
+            pass
+
+    _, fetch_all = peak_memory(consume_all)
+    _, fetch_iter = peak_memory(consume_iter)
+    return {
+        "rows": ctx.rows,
+        "fetch_all": fetch_all,
+        "fetch_iter": fetch_iter,
+        "peak_ratio": fetch_all["peak_bytes"] / fetch_iter["peak_bytes"] if fetch_iter["peak_bytes"] else None,
+        "rss_growth_saved_bytes": (fetch_all["rss_growth_bytes"] - fetch_iter["rss_growth_bytes"]
+                                   if fetch_all["rss_growth_bytes"] is not None else None),
+    }
+
+
+def bench_getlist(ctx) -> dict:
+    rows = ctx.rows
+    page = ctx.page_rows
+    manager = BenchManager(ctx.connector, rows_page=page)
+    result = {
+        "getlist": measure(manager.getlist, ctx.repeat, rows=rows),
+        "getlist_trusted": measure(BenchManager(ctx.connector, trusted_read=True).getlist, ctx.repeat, rows=rows),
+        "getlist_iter": measure(lambda: deque(manager.getlist_iter(), maxlen=0), ctx.repeat, rows=rows),
+    }
+
+    for count_over in (False, True):
+        suffix = "_count_over" if count_over else ""
+        middle = max(rows // 2 - page, 0)
+        result[f"getlist_numerated{suffix}"] = measure(
+            lambda: manager.getlist_numerated(count_over=count_over), ctx.repeat, rows=rows)
+        result[f"getlist_paginated{suffix}"] = measure(
+            lambda: manager.getlist_paginated(count_over=count_over), ctx.repeat, rows=rows)
+        result[f"getlist_page{suffix}"] = measure(
+            lambda: manager.getlist_page({"page_init": middle, "page_fin": page}, count_over=count_over)
+            , ctx.repeat, number=ctx.small_number, rows=page)
+        result[f"getlist_range{suffix}"] = measure(
+            lambda: manager.getlist_range((middle, page), count_over=count_over)
+            , ctx.repeat, number=ctx.small_number, rows=page)
+
+    # Página intermedia por keyset: se obtiene el cursor una vez y se mide solo la lectura
+    cursor = None
+    for _ in range(min(rows // page // 2, 50)):
+        cursor = manager.getlist_keyset(cursor)["cursor"]
+    result["getlist_keyset"] = measure(lambda: manager.getlist_keyset(cursor), ctx.repeat
+                                       , number=ctx.small_number, rows=page)
+
+    for strategy in ("hash", "range"):
+        result[f"getlist_parallel_{strategy}"] = measure(
+            lambda: deque(manager.getlist_parallel(strategy=strategy), maxlen=0), ctx.repeat, rows=rows)
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        result["getlist_columnar"] = None
+    else:
+        result["getlist_columnar"] = measure(manager.getlist_columnar, ctx.repeat, rows=rows)
+    return result
+
+
+def bench_insert(ctx) -> dict:
+    """``insert_model`` fila a fila frente a ``insert_many`` (executemany por lotes)."""
+    count = ctx.insert_rows
+    first_id = ctx.rows + 1
+    manager = BenchManager(ctx.connector)
+    models = BenchModelDB.from_rows(("id", "name", "amount", "grp", "note")
+                                    , (synthetic_row(index) for index in range(first_id, first_id + count)))
+
+    def insert_loop():
+        with manager.unit_of_work() as session:
+            for model in models:
+                manager.insert_model(model, session=session)
+
+    def reset():
+        ctx.connector.truncate(first_id)
+
+    result = {
+        "insert_model_loop": measure(insert_loop, ctx.repeat, setup=reset, rows=count),
+        "insert_many": measure(lambda: manager.insert_many(models), ctx.repeat, setup=reset, rows=count),
+    }
+    reset()
+    result["speedup"] = result["insert_model_loop"]["median_s"] / result["insert_many"]["median_s"]
+    return result
+
+
+def bench_gather(ctx) -> dict:
+    """Seis consultas independientes una tras otra frente a ``gather`` (una conexión del pool por consulta)."""
+    manager = BenchManager(ctx.connector, rows_page=ctx.page_rows)
+    jobs = [
+        ("SELECT COUNT(*) AS total FROM BENCH_ROWS", {}),
+        ("SELECT grp, SUM(amount) AS amount FROM BENCH_ROWS GROUP BY grp", {}),
+        ("SELECT id, name FROM BENCH_ROWS WHERE grp = :grp", {"grp": 7}),
+        ("SELECT MAX(id) AS last_id FROM BENCH_ROWS", {}),
+        manager.getlist_page,
+        partial(manager.getlist_range, (ctx.rows // 2, ctx.page_rows)),
+    ]
+
+    def serial():
+        for job in jobs:
+            job() if callable(job) else manager.fetch_all(*job)
+
+    result = {
+        "serial": measure(serial, ctx.repeat),
+        "gather": measure(lambda: manager.gather(jobs, raise_errors=True), ctx.repeat),
+    }
+    result["speedup"] = result["serial"]["median_s"] / result["gather"]["median_s"]
+    return result
+
+
+BENCHMARKS = {
+    "fetch": bench_fetch,
+    "fetch_memory": bench_fetch_memory,
+    "getlist": bench_getlist,
+    "insert": bench_insert,
+    "gather": bench_gather,
+}
@@ -0,0 +1,96 @@
+"""
+Módulo bench_model
+------------------
+
+Benchmarks de materialización de modelos, sin base de datos (filas sintéticas en memoria):
+
+- ``from_list`` de `BKOraModel`, `BKOraModelDB` y `BKOraModelComplex`, más los caminos por tuplas
+  (``from_rows`` / ``row_factory``), ``trusted`` y ``lazy()``.
+- Validación de `BKOraModelComplex`: ``from_list`` (una validación por celda) frente a
+  ``validate_list`` / ``from_list_batch`` (por columnas) y a `BKOraProcessPool` (por lotes en varios procesos).
+- Memoria por fila de las instancias normales frente a las compactas (``compact()``).
+"""
+
+from benchmarks.standin import BenchModel, BenchModelDB, BenchModelComplex, synthetic_row
+from benchmarks.timing import measure, peak_memory
+from BKLibOra.BKOraManager.BKOraProcessPool import BKOraProcessPool
+
+KEYS = ("id", "name", "amount", "grp", "note")
+
+
+def _dataset(count: int) -> tuple:
+    rows = [synthetic_row(index) for index in range(1, count + 1)]
+    return rows, [dict(zip(KEYS, row)) for row in rows]
+
+
+def bench_from_list(ctx) -> dict:
+    count = ctx.model_rows
+    rows, dicts = _dataset(count)
+    lazy = BenchModelComplex.lazy()
+    return {
+        "model.from_list": measure(lambda: BenchModel.from_list(dicts), ctx.repeat, rows=count),
+        "model_db.from_list": measure(lambda: BenchModelDB.from_list(dicts), ctx.repeat, rows=count),
+        "model_db.from_rows": measure(lambda: BenchModelDB.from_rows(KEYS, rows), ctx.repeat, rows=count),
+        "model_complex.from_list": measure(lambda: BenchModelComplex.from_list(dicts), ctx.repeat, rows=count),
+        "model_complex.from_list_trusted": measure(lambda: BenchModelComplex.from_list(dicts, trusted=True)
+                                                   , ctx.repeat, rows=count),
+        "model_complex.lazy.from_list": measure(lambda: lazy.from_list(dicts), ctx.repeat, rows=count),
+    }
+
+
+def bench_validation(ctx) -> dict:
+    count = ctx.model_rows
+    rows, dicts = _dataset(count)
+    invalid = [dict(item, grp=-1) if index % 10 == 0 else item for index, item in enumerate(dicts)]
+    result = {
+        "from_list": measure(lambda: BenchModelComplex.from_list(dicts), ctx.repeat, rows=count),
+        "validate_list": measure(lambda: BenchModelComplex.validate_list(dicts), ctx.repeat, rows=count),
+        "validate_list_10pct_invalid": measure(lambda: BenchModelComplex.validate_list(invalid)
+                                               , ctx.repeat, rows=count),
+        "from_list_batch": measure(lambda: BenchModelComplex.from_list_batch(dicts), ctx.repeat, rows=count),
+        "from_list_batch_compact": measure(lambda: BenchModelComplex.from_list_batch(dicts, compact=True)
+                                           , ctx.repeat, rows=count),
+        "from_list_batch_skip_invalid": measure(lambda: BenchModelComplex.from_list_batch(invalid, skip_invalid=True)
+                                                , ctx.repeat, rows=count),
+    }
+    with BKOraProcessPool(min_rows=0) as pool:
+        # Arranque de los procesos fuera de la medida
+        pool.materialize(BenchModelComplex, KEYS, rows[:1])
+        result["process_pool"] = measure(lambda: pool.materialize(BenchModelComplex, KEYS, rows), ctx.repeat
+                                         , rows=count)
+        result["process_pool"]["workers"] = pool.workers
+    return result
+
+
+def bench_compact_memory(ctx) -> dict:
+    """Memoria retenida por fila (y crecimiento del pico de RSS) de las instancias normales frente a las compactas."""
+    count = ctx.model_rows
+    rows, dicts = _dataset(count)
+    variants = {
+        "model": (lambda: BenchModel.from_list(dicts)
+                  , lambda: BenchModel.compact(KEYS).from_rows(KEYS, rows)),
+        "model_db": (lambda: BenchModelDB.from_rows(KEYS, rows)
+                     , lambda: BenchModelDB.compact().from_rows(KEYS, rows)),
+        "model_complex": (lambda: BenchModelComplex.from_list(dicts)
+                          , lambda: BenchModelComplex.from_list_batch(dicts, compact=True)),
+    }
+    result = {"rows": count}
+    for name, (normal, compact) in variants.items():
+        # Las filas de entrada ya existen: solo cuenta lo que añaden las instancias
+        _, normal_memory = peak_memory(normal)
+        _, compact_memory = peak_memory(compact)
+        result[name] = {
+            "normal_bytes_per_row": normal_memory["retained_bytes"] / count,
+            "compact_bytes_per_row": compact_memory["retained_bytes"] / count,
+            "ratio": normal_memory["retained_bytes"] / compact_memory["retained_bytes"],
+            "normal_rss_growth_bytes": normal_memory["rss_growth_bytes"],
+            "compact_rss_growth_bytes": compact_memory["rss_growth_bytes"],
+        }
+    return result
+
+
+BENCHMARKS = {
+    "from_list": bench_from_list,
+    "validation": bench_validation,
+    "compact_memory": bench_compact_memory,
+}
@@ -0,0 +1,69 @@
+"""
+Módulo bench_query
+------------------
+
+Benchmarks de `BKOraQueryBuilder.build` por tipo de filtro y estrategia IN, sin caché y a través de
+`BKOraStatementCache.build_query` (misma forma de consulta con valores distintos en cada llamada).
+"""
+
+from BKLibOra.BKOraManager.BKOraQueryBuilder import BKOraQueryBuilder
+from BKLibOra.BKOraManager.BKOraStatementCache import BKOraStatementCache
+from benchmarks.timing import measure
+from itertools import count
+
+BASE_SQL = "SELECT id, name, amount, grp, note FROM BENCH_ROWS WHERE 1 = 1"
+
+
+def _scalar(offset):
+    filters = [{"column": "grp", "condition": {"operator": "equal"}}
+               , {"column": "name", "condition": {"operator": "like", "function": "upper"}}]
+    return filters, [{"grp": offset % 97}, {"name": f"NAME_{offset}%"}]
+
+
+def _between(offset):
+    filters = [{"column": "amount", "condition": {"operator": "between"}}]
+    return filters, [{"amount": offset}, {"amount": offset + 100}]
+
+
+def _in_list(size):
+    def build(offset):
+        filters = [{"column": "id", "condition": {"operator": "in"}}]
+        return filters, [{"id": offset + index} for index in range(size)]
+    return build
+
+
+SHAPES = {
+    "scalar": _scalar,
+    "between": _between,
+    "in_10": _in_list(10),
+    "in_100": _in_list(100),
+    "in_2500": _in_list(2500),
+}
+
+
+def bench_build(ctx) -> dict:
+    number = ctx.small_number
+    result = {}
+    for shape, make in SHAPES.items():
+        strategies = ("expand", "bucket", "chunk", "array") if shape.startswith("in_") else ("expand",)
+        for strategy in strategies:
+            offsets = count()
+
+            def build():
+                filters, values = make(next(offsets))
+                return BKOraQueryBuilder(BASE_SQL, filters, values, in_strategy=strategy).build()
+
+            cache = BKOraStatementCache()
+
+            def build_cached():
+                filters, values = make(next(offsets))
+                return cache.build_query(BKOraQueryBuilder(BASE_SQL, filters, values, in_strategy=strategy))
+
+            result[f"{shape}.{strategy}"] = measure(build, ctx.repeat, number=number)
+            result[f"{shape}.{strategy}.cached"] = measure(build_cached, ctx.repeat, number=number)
+    return result
+
+
+BENCHMARKS = {
+    "query_builder": bench_build,
+}
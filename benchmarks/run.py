@@ -0,0 +1,162 @@
+"""
+Módulo run
+----------
+
+Ejecuta la suite de benchmarks y emite los resultados en JSON.
+
+Uso (desde la raíz del repositorio)::
+
+    python -m benchmarks.run                          # suite completa, JSON por la salida estándar
+    python -m benchmarks.run --quick -o bench.json    # tamaños reducidos, a fichero
+    python -m benchmarks.run --only getlist,insert --latency-ms 0.5
+    python -m benchmarks.run --compare baseline.json  # marca regresiones respecto a una ejecución anterior
+
+No necesita Oracle: las consultas se ejecutan contra `BKOraStandIn` (SQLite por el mismo camino de
+SQLAlchemy). Los tiempos absolutos no son comparables con Oracle; sirven para comparar versiones de la
+librería en la misma máquina.
+"""
+
+from benchmarks import bench_manager, bench_model, bench_query
+from benchmarks.standin import BKOraStandIn
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+SUITES = {**bench_manager.BENCHMARKS, **bench_query.BENCHMARKS, **bench_model.BENCHMARKS}
+DATABASE_SUITES = set(bench_manager.BENCHMARKS)
+
+
+class BenchContext:
+    """
+    Parámetros de una ejecución, compartidos por todos los benchmarks.
+
+    Args:
+        connector (BKOraStandIn | None): Conector de la base de datos local.
+        rows (int): Filas de la tabla de pruebas.
+        model_rows (int): Filas de los benchmarks de modelos.
+        insert_rows (int): Filas de los benchmarks de escritura.
+        page_rows (int): Filas por página de los ``getlist*`` paginados.
+        repeat (int): Repeticiones de cada medida.
+        small_number (int): Llamadas por repetición de las operaciones cortas.
+    """
+    def __init__(self, connector, rows, model_rows, insert_rows, page_rows, repeat, small_number):
+        self.connector = connector
+        self.rows = rows
+        self.model_rows = model_rows
+        self.insert_rows = insert_rows
+        self.page_rows = page_rows
+        self.repeat = repeat
+        self.small_number = small_number
+
+
+def environment() -> dict:
+    import sqlalchemy
+    try:
+        from importlib.metadata import version
+        library = version("BKLibOra")
+    except Exception:
+        library = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "bklibora": library,
+    }
+
+
+def _timings(result, prefix=""):
+    """Recorre ``result`` y devuelve ``{ruta: median_s}`` de cada medida de tiempo."""
+    found = {}
+    if isinstance(result, dict):
+        if "median_s" in result:
+            found[prefix] = result["median_s"]
+        else:
+            for key, value in result.items():
+                found.update(_timings(value, f"{prefix}.{key}" if prefix else key))
+    return found
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compara las medianas de ``current`` con las de ``baseline``.
+
+    Returns:
+        list[dict]: Medidas más lentas que ``baseline`` por encima de ``threshold`` (``0.1`` = 10 %),
+        con ``name``, ``baseline_s``, ``current_s`` y ``ratio``.
+    """
+    old = _timings(baseline.get("results", {}))
+    regressions = []
+    for name, value in _timings(current.get("results", {})).items():
+        reference = old.get(name)
+        if reference and value > reference * (1 + threshold):
+            regressions.append({"name": name, "baseline_s": reference, "current_s": value
+                                , "ratio": value / reference})
+    return sorted(regressions, key=lambda item: item["ratio"], reverse=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="Benchmarks de BKLibOra.")
+    parser.add_argument("--only", help=f"Suites separadas por comas: {', '.join(SUITES)}.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Filas de la tabla de pruebas.")
+    parser.add_argument("--model-rows", type=int, default=20_000, help="Filas de los benchmarks de modelos.")
+    parser.add_argument("--insert-rows", type=int, default=2_000, help="Filas de los benchmarks de escritura.")
+    parser.add_argument("--page-rows", type=int, default=50, help="Filas por página.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones de cada medida.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Round-trip simulado por ejecución.")
+    parser.add_argument("--quick", action="store_true", help="Tamaños reducidos (comprobación rápida).")
+    parser.add_argument("-o", "--output", help="Fichero JSON de salida (por defecto la salida estándar).")
+    parser.add_argument("--compare", help="JSON de una ejecución anterior con el que comparar.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Margen de regresión (0.10 = 10 %%).")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.rows, args.model_rows, args.insert_rows, args.repeat = 5_000, 2_000, 200, 3
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    names = args.only.split(",") if args.only else list(SUITES)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        raise ValueError(f"Suites desconocidas: {', '.join(unknown)}; use {', '.join(SUITES)}.")
+
+    connector = None
+    if DATABASE_SUITES.intersection(names):
+        connector = BKOraStandIn(args.rows, latency_ms=args.latency_ms)
+    ctx = BenchContext(connector, args.rows, args.model_rows, args.insert_rows, args.page_rows
+                       , args.repeat, small_number=20 if args.quick else 100)
+
+    results = {}
+    try:
+        for name in names:
+            print(f"[bench] {name}...", file=sys.stderr, flush=True)
+            results[name] = SUITES[name](ctx)
+    finally:
+        if connector is not None:
+            connector.dispose()
+
+    report = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "results": results,
+    }
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            report["regressions"] = compare(report, json.load(handle), args.threshold)
+
+    data = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(data + "\n")
+    else:
+        print(data)
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Módulo standin
+--------------
+
+Base de datos local que sustituye a Oracle en los benchmarks.
+
+`BKOraStandIn` expone la misma interfaz que `BKOraConnect` que usan los managers (``get_session()``,
+``engine`` y ``pool_stats``) sobre un fichero SQLite temporal, de modo que las consultas recorren el
+mismo camino de SQLAlchemy (sesión, ``text()``, listeners del motor, ``stream_results``…).
+
+Las diferencias de dialecto se resuelven en un listener ``before_cursor_execute``: la paginación
+``OFFSET n ROWS FETCH NEXT m ROWS ONLY`` / ``FETCH FIRST n ROWS ONLY`` se reescribe como ``LIMIT``,
+``ORDER BY ROWNUM`` se omite (SQLite conserva el orden de la sub-consulta) y los alias ``COUNTER`` /
+``BK_TOTAL_ROWS`` se devuelven en minúsculas, como hace Oracle. Con ``latency_ms`` cada ejecución espera ese tiempo para simular el round-trip de red.
+
+Clases:
+    BKOraStandIn
+    BenchModel, BenchModelDB, BenchModelComplex
+    BenchManager
+"""
+
+from BKLibOra.BKOraConnect.BKOraConnect import _apply_cursor_options
+from BKLibOra.BKOraConnect.BKOraPool import BKOraPoolStats, BKOraQueuePool
+from BKLibOra.BKOraManager.BKOraManagerDB import BKOraManagerDB
+from BKLibOra.BKOraModel.BKOraModel import BKOraModel
+from BKLibOra.BKOraModel.BKOraModelDB import BKOraModelDB
+from BKLibOra.BKOraModel.BKOraModelComplex import BKOraModelComplex
+from BKLibOra.BKOraModel.BKOraColums import BKOraColumn
+from BKLibOra.BKOraModel.BKOraDataType import BKString, BKNumber, BKFloat
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+import os
+import re
+import tempfile
+import time
+
+_OFFSET = re.compile(r"OFFSET\s+(\d+)\s+ROWS\s+FETCH\s+NEXT\s+(\d+)\s+ROWS\s+ONLY", re.I)
+_FIRST = re.compile(r"FETCH\s+FIRST\s+(\d+)\s+ROWS\s+ONLY", re.I)
+_ROWNUM = re.compile(r"ORDER\s+BY\s+ROWNUM\b", re.I)
+_ALIASES = re.compile(r"\bAS\s+(COUNTER|BK_TOTAL_ROWS)\b")
+
+
+def translate(sql: str) -> str:
+    """Reescribe la sintaxis de Oracle que usa la librería a su equivalente en SQLite."""
+    sql = _OFFSET.sub(lambda m: f"LIMIT {m.group(2)} OFFSET {m.group(1)}", sql)
+    sql = _FIRST.sub(lambda m: f"LIMIT {m.group(1)}", sql)
+    sql = _ROWNUM.sub("", sql)
+    return _ALIASES.sub(lambda m: f"AS {m.group(1).lower()}", sql)
+
+
+def _register_functions(dbapi_connection, connection_record):
+    """Registra en cada conexión las funciones de Oracle que usa la librería (``ORA_HASH``)."""
+    # Como en Oracle, ORA_HASH(NULL, n) es NULL
+    dbapi_connection.create_function("ORA_HASH", 2, lambda value, buckets: None if value is None
+                                     else hash(value) % (buckets + 1), deterministic=True)
+
+
+def synthetic_row(index: int) -> tuple:
+    """Fila sintética ``(id, name, amount, grp, note)`` determinista para ``index``."""
+    return index, f"name_{index:08d}", round(index * 1.25, 2), index % 97, f"note {index % 1000:04d} " * 4
+
+
+class BKOraStandIn:
+    """
+    Conector de benchmarks sobre SQLite con la interfaz de `BKOraConnect`.
+
+    La tabla ``BENCH_ROWS (id, name, amount, grp, note)`` se crea con ``rows`` filas sintéticas.
+
+    Args:
+        rows (int): Filas de la tabla de pruebas.
+        latency_ms (float, optional): Espera por ejecución (round-trip simulado). ``0`` no espera.
+        pool_size (int, optional): Conexiones del pool (`BKOraQueuePool`).
+        path (str, optional): Fichero SQLite. Por defecto un fichero temporal que se borra en ``dispose()``.
+    """
+
+    TABLE = "BENCH_ROWS"
+
+    def __init__(self, rows: int, latency_ms: float = 0.0, pool_size: int = 5, path: str | None = None):
+        self._own_path = path is None
+        if path is None:
+            handle, path = tempfile.mkstemp(prefix="bklibora_bench_", suffix=".sqlite")
+            os.close(handle)
+        self.path = path
+        self.rows = rows
+        self.latency = latency_ms / 1000.0
+        self.pool_stats = BKOraPoolStats()
+        self.engine = create_engine(f"sqlite:///{path}", poolclass=BKOraQueuePool, pool_size=pool_size
+                                    , max_overflow=0, connect_args={"check_same_thread": False})
+        self.engine.pool._bk_stats = self.pool_stats
+        event.listen(self.engine, "before_cursor_execute", _apply_cursor_options)
+        event.listen(self.engine, "before_cursor_execute", self._before_execute, retval=True)
+        event.listen(self.engine, "connect", _register_functions)
+        self.Session = sessionmaker(bind=self.engine)
+        self._create(rows)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.latency:
+            time.sleep(self.latency)
+        return translate(statement), parameters
+
+    def _create(self, rows: int):
+        raw = self.engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            cursor.execute(f"DROP TABLE IF EXISTS {self.TABLE}")
+            cursor.execute(f"CREATE TABLE {self.TABLE} (id INTEGER PRIMARY KEY, name TEXT, amount REAL"
+                           ", grp INTEGER, note TEXT)")
+            cursor.executemany(f"INSERT INTO {self.TABLE} VALUES (?, ?, ?, ?, ?)"
+                               , (synthetic_row(index) for index in range(1, rows + 1)))
+            cursor.execute(f"CREATE INDEX {self.TABLE}_GRP ON {self.TABLE} (GRP)")
+            raw.commit()
+        finally:
+            raw.close()
+
+    def truncate(self, first_id: int):
+        """Elimina las filas con ``ID >= first_id`` (las añadidas por los benchmarks de escritura)."""
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(f"DELETE FROM {self.TABLE} WHERE ID >= ?", (first_id,))
+
+    def get_session(self):
+        return self.Session()
+
+    def dispose(self):
+        self.engine.dispose()
+        if self._own_path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class BenchModel(BKOraModel):
+    pass
+
+
+class BenchModelDB(BKOraModelDB):
+    id = BKOraColumn(name="id", type_=int, primary_key=True)
+    name = BKOraColumn(name="name", type_=str)
+    amount = BKOraColumn(name="amount", type_=float)
+    grp = BKOraColumn(name="grp", type_=int)
+    note = BKOraColumn(name="note", type_=str)
+
+
+class BenchModelComplex(BKOraModelComplex):
+    id = BKNumber("id", large=10, primary_key=True)
+    name = BKString("name", large=40)
+    amount = BKFloat("amount", precision=12, scale=2)
+    grp = BKNumber("grp", large=3, min_value=0)
+    note = BKString("note", large=200)
+
+
+class BenchManager(BKOraManagerDB):
+    """
+    Manager de la tabla ``BENCH_ROWS``.
+
+    Args:
+        connector (BKOraStandIn): Conector de benchmarks.
+        model (object, optional): Modelo de las filas. Por defecto `BenchModelDB`.
+        limit (int, optional): Acota la consulta a los ``ID <= limit``.
+        kwargs (dict): Opciones de `BKOraManagerDB`.
+    """
+    def __init__(self, connector, model=BenchModelDB, limit=None, **kwargs):
+        super().__init__(connector=connector, model=model, **kwargs)
+        self.limit = limit
+
+    def get_sql_select(self):
+        # SQLite devuelve los nombres de columna tal como se declaran en la tabla (en minúsculas, como el modelo)
+        sql = "SELECT id, name, amount, grp, note FROM BENCH_ROWS"
+        if self.limit is None:
+            return f"{sql} ORDER BY id", {}
+        return f"{sql} WHERE id <= :limit ORDER BY id", {"limit": self.limit}
+
+    def get_sql_insert(self):
+        return "INSERT INTO BENCH_ROWS (ID, NAME, AMOUNT, GRP, NOTE) VALUES (:id, :name, :amount, :grp, :note)", {}
+
+    def get_sql_update(self):
+        return "UPDATE BENCH_ROWS SET NAME = :name, AMOUNT = :amount, GRP = :grp, NOTE = :note WHERE ID = :id", {}
+
+    def get_sql_delete(self):
+        return "DELETE FROM BENCH_ROWS WHERE ID = :id", {}
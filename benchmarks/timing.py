@@ -0,0 +1,152 @@
+"""
+Módulo timing
+-------------
+
+Medición de tiempo y memoria de los benchmarks.
+
+La memoria se mide de dos formas: ``tracemalloc`` cuenta los bytes que reserva Python (objetos y
+buffers) y el pico de RSS (``VmHWM`` de ``/proc/self/status`` o ``resource.getrusage().ru_maxrss``)
+incluye además lo que reservan el driver, SQLite o NumPy fuera del asignador de Python.
+
+Funciones:
+    measure(func, repeat, number, setup)
+    peak_rss(func)
+    peak_memory(func)
+"""
+
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def measure(func, repeat: int = 5, number: int = 1, setup=None, rows: int | None = None) -> dict:
+    """
+    Ejecuta ``func`` ``number`` veces por repetición y resume las ``repeat`` repeticiones.
+
+    El recolector de basura se desactiva durante cada repetición, como en ``timeit``.
+
+    Args:
+        func (Callable[[], Any]): Operación a medir.
+        repeat (int): Repeticiones.
+        number (int): Llamadas por repetición.
+        setup (Callable[[], Any], optional): Se ejecuta antes de cada repetición, fuera de la medida.
+        rows (int, optional): Filas procesadas por llamada; añade ``rows_per_s``.
+
+    Returns:
+        dict: ``median_s``, ``min_s``, ``max_s`` y ``stdev_s`` por llamada, ``repeat``, ``number``
+        y, si se indica ``rows``, ``rows`` y ``rows_per_s`` (sobre la mediana).
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            time_init = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - time_init) / number)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    median = statistics.median(samples)
+    result = {
+        "median_s": median,
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+    if rows is not None:
+        result["rows"] = rows
+        result["rows_per_s"] = rows / median if median else None
+    return result
+
+
+def _status_bytes(field: str) -> int | None:
+    """Valor en bytes de un campo ``kB`` de ``/proc/self/status`` (``VmRSS``, ``VmHWM``); ``None`` si no existe."""
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _max_rss() -> int | None:
+    """Pico de RSS del proceso en bytes (``ru_maxrss`` está en KiB en Linux y en bytes en macOS)."""
+    peak = _status_bytes("VmHWM")
+    if peak is not None or resource is None:
+        return peak
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+def _reset_max_rss() -> bool:
+    """Reinicia el pico de RSS del proceso (Linux >= 4.0); ``False`` si el sistema no lo permite."""
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss(func) -> tuple:
+    """
+    Ejecuta ``func`` una vez midiendo el pico de RSS (memoria residente) del proceso.
+
+    El pico de RSS es un máximo de todo el proceso: donde se puede reiniciar (Linux) se reinicia antes
+    de la llamada; en otro caso ``rss_peak_bytes`` es el máximo desde el arranque y ``rss_growth_bytes``
+    solo refleja lo que la llamada lo supera.
+
+    Returns:
+        tuple[Any, dict]: Resultado de ``func`` y ``{"rss_peak_bytes", "rss_growth_bytes", "rss_peak_reset"}``
+        (pico de RSS, crecimiento del pico sobre el RSS previo a la llamada y si el pico se pudo reiniciar).
+        Los valores son ``None`` si el sistema no ofrece el RSS.
+    """
+    gc.collect()
+    reset = _reset_max_rss()
+    base = _status_bytes("VmRSS") if reset else _max_rss()
+    result = func()
+    peak = _max_rss()
+    growth = peak - base if peak is not None and base is not None else None
+    return result, {"rss_peak_bytes": peak, "rss_growth_bytes": growth, "rss_peak_reset": reset}
+
+
+def peak_memory(func) -> tuple:
+    """
+    Ejecuta ``func`` midiendo el pico de RSS (ver `peak_rss`) y, en una segunda llamada, la memoria
+    Python reservada con ``tracemalloc``.
+
+    Las dos medidas se toman en llamadas distintas porque ``tracemalloc`` guarda una traza por bloque
+    reservado, que inflaría el RSS.
+
+    Returns:
+        tuple[Any, dict]: Resultado de la segunda llamada y ``{"peak_bytes", "retained_bytes"}`` (pico
+        de ``tracemalloc`` durante la llamada y memoria que sigue reservada al terminar, incluido el
+        resultado) junto con los campos ``rss_*`` de `peak_rss`.
+    """
+    _, rss = peak_rss(func)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, {"peak_bytes": peak - base, "retained_bytes": current - base, **rss}
@@ -38,6 +38,10 @@ setup(
         # "setuptools==78.1.0",
         "typing_extensions>=4.13.2",
     ],
+    extras_require={
+        "columnar": ["numpy>=1.24"],  # Resultados columnares (fetch_columnar / getlist_columnar)
+        "validation": ["numpy>=1.24"],  # Validación por lotes (BKOraBatchValidator)
+    },
     include_package_data=True,  # Incluye archivos adicionales en MANIFEST.in
     project_urls={
         "Source": "https://github.com/theleerise/BKLibOra.git",